@@ -8,10 +8,245 @@ MD dosyalarını PDF'e çeviren program
 import os
 import sys
 import argparse
+import hashlib
+import html
+import io
+import json
+import logging
+import re
+import shutil
+import tempfile
+import threading
+import time
+import cProfile
+import tracemalloc
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager, nullcontext
 from pathlib import Path
-import markdown
-from weasyprint import HTML, CSS
-from weasyprint.text.fonts import FontConfiguration
+from urllib.parse import unquote, urljoin, urlsplit
+
+# Not: markdown ve weasyprint (Pango/cairo ile birlikte) import edilmesi pahalı
+# olduğundan sadece dönüştürme başladığında import edilir. Böylece --help,
+# argüman hataları ve GUI penceresinin açılması bu maliyeti ödemez.
+
+__version__ = '1.0.0'
+
+# PDF önbelleğinin varsayılan boyut sınırı (MB)
+DEFAULT_CACHE_SIZE_MB = 500
+
+
+def warm_up():
+    """
+    Dönüştürme için gereken ağır modülleri önceden import eder
+    
+    GUI gibi uzun süre açık kalan arayüzler bunu arka plan thread'inde
+    çağırarak ilk dönüştürmedeki bekleme süresini gizleyebilir.
+    """
+    import markdown  # noqa: F401
+    import pygments  # noqa: F401
+    import weasyprint  # noqa: F401
+    from weasyprint.text.fonts import FontConfiguration  # noqa: F401
+
+
+# Fontları ısıtmak için kullanılan örnek metin (Türkçe karakterler ve emoji dahil)
+FONT_SAMPLE_TEXT = 'Aa Çç Ğğ İı Öö Şş Üü 0123456789 — “…” ✓ 😀'
+
+
+class FontRegistry:
+    """
+    Process genelinde paylaşılan font yapılandırması
+    
+    WeasyPrint her FontConfiguration için fontları yeniden arar ve yükler.
+    Kayıt tek bir FontConfiguration'ı tüm Converter'lar arasında paylaşır,
+    böylece bir kez bulunan ve yüklenen fontlar sonraki belgelerde tekrar
+    kullanılır. @font-face içeren CSS'ler kendi fontlarını tanımladığından
+    (ve başka CSS'lerin belgelerine sızmaması için) CSS metni başına ayrı
+    bir FontConfiguration alır. Paylaşılan yapılandırma aynı anda tek bir
+    thread'den kullanılmalıdır.
+    """
+    
+    # @font-face içeren CSS'ler için tutulacak en fazla FontConfiguration sayısı
+    MAX_FONT_FACE_CONFIGS = 16
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._font_config = None
+        self._font_face_configs = OrderedDict()
+        self._warmed = set()
+    
+    @property
+    def font_config(self):
+        """Paylaşılan FontConfiguration (ilk kullanımda oluşturulur)"""
+        with self._lock:
+            if self._font_config is None:
+                from weasyprint.text.fonts import FontConfiguration
+                self._font_config = FontConfiguration()
+            return self._font_config
+    
+    def font_config_for(self, css):
+        """CSS için kullanılacak FontConfiguration'ı döndürür"""
+        if '@font-face' not in css:
+            return self.font_config
+        from weasyprint.text.fonts import FontConfiguration
+        
+        key = hashlib.sha256(css.encode('utf-8')).hexdigest()
+        with self._lock:
+            font_config = self._font_face_configs.get(key)
+            if font_config is None:
+                font_config = FontConfiguration()
+                self._font_face_configs[key] = font_config
+                if len(self._font_face_configs) > self.MAX_FONT_FACE_CONFIGS:
+                    self._font_face_configs.popitem(last=False)
+            else:
+                self._font_face_configs.move_to_end(key)
+            return font_config
+    
+    def warm(self, css=None, families=()):
+        """
+        CSS'in ve verilen font ailelerinin fontlarını önceden yükler
+        
+        Küçük bir örnek belge yerleştirilerek gövde, kod ve emoji fontları
+        aranır ve yüklenir; daha önce ısıtılmış CSS ve aileler atlanır.
+        
+        Args:
+            css: Isıtılacak CSS (None ise varsayılan CSS)
+            families: Ayrıca yüklenecek font aileleri (ör. ['DejaVu Sans'])
+        """
+        from weasyprint import HTML
+        
+        css = get_default_css() if css is None else css
+        pending = [family for family in families if family not in self._warmed]
+        css_key = hashlib.sha256(css.encode('utf-8')).hexdigest()
+        if css_key in self._warmed and not pending:
+            return
+        
+        sample = html.escape(FONT_SAMPLE_TEXT)
+        paragraphs = ''.join(
+            f'<p style="font-family: {html.escape(_css_string(family))}">{sample}</p>'
+            for family in pending
+        )
+        document = (
+            f'<h1>{sample}</h1><p>{sample} <strong>{sample}</strong> <em>{sample}</em></p>'
+            f'<p><code>{sample}</code></p><pre><code>{sample}</code></pre>'
+            f'<p><span class="emoji">😀</span></p>{paragraphs}'
+        )
+        font_config = self.font_config_for(css)
+        stylesheet = stylesheet_registry().get(css, font_config=font_config)
+        HTML(string=document).render(stylesheets=[stylesheet], font_config=font_config)
+        self._warmed.add(css_key)
+        self._warmed.update(pending)
+    
+    def clear(self):
+        """
+        Paylaşılan FontConfiguration'ları bırakır; sonraki Converter'lar
+        fontları baştan arar ve yükler (ör. ölçümlerde soğuk başlangıç için)
+        """
+        with self._lock:
+            self._font_config = None
+            self._font_face_configs.clear()
+            self._warmed.clear()
+
+
+def _css_string(value):
+    """Bir değeri tırnaklı CSS string'ine çevirir"""
+    return '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+_font_registry = None
+
+
+def font_registry():
+    """Process genelinde paylaşılan FontRegistry'yi döndürür"""
+    global _font_registry
+    if _font_registry is None:
+        _font_registry = FontRegistry()
+    return _font_registry
+
+
+def warm_fonts(css=None, families=()):
+    """Paylaşılan font kaydını CSS ve verilen font aileleri için ısıtır"""
+    font_registry().warm(css, families)
+
+
+# Ayrıştırılmış stylesheet önbelleğinin varsayılan kayıt sayısı
+DEFAULT_STYLESHEET_CACHE_SIZE = 64
+
+
+class StylesheetRegistry:
+    """
+    Ayrıştırılmış WeasyPrint CSS nesneleri için process genelinde LRU önbellek
+    
+    CSS nesneleri metnin sha256 hash'i, base_url, FontConfiguration ve
+    url_fetcher ile anahtarlanır; böylece aynı temayı kullanan Converter'lar
+    (tek seferlik convert_md_to_pdf çağrıları, sunucudaki CSS başına
+    Converter'lar, önizleme) temayı bir kez ayrıştırır. @font-face kuralları
+    ayrıştırma sırasında font yapılandırmasına eklendiğinden aynı metin her
+    FontConfiguration için ayrı tutulur. Bir belge birden fazla katmanla
+    (ortak tema ve küçük ekler) render edildiğinde her katman ayrı kayıttır,
+    ek değiştiğinde tema yeniden ayrıştırılmaz.
+    """
+    
+    def __init__(self, max_entries=DEFAULT_STYLESHEET_CACHE_SIZE):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, css, base_url=None, font_config=None, url_fetcher=None, fetcher_key=None):
+        """
+        CSS metnine ait ayrıştırılmış CSS nesnesini döndürür, gerekirse ayrıştırır
+        
+        Args:
+            css: CSS metni
+            base_url: Göreli url()'lerin çözümleneceği URL
+            font_config: @font-face kurallarının ekleneceği FontConfiguration
+            url_fetcher: @import ve font dosyalarını indiren fetcher
+            fetcher_key: Aynı sonucu veren farklı url_fetcher örneklerini
+                eşleştiren anahtar (None ise url_fetcher örneğinin kendisi)
+        """
+        if url_fetcher is None:
+            fetcher_key = None
+        elif fetcher_key is None:
+            fetcher_key = id(url_fetcher)
+        key = (
+            hashlib.sha256(css.encode('utf-8')).hexdigest(),
+            base_url,
+            id(font_config) if font_config is not None else None,
+            fetcher_key,
+        )
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+        
+        from weasyprint import CSS
+        stylesheet = CSS(string=css, base_url=base_url, font_config=font_config, url_fetcher=url_fetcher)
+        with self._lock:
+            # Anahtardaki id()'ler geçerli kalsın diye nesneler kayıtla birlikte tutulur
+            self._entries[key] = (stylesheet, font_config, url_fetcher)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return stylesheet
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+_stylesheet_registry = None
+
+
+def stylesheet_registry():
+    """Process genelinde paylaşılan StylesheetRegistry'yi döndürür"""
+    global _stylesheet_registry
+    if _stylesheet_registry is None:
+        _stylesheet_registry = StylesheetRegistry()
+    return _stylesheet_registry
 
 
 def get_default_css():
@@ -180,152 +415,2630 @@ def get_default_css():
     """
 
 
-def convert_md_to_pdf(md_file_path, output_path=None, css_file_path=None, css_string=None):
-    """
-    Markdown dosyasını PDF'e çevirir
-    
-    Args:
-        md_file_path: Markdown dosyasının yolu
-        output_path: Çıktı PDF dosyasının yolu (None ise otomatik oluşturulur)
-        css_file_path: Custom CSS dosyasının yolu (opsiyonel)
-        css_string: CSS kodunu string olarak (opsiyonel, css_file_path'ten önceliklidir)
-    """
-    md_path = Path(md_file_path)
-    
-    if not md_path.exists():
-        raise FileNotFoundError(f"Markdown dosyası bulunamadı: {md_file_path}")
-    
-    # Çıktı dosyası yolu belirlenir
-    if output_path is None:
-        output_path = md_path.with_suffix('.pdf')
-    else:
-        output_path = Path(output_path)
-    
-    # Markdown dosyasını oku
-    try:
-        with open(md_path, 'r', encoding='utf-8') as f:
-            md_content = f.read()
-    except Exception as e:
-        raise IOError(f"Markdown dosyası okunamadı: {e}")
-    
-    # Markdown'ı HTML'e çevir
-    # Emoji ve diğer özellikler için extension'lar ekle
-    extensions = [
+# Markdown'ı HTML'e çevirirken kullanılan extension profilleri
+# ('extra' tables, fenced_code, footnotes, attr_list vb. extension'ları zaten içerir)
+EXTENSION_PROFILES = {
+    # Kod renklendirme ve başlık id'leriyle tam çıktı
+    'full': [
         'extra',           # Tables, fenced code blocks, etc.
         'codehilite',      # Syntax highlighting
-        'tables',          # Table support
         'nl2br',           # Newline to break
         'sane_lists',      # Better list handling
         'toc',             # Table of contents
-        'fenced_code',     # Fenced code blocks
-    ]
-    
-    md = markdown.Markdown(extensions=extensions)
-    html_content = md.convert(md_content)
+    ],
+    # Toplu iç belgeler için: kod renklendirme ve başlık id'leri yok
+    'fast': [
+        'extra',
+        'nl2br',
+        'sane_lists',
+    ],
+}
+DEFAULT_EXTENSION_PROFILE = 'full'
+DEFAULT_EXTENSIONS = EXTENSION_PROFILES[DEFAULT_EXTENSION_PROFILE]
+
+
+def resolve_extensions(extensions=None):
+    """
+    Extension listesini veya EXTENSION_PROFILES'teki bir profil adını
+    extension listesine çevirir (None veya boşsa DEFAULT_EXTENSIONS)
     
-    # HTML wrapper ekle (emoji desteği için meta tag'ler)
-    html_wrapper = f"""<!DOCTYPE html>
-<html lang="tr">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{md_path.stem}</title>
-</head>
-<body>
-{html_content}
-</body>
-</html>"""
+    Raises:
+        ValueError: Profil adı bilinmiyorsa
+    """
+    if not extensions:
+        return list(DEFAULT_EXTENSIONS)
+    if isinstance(extensions, str):
+        if extensions not in EXTENSION_PROFILES:
+            raise ValueError(
+                f"Bilinmeyen extension profili: {extensions} "
+                f"(profiller: {', '.join(EXTENSION_PROFILES)})"
+            )
+        return list(EXTENSION_PROFILES[extensions])
+    return list(extensions)
+
+
+def parse_extensions(value):
+    """
+    --extensions argümanını çözer: profil adı veya virgülle ayrılmış
+    extension listesi (ör. "fast" veya "extra,toc")
+    """
+    if value in EXTENSION_PROFILES:
+        return value
+    extensions = [name.strip() for name in value.split(',') if name.strip()]
+    if not extensions:
+        raise argparse.ArgumentTypeError("extension profili veya listesi gerekli")
+    return extensions
+
+
+def load_css(css_file_path=None, css_string=None):
+    """
+    Kullanılacak CSS metnini belirler
     
-    # CSS dosyasını oku veya varsayılan CSS'i kullan
+    Öncelik sırası: css_string, css_file_path, varsayılan CSS.
+    """
     if css_string:
         # CSS string olarak verilmişse direkt kullan
-        custom_css = css_string
-    elif css_file_path and Path(css_file_path).exists():
+        return css_string
+    if css_file_path and Path(css_file_path).exists():
         try:
             with open(css_file_path, 'r', encoding='utf-8') as f:
-                custom_css = f.read()
+                return f.read()
         except Exception as e:
-            print(f"Uyarı: CSS dosyası okunamadı, varsayılan CSS kullanılıyor: {e}")
-            custom_css = get_default_css()
-    else:
-        custom_css = get_default_css()
+            print(f"Uyarı: CSS dosyası okunamadı, varsayılan CSS kullanılıyor: {e}", file=sys.stderr)
+    return get_default_css()
+
+
+def default_cache_dir():
+    """Önbellek dizininin varsayılan yolunu döndürür"""
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(Path.home(), '.cache')
+    return Path(base) / 'md_to_pdf'
+
+
+class OutputCache:
+    """
+    İçerik adresli PDF önbelleği
     
-    # PDF oluştur
-    try:
-        font_config = FontConfiguration()
-        html_doc = HTML(string=html_wrapper)
-        css_doc = CSS(string=custom_css, font_config=font_config)
-        
-        html_doc.write_pdf(
-            output_path,
-            stylesheets=[css_doc],
-            font_config=font_config
-        )
+    Anahtar; markdown içeriği, etkin CSS, extension listesi, belge başlığı,
+    göreli yolların çözümlendiği dizin ve program sürümünün hash'idir. Her
+    kaydın yanında belgenin kullandığı yerel kaynakların (görseller,
+    stylesheet'ler) boyut ve değişiklik zamanları saklanır; bunlardan biri
+    değişmiş veya silinmişse kayıt kullanılmaz. Uzak kaynaklar kontrol
+    edilmez. Toplam boyut max_bytes'ı aştığında en uzun süredir
+    kullanılmayan kayıtlar silinir (LRU).
+    """
+    
+    def __init__(self, directory=None, max_bytes=DEFAULT_CACHE_SIZE_MB * 1024 * 1024):
+        self.directory = Path(directory) if directory else default_cache_dir()
+        self.max_bytes = max_bytes
+        # Son temizlikten bu yana eklenen bayt; her kayıtta dizini taramamak için
+        self._added_bytes = 0
+    
+    def key(self, md_bytes, css, extensions, title, settings='', base_url=''):
+        """Dönüştürme girdilerinin hash'ini döndürür"""
+        digest = hashlib.sha256()
+        parts = [
+            __version__.encode('utf-8'),
+            css.encode('utf-8'),
+            '\0'.join(extensions).encode('utf-8'),
+            title.encode('utf-8'),
+            settings.encode('utf-8'),
+            (base_url or '').encode('utf-8'),
+            md_bytes,
+        ]
+        for part in parts:
+            # Uzunluk öneki, parçaların birbirine kaymasını engeller
+            digest.update(len(part).to_bytes(8, 'big'))
+            digest.update(part)
+        return digest.hexdigest()
+    
+    def _entry_path(self, key):
+        return self.directory / key[:2] / f"{key}.pdf"
+    
+    def _resources_path(self, key):
+        return self.directory / key[:2] / f"{key}.json"
+    
+    def fetch(self, key, output_path):
+        """Kayıt varsa ve yerel kaynakları değişmediyse output_path'e kopyalar ve True döndürür"""
+        entry = self._entry_path(key)
+        try:
+            with open(self._resources_path(key), 'r', encoding='utf-8') as f:
+                resources = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if _file_state(resources) != resources:
+            return False
+        try:
+            # LRU sırası için son kullanım zamanını güncelle
+            os.utime(entry)
+            shutil.copyfile(entry, output_path)
+        except FileNotFoundError:
+            return False
+        return True
+    
+    def store(self, key, pdf_path, resources=()):
+        """
+        Oluşturulan PDF'i önbelleğe ekler
         
-        print(f"✓ PDF başarıyla oluşturuldu: {output_path}")
-        return output_path
+        Args:
+            resources: Belgenin kullandığı kaynakların mutlak URL'leri
+                (Converter.resources); yerel olanlar kaydın geçerliliği için izlenir
+        """
+        entry = self._entry_path(key)
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        with open(self._resources_path(key), 'w', encoding='utf-8') as f:
+            local_paths = [unquote(urlsplit(url).path) for url in resources if urlsplit(url).scheme == 'file']
+            json.dump(_file_state(local_paths), f)
+        # Paralel process'ler yarım dosya görmesin diye önce geçici dosyaya yaz
+        fd, tmp_path = tempfile.mkstemp(dir=entry.parent, suffix='.tmp')
+        os.close(fd)
+        try:
+            shutil.copyfile(pdf_path, tmp_path)
+            os.replace(tmp_path, entry)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
         
-    except Exception as e:
-        raise RuntimeError(f"PDF oluşturulurken hata oluştu: {e}")
+        self._added_bytes += entry.stat().st_size
+        if self._added_bytes > self.max_bytes // 10:
+            self.evict()
+    
+    def evict(self):
+        """Toplam boyut sınırı aşıldıysa en eski kayıtları siler"""
+        self._added_bytes = 0
+        _evict_lru(self.directory, '*/*.pdf', self.max_bytes)
+        # PDF'i silinmiş kayıtların kaynak listeleri
+        for resources in self.directory.glob('*/*.json'):
+            if not resources.with_suffix('.pdf').exists():
+                try:
+                    resources.unlink()
+                except FileNotFoundError:
+                    pass
 
 
-def main():
-    """Ana fonksiyon - komut satırı arayüzü"""
-    parser = argparse.ArgumentParser(
-        description='Markdown dosyalarını PDF\'e çevirir',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Örnekler:
-  %(prog)s dosya.md
-  %(prog)s dosya.md -o cikti.pdf
-  %(prog)s dosya.md -c custom.css
-  %(prog)s *.md
-        """
-    )
+def _file_state(paths):
+    """
+    Dosyaların {yol: [mtime_ns, boyut]} sözlüğü; olmayan dosyalar None
+    olarak kaydedilir, sonradan eklenmeleri de değişiklik sayılır
+    """
+    state = {}
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            state[path] = None
+            continue
+        state[path] = [stat.st_mtime_ns, stat.st_size]
+    return state
+
+
+def _evict_lru(directory, pattern, max_bytes):
+    """Dizindeki dosyaların toplam boyutu max_bytes'a inene kadar en eskileri siler"""
+    entries = []
+    total = 0
+    for entry in Path(directory).glob(pattern):
+        try:
+            stat = entry.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, entry))
+        total += stat.st_size
     
-    parser.add_argument(
-        'input',
-        nargs='+',
-        help='Markdown dosyası(ları) (wildcard desteklenir)'
-    )
+    entries.sort()
+    for _mtime, size, entry in entries:
+        if total <= max_bytes:
+            break
+        try:
+            entry.unlink()
+        except FileNotFoundError:
+            pass
+        total -= size
+
+
+class HighlightCache:
+    """
+    Kod bloklarının Pygments çıktısı için LRU önbellek
     
-    parser.add_argument(
-        '-o', '--output',
-        help='Çıktı PDF dosyasının yolu (tek dosya için)'
-    )
+    Anahtar; dil, kod metni, formatter seçenekleri ve çıktıyı üreten
+    Pygments ile Markdown sürümleridir (yükseltmeden sonra diskteki eski
+    kayıtlar kullanılmaz). Bellekte en fazla max_entries kayıt tutulur;
+    directory verilirse kayıtlar diske de yazılır ve sonraki çalıştırmalarda
+    kullanılır (disk boyutu max_bytes ile sınırlı).
+    Aynı process'teki tüm Converter'lar tarafından paylaşılabilir.
+    """
     
-    parser.add_argument(
-        '-c', '--css',
-        help='Custom CSS dosyasının yolu'
-    )
+    def __init__(self, max_entries=4096, directory=None, max_bytes=50 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.directory = Path(directory) if directory else None
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._added_bytes = 0
     
-    args = parser.parse_args()
+    def __getstate__(self):
+        # Worker process'lere bellek içeriği değil, sadece ayarlar taşınır
+        state = self.__dict__.copy()
+        state['_entries'] = OrderedDict()
+        del state['_lock']
+        return state
     
-    # Dosya listesini oluştur
-    md_files = []
-    for pattern in args.input:
-        path = Path(pattern)
-        if path.is_file():
-            md_files.append(path)
-        elif '*' in pattern:
-            # Wildcard desteği
-            import glob
-            md_files.extend([Path(f) for f in glob.glob(pattern) if f.endswith('.md')])
-        else:
-            print(f"Uyarı: Dosya bulunamadı: {pattern}")
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
     
-    if not md_files:
-        print("Hata: İşlenecek markdown dosyası bulunamadı!")
-        sys.exit(1)
+    @staticmethod
+    def key(*parts):
+        """Dil, kod ve seçeneklerden önbellek anahtarı üretir"""
+        import markdown
+        import pygments
+        
+        digest = hashlib.sha256()
+        for part in (pygments.__version__, markdown.__version__, *parts):
+            data = repr(part).encode('utf-8')
+            digest.update(len(data).to_bytes(8, 'big'))
+            digest.update(data)
+        return digest.hexdigest()
     
-    # Her dosyayı işle
-    for md_file in md_files:
+    def _entry_path(self, key):
+        return self.directory / key[:2] / f"{key}.html"
+    
+    def get(self, key):
+        """Kayıtlı HTML'i döndürür, yoksa None"""
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return result
+        
+        if self.directory is not None:
+            entry = self._entry_path(key)
+            try:
+                result = entry.read_text(encoding='utf-8')
+                os.utime(entry)
+            except FileNotFoundError:
+                result = None
+            if result is not None:
+                self._remember(key, result)
+                with self._lock:
+                    self.hits += 1
+                return result
+        
+        with self._lock:
+            self.misses += 1
+        return None
+    
+    def put(self, key, result):
+        """Pygments çıktısını önbelleğe ekler"""
+        self._remember(key, result)
+        if self.directory is None:
+            return
+        
+        entry = self._entry_path(key)
         try:
-            output = args.output if len(md_files) == 1 else None
-            convert_md_to_pdf(md_file, output, args.css)
-        except Exception as e:
-            print(f"✗ Hata ({md_file}): {e}")
-            sys.exit(1)
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=entry.parent, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(result)
+            os.replace(tmp_path, entry)
+        except OSError:
+            # Disk önbelleği sadece hızlandırma amaçlı, hata dönüştürmeyi durdurmamalı
+            return
+        
+        with self._lock:
+            self._added_bytes += len(result)
+            evict = self._added_bytes > self.max_bytes // 10
+            if evict:
+                self._added_bytes = 0
+        if evict:
+            _evict_lru(self.directory, '*/*.html', self.max_bytes)
+    
+    def _remember(self, key, result):
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+# Process genelinde paylaşılan highlight önbelleği
+_shared_highlight_cache = None
+
+# Dönüştürme sırasında etkin olan önbellek (thread başına)
+_highlight_state = threading.local()
+
+
+def shared_highlight_cache():
+    """Process genelinde paylaşılan, bellek içi HighlightCache'i döndürür"""
+    global _shared_highlight_cache
+    if _shared_highlight_cache is None:
+        _shared_highlight_cache = HighlightCache()
+    return _shared_highlight_cache
+
+
+def _patch_code_hilite():
+    """
+    CodeHilite.hilite'ı etkin önbelleğe bakan bir sürümle değiştirir
+    
+    codehilite ve fenced_code extension'ları aynı CodeHilite sınıfını
+    kullandığından ikisi de önbellekten yararlanır. Etkin önbellek yoksa
+    orijinal davranış değişmez.
+    """
+    from markdown.extensions.codehilite import CodeHilite
+    
+    if getattr(CodeHilite.hilite, '_md_to_pdf_cached', False):
+        return
+    original = CodeHilite.hilite
+    
+    def hilite(self, shebang=True):
+        cache = getattr(_highlight_state, 'cache', None)
+        if cache is None:
+            return original(self, shebang)
+        formatter = self.pygments_formatter
+        if not isinstance(formatter, str):
+            formatter = f"{formatter.__module__}.{formatter.__qualname__}"
+        key = cache.key(
+            self.src, self.lang, shebang, self.guess_lang, self.use_pygments,
+            self.lang_prefix, formatter, sorted(self.options.items(), key=lambda item: item[0])
+        )
+        result = cache.get(key)
+        if result is None:
+            result = original(self, shebang)
+            cache.put(key, result)
+        return result
+    
+    hilite._md_to_pdf_cached = True
+    CodeHilite.hilite = hilite
+
+
+def highlight_cache_extension(cache):
+    """
+    Kod renklendirme sonuçlarını cache'te saklayan Markdown extension'ı
+    
+    Dönüştürmenin başında (ilk preprocessor) önbelleği o thread için etkin
+    hale getirir, sonunda (son postprocessor) kaldırır. Dönüştürme arada
+    hata verirse postprocessor çalışmaz; Converter bu yüzden dönüştürmeyi
+    ayrıca active_highlight_cache ile sarar.
+    """
+    from markdown.extensions import Extension
+    from markdown.postprocessors import Postprocessor
+    from markdown.preprocessors import Preprocessor
+    
+    class ActivateHighlightCache(Preprocessor):
+        def run(self, lines):
+            _highlight_state.cache = cache
+            return lines
+    
+    class DeactivateHighlightCache(Postprocessor):
+        def run(self, text):
+            _highlight_state.cache = None
+            return text
+    
+    class HighlightCacheExtension(Extension):
+        def extendMarkdown(self, md):
+            _patch_code_hilite()
+            md.preprocessors.register(ActivateHighlightCache(md), 'highlight_cache', 100)
+            md.postprocessors.register(DeactivateHighlightCache(md), 'highlight_cache_end', 0)
+    
+    return HighlightCacheExtension()
+
+
+@contextmanager
+def active_highlight_cache(cache):
+    """
+    Blok süresince cache'i o thread'in etkin renklendirme önbelleği yapar
+    
+    Çıkışta, dönüştürme hata verse bile önceki durum geri yüklenir.
+    """
+    previous = getattr(_highlight_state, 'cache', None)
+    _highlight_state.cache = cache
+    try:
+        yield
+    finally:
+        _highlight_state.cache = previous
+
+
+_fetcher_state = threading.local()
+
+
+def default_fetch(url):
+    """
+    URL'yi WeasyPrint'in varsayılan fetcher'ı ile indirir
+    
+    Returns:
+        (veri, mime_type, yönlendirilmiş_url) demeti
+    """
+    try:
+        from weasyprint.urls import URLFetcher
+    except ImportError:
+        # WeasyPrint < 67: fonksiyon tabanlı fetcher
+        from weasyprint import default_url_fetcher
+        result = default_url_fetcher(url)
+        data = result.get('string')
+        if data is None:
+            file_obj = result['file_obj']
+            try:
+                data = file_obj.read()
+            finally:
+                file_obj.close()
+        if isinstance(data, str):
+            data = data.encode(result.get('encoding') or 'utf-8')
+        return data, result.get('mime_type'), result.get('redirected_url') or url
+    
+    # URLFetcher thread-safe değil, her thread kendi örneğini kullanır
+    fetcher = getattr(_fetcher_state, 'fetcher', None)
+    if fetcher is None:
+        fetcher = _fetcher_state.fetcher = URLFetcher()
+    response = fetcher.fetch(url)
+    try:
+        data = response.read()
+    finally:
+        response.close()
+    return data, response.content_type, response.url
+
+
+def make_url_fetcher(fetch):
+    """
+    fetch(url) -> (veri, mime_type, yönlendirilmiş_url) fonksiyonunu
+    kurulu WeasyPrint sürümünün beklediği url_fetcher nesnesine çevirir
+    """
+    try:
+        from weasyprint.urls import URLFetcher, URLFetcherResponse
+    except ImportError:
+        # WeasyPrint < 67: sözlük döndüren bir fonksiyon beklenir
+        def url_fetcher(url):
+            data, mime_type, redirected_url = fetch(url)
+            return {'string': data, 'mime_type': mime_type, 'redirected_url': redirected_url}
+        return url_fetcher
+    
+    class FunctionURLFetcher(URLFetcher):
+        def fetch(self, url, headers=None):
+            data, mime_type, redirected_url = fetch(url)
+            headers = {'Content-Type': mime_type} if mime_type else {}
+            return URLFetcherResponse(redirected_url, data, headers)
+    
+    return FunctionURLFetcher()
+
+
+# CSS'te 1 inç 96 px'tir
+CSS_PX_PER_CM = 96 / 2.54
+
+
+class ImageOptimizer:
+    """
+    Görselleri basılacakları en büyük boyuta küçültüp yeniden kodlar
+    
+    Görseller CSS'te sayfa içerik alanına sığacak şekilde gösterildiğinden
+    (img { max-width: 100% }), bu alandan daha fazla pikseli olan görseller
+    dpi'ya göre küçültülür. İçerik alanı max_size_cm ile verilmezse
+    Converter onu CSS'in @page boyutu ve kenar boşluklarından hesaplar.
+    Alandan küçük gösterilen görseller için OutputOptimizer'ın dpi ayarı
+    PDF yazılırken gerçek boyutlarını kullanır. JPEG'ler jpeg_quality ile,
+    PNG'ler optimize edilerek yeniden kodlanır; sonuç orijinalden büyükse
+    orijinal kullanılır. cache_dir verilirse işlenen görseller içerik
+    hash'iyle diskte saklanır.
+    """
+    
+    # Sayfa bilinmediğinde kullanılan içerik alanı: A4 (21 x 29.7 cm) eksi 2 cm kenar boşlukları
+    DEFAULT_MAX_SIZE_CM = (17.0, 25.7)
+    
+    def __init__(self, dpi=150, jpeg_quality=85, max_size_cm=None,
+                 cache_dir=None, max_bytes=500 * 1024 * 1024):
+        """
+        Args:
+            dpi: Görsellerin basılacakları boyuttaki çözünürlüğü
+            jpeg_quality: Küçültülen JPEG'lerin kalitesi
+            max_size_cm: Görsellerin basılabileceği en büyük (genişlik, yükseklik);
+                None ise sayfanın içerik alanı kullanılır
+            cache_dir: İşlenen görsellerin saklanacağı dizin (opsiyonel)
+            max_bytes: Disk önbelleğinin en büyük boyutu
+        """
+        self.dpi = dpi
+        self.jpeg_quality = jpeg_quality
+        self.max_size_cm = tuple(max_size_cm) if max_size_cm is not None else None
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_bytes = max_bytes
+        self._added_bytes = 0
+    
+    def max_pixels(self, max_size_cm=None):
+        """
+        Görselin en fazla (genişlik, yükseklik) piksel değeri
+        
+        max_size_cm, optimizer'a bir boyut verilmediyse kullanılır (ör. sayfanın
+        içerik alanı); ikisi de yoksa DEFAULT_MAX_SIZE_CM geçerlidir.
+        """
+        max_size_cm = self.max_size_cm or max_size_cm or self.DEFAULT_MAX_SIZE_CM
+        return tuple(int(cm / 2.54 * self.dpi) for cm in max_size_cm)
+    
+    @property
+    def settings(self):
+        """Çıktıyı etkileyen ayarlar (önbellek anahtarları için)"""
+        return f"dpi={self.dpi};jpeg={self.jpeg_quality};max={self.max_size_cm or 'page'}"
+    
+    def process(self, data, mime_type, max_size_cm=None):
+        """
+        Görseli işler; görsel değilse veya işlenemiyorsa olduğu gibi döndürür
+        
+        Args:
+            max_size_cm: Optimizer'a boyut verilmediyse görselin sığacağı alan (cm)
+        
+        Returns:
+            (veri, mime_type) demeti
+        """
+        if mime_type not in ('image/jpeg', 'image/png'):
+            return data, mime_type
+        
+        max_pixels = self.max_pixels(max_size_cm)
+        settings = f"{self.settings};pixels={max_pixels}"
+        key = hashlib.sha256(settings.encode('utf-8') + b'\0' + data).hexdigest()
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached, self._cached_mime_type(cached, mime_type)
+        
+        try:
+            result, result_mime_type = self._resize(data, mime_type, max_pixels)
+        except Exception:
+            # Bozuk veya desteklenmeyen görseller WeasyPrint'e olduğu gibi bırakılır
+            return data, mime_type
+        # Küçültülmeyen görseller tekrar açıldığında sadece başlıkları okunur, saklamaya gerek yok
+        if result is not data:
+            self._cache_put(key, result)
+        return result, result_mime_type
+    
+    def _resize(self, data, mime_type, max_pixels):
+        from PIL import Image, ImageOps
+        
+        image = Image.open(io.BytesIO(data))
+        if getattr(image, 'is_animated', False):
+            return data, mime_type
+        
+        max_width, max_height = max_pixels
+        if image.width <= max_width and image.height <= max_height:
+            return data, mime_type
+        
+        # Yeniden kodlamada EXIF kaybolacağından yönlendirmeyi piksellere uygula
+        image = ImageOps.exif_transpose(image)
+        image.thumbnail((max_width, max_height), Image.LANCZOS)
+        
+        output = io.BytesIO()
+        if mime_type == 'image/jpeg':
+            if image.mode not in ('RGB', 'L', 'CMYK'):
+                image = image.convert('RGB')
+            image.save(output, 'JPEG', quality=self.jpeg_quality, optimize=True, progressive=True)
+        else:
+            image.save(output, 'PNG', optimize=True)
+        result = output.getvalue()
+        
+        if len(result) >= len(data):
+            return data, mime_type
+        return result, mime_type
+    
+    @staticmethod
+    def _cached_mime_type(data, mime_type):
+        if data.startswith(b'\x89PNG'):
+            return 'image/png'
+        if data.startswith(b'\xff\xd8'):
+            return 'image/jpeg'
+        return mime_type
+    
+    def _cache_get(self, key):
+        if self.cache_dir is None:
+            return None
+        entry = self.cache_dir / key[:2] / key
+        try:
+            data = entry.read_bytes()
+            os.utime(entry)
+        except FileNotFoundError:
+            return None
+        return data
+    
+    def _cache_put(self, key, data):
+        if self.cache_dir is None:
+            return
+        entry = self.cache_dir / key[:2] / key
+        try:
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=entry.parent, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, entry)
+        except OSError:
+            return
+        self._added_bytes += len(data)
+        if self._added_bytes > self.max_bytes // 10:
+            self._added_bytes = 0
+            _evict_lru(self.cache_dir, '*/[0-9a-f]*[0-9a-f]', self.max_bytes)
+
+
+def parse_size_cm(value):
+    """--image-max-size argümanını (genişlik, yükseklik) cm demetine çevirir (ör. "25.7x17")"""
+    try:
+        width, height = (float(part) for part in value.lower().split('x'))
+    except ValueError:
+        raise argparse.ArgumentTypeError("boyut GENİŞLİKxYÜKSEKLİK biçiminde (cm) olmalı, ör. 25.7x17")
+    if width <= 0 or height <= 0:
+        raise argparse.ArgumentTypeError("boyut pozitif olmalı")
+    return width, height
+
+
+# Yerleşimden önce indirilecek kaynak başvuruları
+HTML_RESOURCE_RE = re.compile(
+    r"""<(?:img\b[^>]*?\bsrc|link\b[^>]*?\bhref)\s*=\s*["']([^"']+)["']""",
+    re.IGNORECASE
+)
+CSS_URL_RE = re.compile(r"""url\(\s*["']?([^"')]+?)["']?\s*\)""")
+
+
+def path_to_base_url(path):
+    """Bir dizin yolunu göreli URL'lerin çözümleneceği file:// URL'sine çevirir"""
+    return Path(path).resolve().as_uri().rstrip('/') + '/'
+
+
+def resource_urls(html_wrapper, base_url=None, css=None, css_base_url=None):
+    """
+    HTML'deki görsel/stylesheet ve CSS'teki url() başvurularını mutlak URL olarak döndürür
+    
+    data: URL'leri ve sayfa içi bağlantılar atlanır; base_url olmadan
+    çözümlenemeyen göreli yollar da atlanır.
+    """
+    references = [(html.unescape(url), base_url) for url in HTML_RESOURCE_RE.findall(html_wrapper)]
+    references += [(url, base_url) for url in CSS_URL_RE.findall(html_wrapper)]
+    if css:
+        references += [(url, css_base_url) for url in CSS_URL_RE.findall(css)]
+    
+    urls = []
+    for url, base in references:
+        url = url.strip()
+        if not url or url.startswith(('#', 'data:')):
+            continue
+        if base is not None:
+            url = urljoin(base, url)
+        if urlsplit(url).scheme in ('file', 'http', 'https') and url not in urls:
+            urls.append(url)
+    return urls
+
+
+class ResourceFetcher:
+    """
+    Belgelerin kullandığı kaynakları indiren ve önbellekte tutan fetcher
+    
+    Bir Converter'a verildiğinde belgenin başvurduğu görseller ve
+    stylesheet'ler yerleşimden önce thread havuzunda paralel olarak indirilir;
+    WeasyPrint yerleşim sırasında bunları bellekten alır. Bellek içi önbellek
+    max_memory_bytes ile sınırlıdır ve aynı process'te dönüştürülen tüm
+    belgeler tarafından paylaşılır. Yerel dosyalar boyut ve değişiklik
+    zamanıyla anahtarlanır, böylece değişen dosyalar tekrar okunur. Uzak
+    (http/https) kaynaklar bellekte max_age saniye tutulur, sonra yeniden
+    indirilir; cache_dir verilirse aynı süre boyunca diskte de saklanır.
+    """
+    
+    def __init__(self, workers=8, max_memory_bytes=64 * 1024 * 1024, cache_dir=None,
+                 max_disk_bytes=200 * 1024 * 1024, max_age=3600):
+        self.workers = workers
+        self.max_memory_bytes = max_memory_bytes
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_disk_bytes = max_disk_bytes
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._memory_bytes = 0
+        self._added_bytes = 0
+        self._executor = None
+    
+    def __getstate__(self):
+        # Worker process'lere boş önbellekle gönderilir
+        state = self.__dict__.copy()
+        for name in ('_lock', '_entries', '_executor'):
+            del state[name]
+        state['_memory_bytes'] = 0
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._executor = None
+    
+    @staticmethod
+    def _key(url):
+        """URL'nin önbellek anahtarı; önbelleğe alınamıyorsa None"""
+        parts = urlsplit(url)
+        if parts.scheme in ('http', 'https'):
+            return url
+        if parts.scheme == 'file':
+            try:
+                stat = os.stat(unquote(parts.path))
+            except OSError:
+                return None
+            return f"{url}\0{stat.st_mtime_ns}\0{stat.st_size}"
+        return None
+    
+    def fetch(self, url):
+        """
+        URL'yi önbellekten veya ağdan/diskten alır
+        
+        Returns:
+            (veri, mime_type, yönlendirilmiş_url) demeti
+        """
+        key = self._key(url)
+        if key is None:
+            return default_fetch(url)
+        
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._fresh(key, entry):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+        
+        remote = urlsplit(url).scheme != 'file'
+        entry = self._disk_get(key) if remote else None
+        if entry is None:
+            entry = default_fetch(url), time.time()
+            if remote:
+                self._disk_put(key, *entry)
+        self._remember(key, *entry)
+        return entry[0]
+    
+    def _fresh(self, key, entry):
+        """Bellekteki kayıt hâlâ kullanılabilir mi; yerel dosyaların anahtarı değişikliği zaten içerir"""
+        return key.startswith('file:') or time.time() - entry[1] <= self.max_age
+    
+    def prefetch(self, urls):
+        """URL'leri paralel olarak önbelleğe indirir; hatalar yerleşimde raporlanır"""
+        with self._lock:
+            pending = []
+            for url in urls:
+                key = self._key(url)
+                entry = self._entries.get(key)
+                if entry is None or not self._fresh(key, entry):
+                    pending.append(url)
+        if not pending:
+            return
+        if len(pending) == 1 or self.workers <= 1:
+            for url in pending:
+                self._try_fetch(url)
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers)
+        list(self._executor.map(self._try_fetch, pending))
+    
+    def _try_fetch(self, url):
+        try:
+            self.fetch(url)
+        except Exception:
+            # WeasyPrint aynı kaynağı yerleşimde tekrar ister ve hatayı kendisi uyarı olarak yazar
+            pass
+    
+    def close(self):
+        """Prefetch thread havuzunu kapatır"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+    
+    def _remember(self, key, resource, fetched):
+        size = len(resource[0])
+        if size > self.max_memory_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._memory_bytes -= len(previous[0][0])
+            self._entries[key] = (resource, fetched)
+            self._memory_bytes += size
+            while self._memory_bytes > self.max_memory_bytes:
+                _key, ((data, _mime_type, _url), _fetched) = self._entries.popitem(last=False)
+                self._memory_bytes -= len(data)
+    
+    def _disk_path(self, key):
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return self.cache_dir / digest[:2] / digest
+    
+    def _disk_get(self, key):
+        if self.cache_dir is None:
+            return None
+        entry = self._disk_path(key)
+        try:
+            with open(entry, 'rb') as f:
+                header = json.loads(f.readline().decode('utf-8'))
+                data = f.read()
+        except (OSError, ValueError):
+            return None
+        if time.time() - header['fetched'] > self.max_age:
+            return None
+        try:
+            os.utime(entry)
+        except OSError:
+            pass
+        return (data, header['mime_type'], header['url']), header['fetched']
+    
+    def _disk_put(self, key, resource, fetched):
+        if self.cache_dir is None:
+            return
+        data, mime_type, url = resource
+        header = {'fetched': fetched, 'mime_type': mime_type, 'url': url}
+        entry = self._disk_path(key)
+        try:
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=entry.parent, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(json.dumps(header).encode('utf-8') + b'\n')
+                f.write(data)
+            os.replace(tmp_path, entry)
+        except OSError:
+            return
+        with self._lock:
+            self._added_bytes += len(data)
+            evict = self._added_bytes > self.max_disk_bytes // 10
+            if evict:
+                self._added_bytes = 0
+        if evict:
+            _evict_lru(self.cache_dir, '*/[0-9a-f]*[0-9a-f]', self.max_disk_bytes)
+
+
+# HTML'deki <img src="..."> başvuruları (önek, tırnak, değer)
+IMG_SRC_RE = re.compile(r"""(<img\b[^>]*?\bsrc\s*=\s*)(["'])([^"']+)\2""", re.IGNORECASE)
+
+
+class ImageDeduplicator:
+    """
+    Aynı içerikli görselleri tek bir URL'ye indirger
+    
+    WeasyPrint gömülü görselleri URL'lerine göre tekilleştirir; aynı logo
+    farklı yollardan (ör. her bölümün kendi kopyası) veya farklı sorgu
+    parametreleriyle kullanıldığında PDF'e her URL için ayrı gömülür. Bu
+    sınıf <img> URL'lerinin içeriğini hash'ler ve aynı içerikli görsellerin
+    URL'lerini ilk görülen URL ile değiştirir. Aynı örnek birden fazla HTML
+    parçası (ör. kitap bölümleri) için kullanılabilir.
+    """
+    
+    def __init__(self, fetch):
+        """
+        Args:
+            fetch: URL'yi (veri, mime_type, yönlendirilmiş_url) olarak döndüren fonksiyon
+        """
+        self.fetch = fetch
+        self.duplicates = 0
+        self.duplicate_bytes = 0
+        self._canonical = {}
+        self._urls = {}
+    
+    def rewrite(self, html_content, base_url=None):
+        """HTML'deki yinelenen görsel URL'lerini içeriği aynı ilk URL ile değiştirir"""
+        def replace(match):
+            prefix, quote, value = match.groups()
+            url = html.unescape(value).strip()
+            if not url or url.startswith(('#', 'data:')):
+                return match.group(0)
+            if base_url is not None:
+                url = urljoin(base_url, url)
+            if urlsplit(url).scheme not in ('file', 'http', 'https'):
+                return match.group(0)
+            canonical = self._canonical_url(url)
+            if canonical == url:
+                return match.group(0)
+            return f'{prefix}{quote}{html.escape(canonical)}{quote}'
+        
+        return IMG_SRC_RE.sub(replace, html_content)
+    
+    def _canonical_url(self, url):
+        canonical = self._urls.get(url)
+        if canonical is not None:
+            return canonical
+        try:
+            data = self.fetch(url)[0]
+        except Exception:
+            # Hatayı WeasyPrint yerleşim sırasında raporlar
+            self._urls[url] = url
+            return url
+        canonical = self._canonical.setdefault(hashlib.sha256(data).hexdigest(), url)
+        if canonical != url:
+            self.duplicates += 1
+            self.duplicate_bytes += len(data)
+        self._urls[url] = canonical
+        return canonical
+
+
+class OutputOptimizer:
+    """
+    PDF çıktısını küçülten yazım ayarları
+    
+    WeasyPrint'in optimize_images (görselleri yeniden sıkıştırır ve
+    gereksiz meta verileri atar), jpeg_quality ve dpi (görselleri sayfada
+    kapladıkları boyuta göre küçültür) ayarları write_pdf'e verilir; aynı
+    içerikli görseller ImageDeduplicator ile PDF'e bir kez gömülür.
+    Fontlar WeasyPrint tarafından zaten alt kümelenir ve tekilleştirilir;
+    sıkıştırma (nesne akışları dahil) compress=False verilmedikçe açıktır.
+    report True ise her belge ayrıca varsayılan ayarlarla yazılarak
+    optimizasyon öncesi boyut ölçülür (yazım süresi iki katına çıkar;
+    yinelenen görsel bulunduysa belge tekilleştirme olmadan bir kez daha
+    yerleştirilir).
+    """
+    
+    def __init__(self, optimize_images=True, jpeg_quality=None, dpi=None, dedupe_images=True,
+                 compress=True, report=False):
+        """
+        Args:
+            optimize_images: Görselleri yeniden sıkıştır ve meta verilerini at
+            jpeg_quality: JPEG'lerin yeniden kodlanma kalitesi (0-95, None ise değişmez)
+            dpi: Görsellerin sayfadaki boyutlarına göre en yüksek çözünürlüğü (None ise sınırsız)
+            dedupe_images: Aynı içerikli görselleri bir kez göm
+            compress: PDF akışlarını sıkıştır (False sadece hata ayıklama içindir)
+            report: Optimizasyon öncesi boyutu da ölç
+        """
+        self.optimize_images = optimize_images
+        self.jpeg_quality = jpeg_quality
+        self.dpi = dpi
+        self.dedupe_images = dedupe_images
+        self.compress = compress
+        self.report = report
+    
+    @property
+    def write_options(self):
+        """document.write_pdf'e verilecek ayarlar"""
+        options = {'optimize_images': self.optimize_images, 'uncompressed_pdf': not self.compress}
+        if self.jpeg_quality is not None:
+            options['jpeg_quality'] = self.jpeg_quality
+        if self.dpi is not None:
+            options['dpi'] = self.dpi
+        return options
+    
+    @property
+    def settings(self):
+        """Çıktıyı etkileyen ayarlar (önbellek anahtarı için)"""
+        return (
+            f"pdf:{int(self.optimize_images)}:{self.jpeg_quality}:{self.dpi}:"
+            f"{int(self.dedupe_images)}:{int(self.compress)}"
+        )
+
+
+def _output_size(pdf, target):
+    """Yazılan PDF'in boyutu (bayt); ölçülemiyorsa None"""
+    if pdf is not None:
+        return len(pdf)
+    if isinstance(target, (str, os.PathLike)):
+        return os.path.getsize(target)
+    try:
+        return target.tell()
+    except (AttributeError, OSError):
+        return None
+
+
+def format_size(size):
+    """Bayt sayısını okunabilir biçimde döndürür (ör. '1.4 MB')"""
+    for unit in ('B', 'KB', 'MB'):
+        if size < 1024 or unit == 'MB':
+            return f"{size:.0f} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+        size /= 1024
+
+
+# Dönüştürme aşamaları, çalışma sırasıyla
+STAGES = ('markdown', 'html', 'fetch', 'css', 'layout', 'write')
+
+
+class StageTimer:
+    """
+    Dönüştürme aşamalarının sürelerini ölçer
+    
+    Converter.convert/render'a timer olarak verildiğinde her aşamanın geçen
+    süresi (saniye) stages, process CPU süresi cpu sözlüğüne; sayfa sayısı
+    gibi ek bilgiler info'ya yazılır.
+    """
+    
+    def __init__(self):
+        self.stages = {}
+        self.cpu = {}
+        self.info = {}
+    
+    @contextmanager
+    def stage(self, name):
+        started = time.perf_counter()
+        started_cpu = time.process_time()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            elapsed_cpu = time.process_time() - started_cpu
+            self.stages[name] = self.stages.get(name, 0.0) + elapsed
+            self.cpu[name] = self.cpu.get(name, 0.0) + elapsed_cpu
+    
+    @property
+    def total(self):
+        return sum(self.stages.values())
+
+
+def _stage(timer, name):
+    """timer verilmişse aşamayı ölçen, verilmemişse boş bir context manager döndürür"""
+    return timer.stage(name) if timer is not None else nullcontext()
+
+
+class ConversionCancelled(Exception):
+    """Dönüştürme CancellationToken ile iptal edildiğinde fırlatılır"""
+
+
+class CancellationToken:
+    """
+    Süren bir dönüştürmeyi iptal etmek için kullanılan işaret
+    
+    Dönüştürme aşamalar arasında ve sayfalar arasında token'ı kontrol eder;
+    cancel() çağrıldıktan sonraki ilk kontrolde ConversionCancelled fırlatılır.
+    Başka bir process'teki dönüştürmeyi iptal etmek için event olarak
+    multiprocessing.Manager().Event() verilebilir.
+    """
+    
+    def __init__(self, event=None):
+        self._event = event if event is not None else threading.Event()
+    
+    def cancel(self):
+        self._event.set()
+    
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+    
+    def check(self):
+        """İptal istendiyse ConversionCancelled fırlatır"""
+        if self._event.is_set():
+            raise ConversionCancelled("Dönüştürme iptal edildi")
+
+
+class _Progress:
+    """
+    on_progress geri çağrısını ve iptal token'ını dönüştürme aşamaları boyunca taşır
+    
+    on_progress(aşama, bilgi) şu aşamalarla çağrılır: 'markdown', 'fetch'
+    (resources: kaynak sayısı), 'css', 'layout' (yerleşim sürerken page:
+    sayfa numarası, bitince pages: sayfa sayısı), 'write' (page, pages; her
+    sayfa yazılmadan önce) ve 'done' (pages, bytes: PDF boyutu).
+    """
+    
+    def __init__(self, on_progress=None, cancel=None):
+        self.on_progress = on_progress
+        self.cancel = cancel
+    
+    @property
+    def active(self):
+        return self.on_progress is not None or self.cancel is not None
+    
+    def check(self):
+        if self.cancel is not None:
+            self.cancel.check()
+    
+    def step(self, stage, **info):
+        """İptal istenip istenmediğini kontrol eder ve aşamayı bildirir"""
+        self.check()
+        self.report(stage, **info)
+    
+    def report(self, stage, **info):
+        if self.on_progress is not None:
+            self.on_progress(stage, info)
+
+
+# WeasyPrint yerleşim sırasında her sayfa için weasyprint.progress'e INFO kaydı yazar
+LAYOUT_PAGE_RE = re.compile(r'Creating layout - Page (\d+)')
+
+_layout_progress = threading.local()
+_layout_progress_lock = threading.Lock()
+_layout_progress_users = 0
+_layout_progress_saved = None
+
+
+class _LayoutProgressHandler(logging.Handler):
+    """Yerleşim kayıtlarını o thread'de süren dönüştürmenin _Progress'ine iletir"""
+    
+    def emit(self, record):
+        progress = getattr(_layout_progress, 'progress', None)
+        if progress is None:
+            return
+        match = LAYOUT_PAGE_RE.search(record.getMessage())
+        if match:
+            # ConversionCancelled yerleşimi bir sonraki sayfada keser
+            progress.step('layout', page=int(match.group(1)))
+
+
+_LAYOUT_PROGRESS_HANDLER = _LayoutProgressHandler()
+
+
+@contextmanager
+def _track_layout(progress):
+    """
+    Yerleşim sırasında sayfa ilerlemesini bildirir ve iptali kontrol eder
+    
+    weasyprint.progress logger'ı INFO seviyesine sadece izlenen bir
+    dönüştürme sürerken açılır; kullanıcı bu seviyeyi kendisi açmamışsa
+    kayıtlar üst logger'lara da iletilmez.
+    """
+    global _layout_progress_users, _layout_progress_saved
+    if progress is None or not progress.active:
+        yield
+        return
+    
+    logger = logging.getLogger('weasyprint.progress')
+    with _layout_progress_lock:
+        if _layout_progress_users == 0:
+            _layout_progress_saved = (logger.level, logger.propagate)
+            if not logger.isEnabledFor(logging.INFO):
+                logger.setLevel(logging.INFO)
+                logger.propagate = False
+            logger.addHandler(_LAYOUT_PROGRESS_HANDLER)
+        _layout_progress_users += 1
+    _layout_progress.progress = progress
+    try:
+        yield
+    finally:
+        _layout_progress.progress = None
+        with _layout_progress_lock:
+            _layout_progress_users -= 1
+            if _layout_progress_users == 0:
+                logger.removeHandler(_LAYOUT_PROGRESS_HANDLER)
+                logger.setLevel(_layout_progress_saved[0])
+                logger.propagate = _layout_progress_saved[1]
+
+
+def _write_document(document, target, progress=None, options=None):
+    """
+    Yerleştirilmiş belgeyi PDF olarak yazar
+    
+    progress verilmişse her sayfa çizilmeden önce iptal kontrol edilir ve
+    ilerleme bildirilir; yazım bitince PDF boyutu 'done' olarak bildirilir.
+    options write_pdf'e aynen verilir.
+    """
+    options = options or {}
+    if progress is None or not progress.active:
+        return document.write_pdf(target, **options)
+    
+    pages = document.pages
+    
+    def tracked_paint(page, number):
+        paint = page.paint
+        
+        def wrapper(*args, **kwargs):
+            progress.step('write', page=number, pages=len(pages))
+            return paint(*args, **kwargs)
+        return wrapper
+    
+    for number, page in enumerate(pages, 1):
+        page.paint = tracked_paint(page, number)
+    try:
+        pdf = document.write_pdf(target, **options)
+    finally:
+        for page in pages:
+            vars(page).pop('paint', None)
+    
+    progress.report('done', pages=len(pages), bytes=_output_size(pdf, target))
+    return pdf
+
+
+class Converter:
+    """
+    Aynı ayarlarla birden fazla belgeyi dönüştüren, tekrar kullanılabilir dönüştürücü
+    
+    Markdown örneği ve FontConfiguration bir kez oluşturulur; her belge
+    arasında sadece Markdown örneği sıfırlanır. Stylesheet'ler paylaşılan
+    StylesheetRegistry'den alınır, aynı temayı kullanan Converter'lar onu
+    bir kez ayrıştırır. Bir Converter örneği aynı anda tek bir thread'den
+    kullanılmalıdır.
+    """
+    
+    def __init__(self, css_file_path=None, css_string=None, extensions=None, cache=None,
+                 highlight_cache=None, image_optimizer=None, resource_fetcher=None,
+                 preload_fonts=(), extra_css=(), output_optimizer=None, url_schemes=None):
+        """
+        Args:
+            css_file_path: Custom CSS dosyasının yolu (opsiyonel)
+            css_string: CSS kodunu string olarak (opsiyonel, css_file_path'ten önceliklidir)
+            extensions: Markdown extension listesi veya EXTENSION_PROFILES'teki
+                bir profil adı (None ise DEFAULT_EXTENSIONS)
+            cache: Değişmeyen belgeleri tekrar oluşturmamak için OutputCache (opsiyonel)
+            highlight_cache: Kod bloklarının renklendirmesi için HighlightCache
+                (None ise process genelinde paylaşılan bellek içi önbellek,
+                False ise önbellek kullanılmaz)
+            image_optimizer: Görselleri küçültüp yeniden kodlayan ImageOptimizer (opsiyonel)
+            resource_fetcher: Kaynakları paralel indirip önbellekte tutan ResourceFetcher
+                (opsiyonel; birden fazla Converter arasında paylaşılabilir)
+            preload_fonts: Verilirse CSS'in fontları ve bu font aileleri
+                paylaşılan font kaydına önceden yüklenir
+            extra_css: Temanın üzerine sırayla eklenecek CSS metinleri; tema
+                ve ekler ayrı ayrı ayrıştırılıp önbellekte tutulur
+            output_optimizer: PDF yazım ayarlarını belirleyen OutputOptimizer (opsiyonel)
+            url_schemes: Verilirse sadece bu şemalardaki kaynaklar (ör. ('data',)
+                veya ('data', 'https')) indirilir; diğerleri indirilmeden
+                reddedilir. Güvenilmeyen içerik render edilirken yerel
+                dosyaların ve iç ağ adreslerinin okunmasını engeller.
+        """
+        import markdown
+        
+        self.extensions = resolve_extensions(extensions)
+        self.cache = cache
+        self.css = load_css(css_file_path, css_string)
+        # CSS'teki göreli url()'ler CSS dosyasının dizinine göre çözümlenir
+        self.css_base_url = None
+        if css_string is None and css_file_path and os.path.exists(css_file_path):
+            self.css_base_url = path_to_base_url(Path(css_file_path).parent)
+        self.extra_css = [css for css in extra_css if css]
+        self.font_config = font_registry().font_config_for('\n'.join([self.css, *self.extra_css]))
+        if preload_fonts:
+            font_registry().warm(self.css, preload_fonts)
+        if highlight_cache is None:
+            highlight_cache = shared_highlight_cache()
+        md_extensions = list(self.extensions)
+        self.highlight_cache = highlight_cache or None
+        if self.highlight_cache is not None:
+            md_extensions.append(highlight_cache_extension(self.highlight_cache))
+        self.md = markdown.Markdown(extensions=md_extensions)
+        self.image_optimizer = image_optimizer
+        self.resource_fetcher = resource_fetcher
+        self.output_optimizer = output_optimizer
+        self.url_schemes = frozenset(url_schemes) if url_schemes is not None else None
+        self._url_fetcher = None
+        # CSS katmanlarına göre sayfanın içerik alanı (cm) ve render edilen belgeninki
+        self._content_sizes = {}
+        self._content_size_cm = None
+        # Son render edilen belgenin başvurduğu kaynakların mutlak URL'leri
+        self.resources = []
+        # Son yazılan PDF'in boyut raporu (output_optimizer yoksa None)
+        self.output_report = None
+    
+    @property
+    def url_fetcher(self):
+        """Kaynakları indiren url_fetcher (None ise WeasyPrint'in varsayılanı)"""
+        custom = (self.image_optimizer, self.resource_fetcher, self.url_schemes)
+        if self._url_fetcher is None and any(option is not None for option in custom):
+            self._url_fetcher = make_url_fetcher(self.fetch)
+        return self._url_fetcher
+    
+    @property
+    def settings(self):
+        """Çıktıyı etkileyen ek ayarlar (önbellek anahtarı için)"""
+        optimizers = (self.image_optimizer, self.output_optimizer)
+        settings = [optimizer.settings for optimizer in optimizers if optimizer is not None]
+        if self.url_schemes is not None:
+            settings.append(f"schemes={','.join(sorted(self.url_schemes))}")
+        return ';'.join(settings)
+    
+    @property
+    def write_options(self):
+        """document.write_pdf'e verilecek ayarlar"""
+        if self.output_optimizer is None:
+            return {}
+        return self.output_optimizer.write_options
+    
+    def image_deduplicator(self):
+        """Yeni bir ImageDeduplicator; görseller tekilleştirilmeyecekse None"""
+        if self.output_optimizer is None or not self.output_optimizer.dedupe_images:
+            return None
+        return ImageDeduplicator(self.fetch_raw)
+    
+    def allows_url(self, url):
+        """URL'nin şeması url_schemes ile izin verilenlerden mi"""
+        return self.url_schemes is None or urlsplit(url).scheme.lower() in self.url_schemes
+    
+    def fetch_raw(self, url):
+        """Bir kaynağı ImageOptimizer'dan geçirmeden indirir"""
+        if not self.allows_url(url):
+            raise ValueError(f"İzin verilmeyen URL şeması: {url}")
+        if self.resource_fetcher is not None:
+            return self.resource_fetcher.fetch(url)
+        return default_fetch(url)
+    
+    def fetch(self, url):
+        """Bir kaynağı indirir ve görselse ImageOptimizer'dan geçirir"""
+        data, mime_type, redirected_url = self.fetch_raw(url)
+        if self.image_optimizer is not None:
+            data, mime_type = self.image_optimizer.process(data, mime_type, self._content_size_cm)
+        return data, mime_type, redirected_url
+    
+    def content_size_cm(self, stylesheets, font_config=None, key=None):
+        """
+        Verilen CSS katmanlarıyla ilk sayfanın içerik alanının (genişlik,
+        yükseklik) boyutu (cm); @page'in size ve margin değerlerinden boş
+        bir belge yerleştirilerek bulunur. Sonuç key ile saklanır; Converter'ın
+        katmanlarına eklenen CSS'i (ör. belgeye özel extra_css) ayırt etmelidir.
+        Bulunamazsa None döner.
+        """
+        if key in self._content_sizes:
+            return self._content_sizes[key]
+        from weasyprint import HTML
+        
+        try:
+            document = HTML(string=self.wrap_html('', 'page')).render(
+                stylesheets=stylesheets, font_config=font_config or self.font_config
+            )
+            # Sayfa kutusunun width/height değerleri kenar boşlukları hariç alandır (CSS px)
+            page_box = document.pages[0]._page_box
+            size = (page_box.width / CSS_PX_PER_CM, page_box.height / CSS_PX_PER_CM)
+        except Exception:
+            size = None
+        self._content_sizes[key] = size
+        return size
+    
+    def fit_images_to(self, stylesheets, font_config=None, key=None):
+        """
+        Yerleşimden önce çağrılır: ImageOptimizer'a boyut verilmediyse
+        görseller bu CSS katmanlarının sayfa içerik alanına göre küçültülür
+        """
+        if self.image_optimizer is not None and self.image_optimizer.max_size_cm is None:
+            self._content_size_cm = self.content_size_cm(stylesheets, font_config, key)
+    
+    def parse_css(self, css, base_url=None, font_config=None):
+        """CSS metnini bu Converter'ın ayarlarıyla ayrıştırır (StylesheetRegistry üzerinden)"""
+        url_fetcher = self.url_fetcher
+        return stylesheet_registry().get(
+            css,
+            base_url=base_url,
+            font_config=font_config or self.font_config,
+            url_fetcher=url_fetcher,
+            # Aynı ayarlı Converter'ların fetcher'ları aynı sonucu verir
+            fetcher_key=('fetch', self.settings) if url_fetcher is not None else None
+        )
+    
+    @property
+    def stylesheet(self):
+        """Temanın ayrıştırılmış CSS nesnesi"""
+        return self.parse_css(self.css, self.css_base_url)
+    
+    def stylesheets(self, extra_css=None, base_url=None, font_config=None):
+        """
+        Belgeye uygulanacak CSS katmanları: tema, Converter'ın ekleri ve
+        verilmişse belgeye özel ek (göreli url()'leri base_url'e göre çözülür)
+        """
+        stylesheets = [self.parse_css(self.css, self.css_base_url, font_config)]
+        stylesheets += [self.parse_css(css, self.css_base_url, font_config) for css in self.extra_css]
+        if extra_css:
+            stylesheets.append(self.parse_css(extra_css, base_url, font_config))
+        return stylesheets
+    
+    def _font_config_with(self, extra_css):
+        """Belgeye özel ek @font-face tanımlıyorsa ona ait FontConfiguration"""
+        if extra_css and '@font-face' in extra_css:
+            return font_registry().font_config_for('\n'.join([self.css, *self.extra_css, extra_css]))
+        return self.font_config
+    
+    def to_html_body(self, md_content, timer=None):
+        """Markdown metnini HTML gövdesine (<body> içeriği) çevirir"""
+        with _stage(timer, 'markdown'), active_highlight_cache(self.highlight_cache):
+            self.md.reset()
+            return self.md.convert(md_content)
+    
+    def to_html(self, md_content, title, timer=None):
+        """Markdown metnini tam bir HTML belgesine çevirir"""
+        html_content = self.to_html_body(md_content, timer)
+        with _stage(timer, 'html'):
+            return self.wrap_html(html_content, title)
+    
+    @staticmethod
+    def wrap_html(html_content, title):
+        """HTML gövdesini tam bir HTML belgesine sarar"""
+        # HTML wrapper ekle (emoji desteği için meta tag'ler)
+        return f"""<!DOCTYPE html>
+<html lang="tr">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{html.escape(title)}</title>
+</head>
+<body>
+{html_content}
+</body>
+</html>"""
+    
+    def convert(self, md_file_path, output_path=None, timer=None, on_progress=None, cancel=None,
+                extra_css=None):
+        """
+        Markdown dosyasını PDF'e çevirir
+        
+        Args:
+            md_file_path: Markdown dosyasının yolu
+            output_path: Çıktı PDF dosyasının yolu (None ise otomatik oluşturulur)
+            timer: Aşama sürelerini kaydetmek için StageTimer (opsiyonel)
+            on_progress: Her aşamada on_progress(aşama, bilgi) olarak çağrılır (opsiyonel)
+            cancel: Dönüştürmeyi yarıda kesmek için CancellationToken (opsiyonel);
+                iptal edilirse ConversionCancelled fırlatılır
+            extra_css: Sadece bu belgeye, temanın üzerine eklenecek CSS (opsiyonel)
+        
+        Returns:
+            Oluşturulan PDF dosyasının yolu (Path)
+        """
+        progress = _Progress(on_progress, cancel)
+        md_path = Path(md_file_path)
+        
+        if not md_path.exists():
+            raise FileNotFoundError(f"Markdown dosyası bulunamadı: {md_file_path}")
+        
+        # Çıktı dosyası yolu belirlenir
+        if output_path is None:
+            output_path = md_path.with_suffix('.pdf')
+        else:
+            output_path = Path(output_path)
+        
+        # Markdown dosyasını oku
+        try:
+            with open(md_path, 'rb') as f:
+                md_bytes = f.read()
+            md_content = md_bytes.decode('utf-8')
+        except Exception as e:
+            raise IOError(f"Markdown dosyası okunamadı: {e}")
+        
+        # İçerik ve ayarlar değişmediyse önbellekteki PDF'i kullan
+        cache_key = None
+        if self.cache is not None:
+            css = '\n'.join([self.css, *self.extra_css, *([extra_css] if extra_css else [])])
+            cache_key = self.cache.key(
+                md_bytes, css, self.extensions, md_path.stem, self.settings, path_to_base_url(md_path.parent)
+            )
+            if self.cache.fetch(cache_key, output_path):
+                self.output_report = None
+                progress.report('done', pages=None, bytes=os.path.getsize(output_path))
+                return output_path
+        
+        progress.check()
+        html_wrapper = self.to_html(md_content, md_path.stem, timer)
+        progress.step('markdown')
+        self._write_pdf(html_wrapper, output_path, timer, path_to_base_url(md_path.parent), progress, extra_css)
+        
+        if cache_key is not None:
+            try:
+                self.cache.store(cache_key, output_path, self.resources)
+            except OSError as e:
+                print(f"Uyarı: PDF önbelleğe yazılamadı: {e}", file=sys.stderr)
+        return output_path
+    
+    def render(self, source, target=None, title='document', timer=None, base_url=None,
+               on_progress=None, cancel=None, extra_css=None):
+        """
+        Markdown metnini diske dokunmadan PDF'e çevirir
+        
+        Args:
+            source: Markdown metni (str/bytes) veya read() metodu olan dosya nesnesi
+            target: None ise PDF bayt olarak döndürülür; yazılabilir binary
+                dosya nesnesi veya dosya yolu verilirse PDF oraya yazılır
+            title: Belge başlığı (PDF metadata'sında görünür)
+            timer: Aşama sürelerini kaydetmek için StageTimer (opsiyonel)
+            base_url: Göreli görsel ve bağlantıların çözümleneceği dizin veya URL
+            on_progress: Her aşamada on_progress(aşama, bilgi) olarak çağrılır (opsiyonel)
+            cancel: Dönüştürmeyi yarıda kesmek için CancellationToken (opsiyonel)
+            extra_css: Sadece bu belgeye, temanın üzerine eklenecek CSS (opsiyonel)
+        
+        Returns:
+            target None ise PDF içeriği (bytes), değilse target
+        """
+        progress = _Progress(on_progress, cancel)
+        if hasattr(source, 'read'):
+            source = source.read()
+        if isinstance(source, bytes):
+            source = source.decode('utf-8')
+        
+        if base_url is not None and '://' not in str(base_url):
+            base_url = path_to_base_url(base_url)
+        progress.check()
+        html_wrapper = self.to_html(source, title, timer)
+        progress.step('markdown')
+        pdf = self._write_pdf(html_wrapper, target, timer, base_url, progress, extra_css)
+        return pdf if target is None else target
+    
+    def prefetch(self, html_wrapper, base_url=None):
+        """
+        Belgenin kaynaklarını bulur (resources) ve ResourceFetcher varsa
+        yerleşimden önce paralel olarak indirir
+        """
+        self.resources = resource_urls(html_wrapper, base_url, self.css, self.css_base_url)
+        if self.resource_fetcher is not None:
+            self.resource_fetcher.prefetch([url for url in self.resources if self.allows_url(url)])
+    
+    def layout(self, source, title='document', timer=None, base_url=None,
+               on_progress=None, cancel=None, extra_css=None):
+        """
+        Markdown metnini PDF'e yazmadan sayfalara yerleştirir
+        
+        Önizleme gibi sadece sayfa görüntüsü veya sayfa sayısı gereken
+        durumlar içindir; dönen WeasyPrint belgesi write_pdf() ile veya
+        copy() ile seçilen sayfalar yazılabilir. on_progress, cancel ve
+        extra_css render() ile aynıdır ('write' ve 'done' aşamaları hariç).
+        
+        Returns:
+            weasyprint.Document
+        """
+        progress = _Progress(on_progress, cancel)
+        if hasattr(source, 'read'):
+            source = source.read()
+        if isinstance(source, bytes):
+            source = source.decode('utf-8')
+        if base_url is not None and '://' not in str(base_url):
+            base_url = path_to_base_url(base_url)
+        
+        progress.check()
+        html_wrapper = self.to_html(source, title, timer)
+        progress.step('markdown')
+        try:
+            return self._layout(html_wrapper, timer, base_url, progress, extra_css)
+        except ConversionCancelled:
+            raise
+        except Exception as e:
+            raise RuntimeError(f"PDF oluşturulurken hata oluştu: {e}")
+    
+    def _layout(self, html_wrapper, timer=None, base_url=None, progress=None, extra_css=None,
+                deduplicator=None):
+        """HTML belgesini sayfalara yerleştirir"""
+        from weasyprint import HTML
+        
+        progress = progress or _Progress()
+        with _stage(timer, 'fetch'):
+            self.prefetch(html_wrapper, base_url)
+            if deduplicator is not None:
+                html_wrapper = deduplicator.rewrite(html_wrapper, base_url)
+        progress.step('fetch', resources=len(self.resources))
+        
+        with _stage(timer, 'css'):
+            font_config = self._font_config_with(extra_css)
+            stylesheets = self.stylesheets(extra_css, base_url, font_config)
+            self.fit_images_to(stylesheets, font_config, key=extra_css)
+        progress.step('css')
+        
+        with _stage(timer, 'layout'), _track_layout(progress):
+            document = HTML(
+                string=html_wrapper,
+                base_url=base_url,
+                url_fetcher=self.url_fetcher
+            ).render(
+                stylesheets=stylesheets,
+                font_config=font_config
+            )
+        
+        if timer is not None:
+            timer.info['pages'] = len(document.pages)
+        progress.step('layout', pages=len(document.pages))
+        return document
+    
+    def _write_pdf(self, html_wrapper, target, timer=None, base_url=None, progress=None, extra_css=None):
+        """HTML belgesini PDF olarak target'a yazar (None ise bayt döndürür)"""
+        self.output_report = None
+        try:
+            deduplicator = self.image_deduplicator()
+            document = self._layout(html_wrapper, timer, base_url, progress, extra_css, deduplicator)
+            
+            with _stage(timer, 'write'):
+                pdf = _write_document(document, target, progress, self.write_options)
+            if self.output_optimizer is not None:
+                self.output_report = self._output_report(
+                    document, pdf, target, deduplicator, html_wrapper, base_url, extra_css
+                )
+            return pdf
+        except ConversionCancelled:
+            raise
+        except Exception as e:
+            raise RuntimeError(f"PDF oluşturulurken hata oluştu: {e}")
+    
+    def _output_report(self, document, pdf, target, deduplicator=None, html_wrapper=None,
+                       base_url=None, extra_css=None):
+        """
+        Yazılan PDF'in boyut raporu: bytes, yinelenen görsel sayısı ve
+        boyutu; OutputOptimizer.report True ise görselleri tekilleştirilmeden
+        WeasyPrint'in varsayılan ayarlarıyla yazılmış halinin boyutu (bytes_before)
+        """
+        report = {
+            'bytes': _output_size(pdf, target),
+            'duplicate_images': deduplicator.duplicates if deduplicator is not None else 0,
+            'duplicate_bytes': deduplicator.duplicate_bytes if deduplicator is not None else 0,
+        }
+        if self.output_optimizer.report:
+            if report['duplicate_images'] and html_wrapper is not None:
+                # Tekilleştirme HTML'i değiştirdi; asıl boyut için özgün HTML yerleştirilir
+                document = self._layout(html_wrapper, base_url=base_url, extra_css=extra_css)
+            report['bytes_before'] = len(document.write_pdf())
+        return report
+
+
+def format_output_report(report):
+    """Boyut raporunu tek satırlık metne çevirir (ör. '1.2 MB → 640.0 KB, 2 yinelenen görsel')"""
+    parts = []
+    if report.get('bytes') is not None:
+        size = format_size(report['bytes'])
+        if report.get('bytes_before') is not None:
+            size = f"{format_size(report['bytes_before'])} → {size}"
+            if report['bytes_before']:
+                change = 100 * (report['bytes'] / report['bytes_before'] - 1)
+                size += f" (%{abs(change):.0f} {'büyüdü' if change > 0 else 'küçüldü'})"
+        parts.append(size)
+    if report.get('duplicate_images'):
+        parts.append(
+            f"{report['duplicate_images']} yinelenen görsel bir kez gömüldü "
+            f"({format_size(report['duplicate_bytes'])})"
+        )
+    return ', '.join(parts)
+
+
+def convert_md_text_to_pdf(md_content, target=None, css_file_path=None, css_string=None,
+                           title='document', on_progress=None, cancel=None, extensions=None):
+    """
+    Markdown metnini PDF'e çevirir; geçici dosya kullanmaz
+    
+    Args:
+        md_content: Markdown metni (str/bytes) veya okunabilir dosya nesnesi
+        target: None ise PDF bayt olarak döndürülür; yazılabilir binary
+            dosya nesnesi veya dosya yolu verilirse PDF oraya yazılır
+        css_file_path: Custom CSS dosyasının yolu (opsiyonel)
+        css_string: CSS kodunu string olarak (opsiyonel, css_file_path'ten önceliklidir)
+        title: Belge başlığı
+        on_progress: Her aşamada on_progress(aşama, bilgi) olarak çağrılır (opsiyonel)
+        cancel: Dönüştürmeyi yarıda kesmek için CancellationToken (opsiyonel)
+        extensions: Markdown extension listesi veya profil adı (ör. 'fast')
+    """
+    converter = Converter(css_file_path, css_string, extensions)
+    return converter.render(md_content, target, title, on_progress=on_progress, cancel=cancel)
+
+
+def _max_rss_bytes():
+    """Process'in şimdiye kadarki en yüksek RSS değeri (desteklenmiyorsa None)"""
+    try:
+        import resource
+    except ImportError:
+        # Windows
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux KB, macOS bayt olarak döndürür
+    return max_rss if sys.platform == 'darwin' else max_rss * 1024
+
+
+def profile_conversion(converter, md_file_path, output_path=None, dump_path=None,
+                       on_progress=None, cancel=None, trace_memory=False):
+    """
+    Tek bir dönüştürmeyi ölçerek çalıştırır
+    
+    tracemalloc her bellek ayırmayı izlediği için süreleri birkaç kat
+    şişirir; bu yüzden Python heap tepe değeri sadece trace_memory ile,
+    süreleri ölçülen dönüştürmeden sonra ayrı bir dönüştürmede ölçülür.
+    
+    Args:
+        converter: Kullanılacak Converter
+        md_file_path: Markdown dosyasının yolu
+        output_path: Çıktı PDF dosyasının yolu (None ise otomatik oluşturulur)
+        dump_path: Verilirse cProfile istatistikleri bu dosyaya yazılır
+        on_progress, cancel: Converter.convert'e aynen verilir
+        trace_memory: True ise Python heap tepe değeri tracemalloc ile
+            ikinci bir dönüştürmede ölçülür
+    
+    Returns:
+        (output_path, kayıt) demeti; kayıt aşama başına wall/CPU süresi,
+        process RSS tepe değeri, sayfa sayısı, çıktı boyutu ve
+        trace_memory ise Python heap tepe değerini içeren bir sözlüktür
+    """
+    timer = StageTimer()
+    profiler = cProfile.Profile() if dump_path else None
+    
+    started = time.perf_counter()
+    started_cpu = time.process_time()
+    try:
+        if profiler is not None:
+            profiler.enable()
+        output_path = converter.convert(md_file_path, output_path, timer, on_progress, cancel)
+    finally:
+        if profiler is not None:
+            profiler.disable()
+        wall = time.perf_counter() - started
+        cpu = time.process_time() - started_cpu
+    
+    if profiler is not None:
+        profiler.dump_stats(dump_path)
+    
+    peak = None
+    if trace_memory:
+        peak = _peak_python_memory(converter, md_file_path, output_path)
+    
+    record = {
+        'file': str(md_file_path),
+        'output': str(output_path),
+        # Önbellekten gelen belgelerde hiçbir aşama çalışmaz
+        'cached': not timer.stages,
+        'wall': wall,
+        'cpu': cpu,
+        'stages': {
+            name: {'wall': timer.stages[name], 'cpu': timer.cpu[name]}
+            for name in timer.stages
+        },
+        'peak_python_memory': peak,
+        'max_rss': _max_rss_bytes(),
+        'pages': timer.info.get('pages'),
+        'output_size': os.path.getsize(output_path),
+    }
+    if converter.output_report is not None:
+        record['output_report'] = converter.output_report
+    if dump_path:
+        record['cprofile'] = str(dump_path)
+    return output_path, record
+
+
+def _peak_python_memory(converter, md_file_path, output_path):
+    """Dönüştürmeyi tracemalloc açıkken tekrarlar ve Python heap tepe değerini döndürür"""
+    # Önbellekten gelen belge yeniden oluşturulmaz; bellek ölçümü de atlanmamalı
+    cache, converter.cache = converter.cache, None
+    # tracemalloc zaten açıksa (ör. kullanıcı tarafından) sadece tepe değeri sıfırla
+    was_tracing = tracemalloc.is_tracing()
+    if was_tracing and hasattr(tracemalloc, 'reset_peak'):
+        tracemalloc.reset_peak()
+    elif not was_tracing:
+        tracemalloc.start()
+    try:
+        converter.convert(md_file_path, output_path)
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+        converter.cache = cache
+    return peak
+
+
+def profile_dump_path(dump_dir, md_file_path):
+    """
+    Belgenin cProfile dosyasının yolu: DIR/<ad>-<yol hash'i>.prof
+    
+    Farklı dizinlerdeki aynı adlı belgeler (a/x.md, b/x.md) birbirinin
+    dosyasının üzerine yazmaz.
+    """
+    resolved = str(Path(md_file_path).resolve())
+    digest = hashlib.sha1(resolved.encode('utf-8')).hexdigest()[:8]
+    return Path(dump_dir) / f"{Path(md_file_path).stem}-{digest}.prof"
+
+
+def write_profile_record(record, stream=None):
+    """Profil kaydını tek satırlık JSON (JSON Lines) olarak yazar"""
+    stream = stream or sys.stderr
+    stream.write(json.dumps(record, ensure_ascii=False) + '\n')
+    stream.flush()
+
+
+# Süresi extension başına ölçülen Markdown işlemci türleri
+PROCESSOR_KINDS = ('preprocessors', 'blockprocessors', 'treeprocessors', 'postprocessors')
+
+# --time-extensions'ta her belgenin kaç kez dönüştürüleceği
+EXTENSION_TIMING_REPEAT = 5
+
+
+def _processor_registries(md):
+    """Markdown örneğinin işlemci türü -> Registry sözlüğü"""
+    return {
+        'preprocessors': md.preprocessors,
+        'blockprocessors': md.parser.blockprocessors,
+        'treeprocessors': md.treeprocessors,
+        'postprocessors': md.postprocessors,
+    }
+
+
+def time_extensions(md_content, extensions=None, repeat=1):
+    """
+    Her extension'ın işlemcilerinin belge üzerindeki maliyetini ölçer
+    
+    Extension'lar sırayla kaydedilir ve her birinin eklediği işlemciler
+    ona atfedilir; Markdown çekirdeğinin işlemcileri 'core' altında
+    toplanır. İç içe çağrılan blockprocessor'ların süresi çağırandan
+    düşülür. Inline pattern'ler çekirdeğin 'inline' treeprocessor'u içinde
+    çalıştığından 'core' süresine dahildir. Pygments renklendirmesi
+    (CodeHilite.hilite), extra'nın fenced_code preprocessor'u tarafından
+    çağrılsa da codehilite'a, çağıran işlemcinin türü altında atfedilir.
+    Kod renklendirme önbelleği kullanılmaz.
+    
+    Args:
+        md_content: Markdown metni
+        extensions: Extension listesi veya profil adı (None ise DEFAULT_EXTENSIONS)
+        repeat: Belgenin kaç kez dönüştürüleceği; süreler ortalamadır
+    
+    Returns:
+        (süreler, toplam) demeti; süreler extension sırasıyla ('core' ilk)
+        {ad: {işlemci_türü: saniye}} sözlüğü, toplam bir dönüştürmenin
+        ortalama süresidir
+    """
+    import markdown
+    
+    md = markdown.Markdown()
+    owners = {}
+    timings = OrderedDict()
+    
+    def claim(owner):
+        timings.setdefault(owner, dict.fromkeys(PROCESSOR_KINDS, 0.0))
+        for registry in _processor_registries(md).values():
+            for processor in registry:
+                owners.setdefault(id(processor), (owner, processor))
+    
+    claim('core')
+    for extension in resolve_extensions(extensions):
+        md.registerExtensions([extension], {})
+        claim(extension if isinstance(extension, str) else type(extension).__name__)
+    
+    # Her çağrının sadece kendine ait süresi için iç içe çağrıların toplamı
+    # ve çalışan işlemcilerin türleri
+    nested = []
+    kinds = []
+    
+    def timed(method, bucket, kind=None):
+        def wrapper(*args, **kwargs):
+            # kind verilmezse süre çağıran işlemcinin türüne yazılır
+            call_kind = kind or (kinds[-1] if kinds else 'treeprocessors')
+            nested.append(0.0)
+            kinds.append(call_kind)
+            started = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - started
+                kinds.pop()
+                bucket[call_kind] += elapsed - nested.pop()
+                if nested:
+                    nested[-1] += elapsed
+        return wrapper
+    
+    for kind, registry in _processor_registries(md).items():
+        methods = ('test', 'run') if kind == 'blockprocessors' else ('run',)
+        for processor in registry:
+            owner, _processor = owners[id(processor)]
+            for name in methods:
+                setattr(processor, name, timed(getattr(processor, name), timings[owner], kind))
+    
+    # fenced_code da renklendirmeyi codehilite'ın CodeHilite sınıfına yaptırır
+    from markdown.extensions.codehilite import CodeHilite, HiliteTreeprocessor
+    hilite_owner = next(
+        (owner for owner, processor in owners.values() if isinstance(processor, HiliteTreeprocessor)),
+        None
+    )
+    hilite = CodeHilite.hilite
+    if hilite_owner is not None:
+        CodeHilite.hilite = timed(hilite, timings[hilite_owner])
+    try:
+        started = time.perf_counter()
+        for _ in range(repeat):
+            md.reset()
+            md.convert(md_content)
+        total = (time.perf_counter() - started) / repeat
+    finally:
+        CodeHilite.hilite = hilite
+    
+    for bucket in timings.values():
+        for kind in bucket:
+            bucket[kind] /= repeat
+    return timings, total
+
+
+def print_extension_timings(name, timings, total, repeat, stream=None):
+    """time_extensions sonucunu milisaniye cinsinden tablo olarak yazar"""
+    stream = stream or sys.stdout
+    headers = ('pre', 'block', 'tree', 'post', 'toplam')
+    width = max(len('extension'), *(len(owner) for owner in timings))
+    stream.write(f"{name}: {total * 1000:.2f} ms ({repeat} dönüştürmenin ortalaması)\n")
+    stream.write(f"  {'extension':<{width}}" + ''.join(f"{header:>9}" for header in headers) + '\n')
+    for owner, bucket in timings.items():
+        values = [bucket[kind] for kind in PROCESSOR_KINDS]
+        values.append(sum(values))
+        stream.write(f"  {owner:<{width}}" + ''.join(f"{value * 1000:9.2f}" for value in values) + '\n')
+
+
+def convert_md_to_pdf(md_file_path, output_path=None, css_file_path=None, css_string=None,
+                      profile=None, profile_dump=None, image_optimizer=None,
+                      on_progress=None, cancel=None, extensions=None, output_optimizer=None,
+                      profile_memory=False):
+    """
+    Markdown dosyasını PDF'e çevirir
+    
+    Tek seferlik dönüştürmeler içindir; aynı ayarlarla çok sayıda dosya
+    dönüştürülecekse bir Converter örneğini tekrar kullanmak daha hızlıdır.
+    
+    Args:
+        md_file_path: Markdown dosyasının yolu
+        output_path: Çıktı PDF dosyasının yolu (None ise otomatik oluşturulur)
+        css_file_path: Custom CSS dosyasının yolu (opsiyonel)
+        css_string: CSS kodunu string olarak (opsiyonel, css_file_path'ten önceliklidir)
+        profile: True ise aşama süreleri, bellek, sayfa sayısı ve çıktı boyutu
+            JSON satırı olarak stderr'e yazılır; yazılabilir bir metin dosya
+            nesnesi verilirse oraya yazılır
+        profile_dump: Verilirse cProfile istatistikleri bu dosyaya yazılır
+        image_optimizer: Görselleri küçültüp yeniden kodlayan ImageOptimizer (opsiyonel)
+        on_progress: Her aşamada on_progress(aşama, bilgi) olarak çağrılır;
+            aşamalar 'markdown', 'fetch', 'css', 'layout', 'write' ve 'done'dur
+        cancel: Dönüştürmeyi yarıda kesmek için CancellationToken (opsiyonel);
+            aşamalar ve sayfalar arasında kontrol edilir, iptal edilirse
+            ConversionCancelled fırlatılır
+        extensions: Markdown extension listesi veya EXTENSION_PROFILES'teki
+            bir profil adı (ör. 'fast'; None ise DEFAULT_EXTENSIONS)
+        output_optimizer: PDF yazım ayarlarını belirleyen OutputOptimizer (opsiyonel);
+            boyut raporu verilirse başarı mesajına eklenir
+        profile_memory: True ise profil kaydına Python heap tepe değeri de
+            eklenir (belge tracemalloc açıkken ikinci kez dönüştürülür)
+    """
+    converter = Converter(
+        css_file_path, css_string, extensions,
+        image_optimizer=image_optimizer,
+        output_optimizer=output_optimizer
+    )
+    if profile or profile_dump:
+        output_path, record = profile_conversion(
+            converter, md_file_path, output_path, profile_dump, on_progress, cancel, profile_memory
+        )
+        if profile:
+            write_profile_record(record, None if profile is True else profile)
+    else:
+        output_path = converter.convert(md_file_path, output_path, on_progress=on_progress, cancel=cancel)
+    if converter.output_report is not None:
+        print(f"✓ PDF başarıyla oluşturuldu: {output_path} ({format_output_report(converter.output_report)})")
+    else:
+        print(f"✓ PDF başarıyla oluşturuldu: {output_path}")
+    return output_path
+
+
+# Her worker process'te (veya sıralı modda ana process'te) bir kez oluşturulur
+_worker_converter = None
+_worker_profile = None
+
+
+def _init_worker(converter_options, profile=None):
+    """Process'e ait Converter örneğini ve profil ayarlarını hazırlar"""
+    global _worker_converter, _worker_profile
+    _worker_converter = Converter(**converter_options)
+    _worker_profile = profile
+
+
+def _convert_job(job):
+    """Tek bir dönüştürme işini çalıştırır, hatayı fırlatmak yerine döndürür"""
+    md_file, output = job
+    try:
+        if _worker_profile is None:
+            result = _worker_converter.convert(md_file, output)
+            report = _worker_converter.output_report
+            return md_file, result, None, {'output_report': report} if report is not None else None
+        
+        dump_dir = _worker_profile.get('dump_dir')
+        dump_path = profile_dump_path(dump_dir, md_file) if dump_dir else None
+        result, record = profile_conversion(
+            _worker_converter, md_file, output, dump_path,
+            trace_memory=_worker_profile.get('trace_memory', False)
+        )
+        return md_file, result, None, record
+    except Exception as e:
+        return md_file, None, str(e), None
+
+
+def run_jobs(jobs, converter_options=None, workers=1, profile=None):
+    """
+    Dönüştürme işlerini sırayla veya process havuzunda çalıştırır
+    
+    Her process tek bir Converter oluşturur ve tüm işlerinde onu kullanır.
+    
+    Args:
+        jobs: (md_file, output_path) demetlerinin listesi
+        converter_options: Converter'a verilecek keyword argümanları
+        workers: Paralel çalışacak process sayısı (1 ise sıralı çalışır)
+        profile: Verilirse her iş profile_conversion ile ölçülür; 'dump_dir'
+            anahtarı cProfile dosyalarının yazılacağı dizini, 'trace_memory'
+            Python heap ölçümünü belirtir
+    
+    Yields:
+        Her iş tamamlandıkça (md_file, output_path, hata_mesajı, profil_kaydı)
+        demeti; başarılı işlerde hata_mesajı None olur. Profil kapalıysa kayıt
+        sadece Converter'ın boyut raporunu ('output_report') içerir, rapor
+        yoksa None olur
+    """
+    converter_options = converter_options or {}
+    if workers <= 1 or len(jobs) <= 1:
+        _init_worker(converter_options, profile)
+        for job in jobs:
+            yield _convert_job(job)
+        return
+    
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(jobs)),
+        initializer=_init_worker,
+        initargs=(converter_options, profile)
+    ) as executor:
+        futures = {executor.submit(_convert_job, job): job for job in jobs}
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except Exception as e:
+                # Worker process'in kendisi çökerse (ör. BrokenProcessPool)
+                yield futures[future][0], None, str(e), None
+
+
+# Sayfa numarası için kullanılan CSS sayaçları
+PAGE_COUNTER_RE = re.compile(r'counter\(\s*page(s?)\s*[,)]')
+PAGES_COUNTER_RE = re.compile(r'counter\(\s*pages\s*(?:,[^)]*)?\)')
+
+
+def split_html_sections(html_content):
+    """
+    HTML gövdesini en üst seviye başlıklardan bölümlere ayırır
+    
+    Belgedeki en küçük başlık seviyesi (genellikle h1) en üst seviye kabul
+    edilir; ilk başlıktan önceki içerik ilk bölüme eklenir.
+    """
+    levels = re.findall(r'(?m)^<h([1-6])[\s>]', html_content)
+    if not levels:
+        return [html_content]
+    top = min(levels)
+    sections = re.split(rf'(?m)^(?=<h{top}[\s>])', html_content)
+    if not sections[0].strip() and len(sections) > 1:
+        sections.pop(0)
+    elif len(sections) > 1 and not re.match(rf'<h{top}[\s>]', sections[0]):
+        # Başlıktan önceki içerik ayrı bir bölüm olmasın
+        sections[1] = sections[0] + sections[1]
+        sections.pop(0)
+    return sections
+
+
+def _section_css(css, offset, total_pages):
+    """
+    Bir bölümün sayfa numaralarını bütün belgeye göre düzelten CSS'i döndürür
+    
+    counter(pages) toplam sayfa sayısıyla değiştirilir ve bölümün ilk sayfası
+    önceki bölümlerin sayfa sayısından başlatılır.
+    """
+    css = PAGES_COUNTER_RE.sub(f'"{total_pages}"', css)
+    # counter-reset kullanıldığında WeasyPrint o sayfa için otomatik artırım yapmaz
+    return css + f"\n@page :first {{ counter-reset: page {offset + 1}; }}\n"
+
+
+def _section_job(html_wrapper, css, count_only, base_url=None):
+    """Worker process'te bir bölümü yerleştirir; sayfa sayısını veya PDF'i döndürür"""
+    from weasyprint import HTML
+    
+    converter = _worker_converter
+    converter.prefetch(html_wrapper, base_url)
+    deduplicator = converter.image_deduplicator()
+    if deduplicator is not None:
+        html_wrapper = deduplicator.rewrite(html_wrapper, base_url)
+    stylesheets = [converter.parse_css(css, converter.css_base_url)]
+    stylesheets += [converter.parse_css(extra, converter.css_base_url) for extra in converter.extra_css]
+    converter.fit_images_to(stylesheets, key=('split',))
+    document = HTML(string=html_wrapper, base_url=base_url, url_fetcher=converter.url_fetcher).render(
+        stylesheets=stylesheets,
+        font_config=converter.font_config
+    )
+    if count_only:
+        return len(document.pages)
+    return document.write_pdf(**converter.write_options)
+
+
+def convert_split(md_file_path, output_path=None, converter_options=None, workers=None):
+    """
+    Büyük bir belgeyi bölümlere ayırıp paralel render eder ve tek PDF'te birleştirir
+    
+    HTML, en üst seviye başlıklardan bölünür; her bölüm ayrı bir worker
+    process'te yerleştirilir. CSS sayfa numarası kullanıyorsa önce her
+    bölümün sayfa sayısı paralel olarak hesaplanır, ardından bölümler doğru
+    sayfa numaralarıyla yeniden render edilir. PDF'leri birleştirmek için
+    opsiyonel pypdf paketi gerekir (bölümlerin ortak fontlarını ve
+    görsellerini tekilleştirmek için 5.0 veya üstü).
+    
+    Bölümler arası iç bağlantılar (ör. içindekiler listesinden başka bir
+    bölüme) birleştirilmiş PDF'te çalışmaz.
+    
+    Args:
+        md_file_path: Markdown dosyasının yolu
+        output_path: Çıktı PDF dosyasının yolu (None ise otomatik oluşturulur)
+        converter_options: Converter'a verilecek keyword argümanları
+        workers: Worker process sayısı (None ise CPU sayısı)
+    
+    Returns:
+        Oluşturulan PDF dosyasının yolu (Path)
+    """
+    try:
+        from pypdf import PdfWriter
+    except ImportError:
+        raise RuntimeError("Bölümlü render için pypdf gerekli: pip install pypdf")
+    
+    converter_options = converter_options or {}
+    md_path = Path(md_file_path)
+    if not md_path.exists():
+        raise FileNotFoundError(f"Markdown dosyası bulunamadı: {md_file_path}")
+    output_path = md_path.with_suffix('.pdf') if output_path is None else Path(output_path)
+    
+    converter = Converter(**converter_options)
+    with open(md_path, 'r', encoding='utf-8') as f:
+        html_content = converter.to_html_body(f.read())
+    sections = [
+        converter.wrap_html(section, md_path.stem)
+        for section in split_html_sections(html_content)
+    ]
+    if len(sections) < 2:
+        return converter.convert(md_path, output_path)
+    
+    workers = min(workers or os.cpu_count() or 1, len(sections))
+    base_urls = [path_to_base_url(md_path.parent)] * len(sections)
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(converter_options,)
+    ) as executor:
+        css = converter.css
+        if PAGE_COUNTER_RE.search(css):
+            # 1. geçiş: her bölümün sayfa sayısı
+            counts = list(executor.map(
+                _section_job, sections, [css] * len(sections), [True] * len(sections), base_urls
+            ))
+            offsets = [sum(counts[:i]) for i in range(len(counts))]
+            section_css = [_section_css(css, offset, sum(counts)) for offset in offsets]
+        else:
+            # Sayfa numarası gösterilmiyorsa tek geçiş yeterli
+            section_css = [css] * len(sections)
+        
+        # 2. geçiş: bölümlerin PDF'leri
+        try:
+            pdfs = list(executor.map(
+                _section_job, sections, section_css, [False] * len(sections), base_urls
+            ))
+        except Exception as e:
+            raise RuntimeError(f"PDF oluşturulurken hata oluştu: {e}")
+    
+    writer = PdfWriter()
+    for pdf in pdfs:
+        writer.append(io.BytesIO(pdf))
+    writer.add_metadata({'/Title': md_path.stem})
+    if converter.output_optimizer is not None and converter.output_optimizer.dedupe_images:
+        # Her bölüm ortak fontları ve görselleri ayrı ayrı gömer;
+        # compress_identical_objects pypdf 5.0 ile geldi, eski sürümlerde atlanır
+        if hasattr(writer, 'compress_identical_objects'):
+            writer.compress_identical_objects()
+    with open(output_path, 'wb') as f:
+        writer.write(f)
+    return output_path
+
+
+def _run_split_jobs(jobs, converter_options, workers):
+    """Dosyaları sırayla, her birini bölümlere ayırarak paralel dönüştürür"""
+    for md_file, output in jobs:
+        try:
+            result = convert_split(md_file, output, converter_options, workers)
+            record = None
+            if converter_options.get('output_optimizer') is not None:
+                record = {'output_report': {'bytes': os.path.getsize(result)}}
+            yield md_file, result, None, record
+        except Exception as e:
+            yield md_file, None, str(e), None
+
+
+def _snapshot(paths):
+    """Dosyaların (mtime, boyut) bilgisini döndürür; olmayanlar için None"""
+    state = {}
+    for path in paths:
+        try:
+            stat = path.stat()
+            state[path] = (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            state[path] = None
+    return state
+
+
+def watch(jobs, converter_options=None, interval=0.5, debounce=0.3):
+    """
+    Markdown ve CSS dosyalarını izler, değişen belgeleri yeniden oluşturur
+    
+    Process ve Converter açık kaldığı için her değişiklikte sadece ilgili
+    belgenin dönüştürme maliyeti ödenir. Bir markdown dosyası değişirse
+    sadece o belge, CSS dosyası değişirse tüm belgeler yeniden oluşturulur.
+    
+    Args:
+        jobs: (md_file, output_path) demetlerinin listesi
+        converter_options: Converter'a verilecek keyword argümanları
+        interval: Dosyaların kontrol edilme aralığı (saniye)
+        debounce: Son değişiklikten sonra beklenecek süre (saniye); editörün
+            art arda yaptığı kayıtlar tek bir dönüştürmeye indirgenir
+    """
+    converter_options = converter_options or {}
+    converter = Converter(**converter_options)
+    outputs = {Path(md_file): output for md_file, output in jobs}
+    css_file = converter_options.get('css_file_path')
+    css_path = Path(css_file) if css_file else None
+    
+    watched = list(outputs)
+    if css_path is not None:
+        watched.append(css_path)
+    
+    last = _snapshot(watched)
+    print("\nDosyalar izleniyor... (çıkmak için Ctrl+C)")
+    try:
+        while True:
+            time.sleep(interval)
+            current = _snapshot(watched)
+            if current == last:
+                continue
+            
+            # Dosyalar debounce süresi boyunca değişmeyene kadar bekle
+            while True:
+                time.sleep(debounce)
+                settled = _snapshot(watched)
+                if settled == current:
+                    break
+                current = settled
+            
+            changed = {path for path in watched if current[path] != last[path]}
+            last = current
+            
+            if css_path in changed:
+                print(f"CSS değişti, tüm belgeler yeniden oluşturuluyor: {css_path}")
+                converter = Converter(**converter_options)
+                targets = list(outputs)
+            else:
+                targets = [path for path in outputs if path in changed]
+            
+            for md_file in targets:
+                if current[md_file] is None:
+                    # Dosya silinmiş veya yeniden adlandırılıyor olabilir
+                    continue
+                started = time.perf_counter()
+                try:
+                    result = converter.convert(md_file, outputs[md_file])
+                    elapsed = time.perf_counter() - started
+                    print(f"✓ PDF güncellendi: {result} ({elapsed:.2f} sn)")
+                except Exception as e:
+                    print(f"✗ Hata ({md_file}): {e}")
+    except KeyboardInterrupt:
+        print("\nİzleme durduruldu")
+
+
+def _convert_stream(args, parser):
+    """
+    '-' girdisi (stdin) veya '-o -' çıktısı (stdout) için dönüştürme yapar
+    
+    PDF stdout'a yazılırken tüm durum mesajları stderr'e gider. Dosya
+    modundaki Converter ayarları aynen kullanılır; tek bir akışla
+    anlamı olmayan seçenekler hata verir.
+    
+    Returns:
+        Process çıkış kodu
+    """
+    if len(args.input) != 1:
+        print("Hata: stdin/stdout modunda tek bir girdi verilebilir", file=sys.stderr)
+        return 1
+    if args.watch:
+        print("Hata: --watch stdin/stdout ile kullanılamaz", file=sys.stderr)
+        return 1
+    if args.split:
+        parser.error('--split stdin/stdout ile kullanılamaz')
+    if args.profile or args.profile_dump:
+        parser.error('--profile ve --profile-dump stdin/stdout ile kullanılamaz')
+    if args.jobs != 1:
+        parser.error('-j/--jobs stdin/stdout ile kullanılamaz (tek belge dönüştürülür)')
+    
+    try:
+        if args.input[0] == '-':
+            md_content = sys.stdin.buffer.read()
+            title = 'stdin'
+            base_url = os.getcwd()
+        else:
+            md_path = Path(args.input[0])
+            md_content = md_path.read_bytes()
+            title = md_path.stem
+            base_url = md_path.parent
+        
+        if args.time_extensions:
+            timings, total = time_extensions(md_content.decode('utf-8'), args.extensions, EXTENSION_TIMING_REPEAT)
+            print_extension_timings(title, timings, total, EXTENSION_TIMING_REPEAT)
+            return 0
+        
+        # stdin'den okunup çıktı belirtilmediyse PDF stdout'a yazılır
+        to_stdout = args.output in (None, '-')
+        target = sys.stdout.buffer if to_stdout else args.output
+        
+        cache = None
+        if not args.no_cache:
+            cache = OutputCache(args.cache_dir, args.cache_size * 1024 * 1024)
+        converter_options = _converter_options(args, cache)
+        # PDF önbelleği dosya çıktıları içindir; diğer önbellekler aynen kullanılır
+        converter_options.pop('cache')
+        converter = Converter(**converter_options)
+        converter.render(md_content, target, title, base_url=base_url)
+    except Exception as e:
+        print(f"✗ Hata ({args.input[0]}): {e}", file=sys.stderr)
+        return 1
+    
+    if to_stdout:
+        sys.stdout.buffer.flush()
+    else:
+        print(f"✓ PDF başarıyla oluşturuldu: {args.output}", file=sys.stderr)
+    # stdout'un boyutu pipe'larda ölçülemez
+    report = converter.output_report and format_output_report(converter.output_report)
+    if args.size_report and report:
+        print(f"  {report}", file=sys.stderr)
+    return 0
+
+
+def _converter_options(args, cache=None):
+    """Komut satırı seçeneklerinden Converter'a verilecek keyword argümanlarını oluşturur"""
+    converter_options = {'css_file_path': args.css, 'cache': cache, 'extensions': args.extensions}
+    if cache is not None:
+        # Kod renklendirme sonuçları da aynı önbellek dizininde saklanır
+        converter_options['highlight_cache'] = HighlightCache(directory=cache.directory / 'highlight')
+    if args.preload_fonts:
+        converter_options['preload_fonts'] = args.preload_fonts
+    # Belgelerin ortak kullandığı logo, diyagram vb. kaynaklar bir kez indirilir
+    converter_options['resource_fetcher'] = ResourceFetcher(
+        cache_dir=cache.directory / 'resources' if cache is not None else None
+    )
+    if args.image_dpi:
+        converter_options['image_optimizer'] = ImageOptimizer(
+            dpi=args.image_dpi,
+            jpeg_quality=args.jpeg_quality,
+            max_size_cm=args.image_max_size,
+            cache_dir=cache.directory / 'images' if cache is not None else None
+        )
+    output_optimizer = _output_optimizer(args)
+    if output_optimizer is not None:
+        converter_options['output_optimizer'] = output_optimizer
+    return converter_options
+
+
+def _output_optimizer(args):
+    """--optimize-pdf ve --size-report seçeneklerinden OutputOptimizer oluşturur"""
+    if args.optimize_pdf:
+        return OutputOptimizer(
+            jpeg_quality=args.jpeg_quality,
+            dpi=args.image_dpi,
+            report=args.size_report
+        )
+    if args.size_report:
+        # Sadece boyut raporu; PDF WeasyPrint'in varsayılan ayarlarıyla yazılır
+        return OutputOptimizer(optimize_images=False, dedupe_images=False)
+    return None
+
+
+def main():
+    """Ana fonksiyon - komut satırı arayüzü"""
+    # Alt komutlar
+    if len(sys.argv) > 1 and sys.argv[1] == 'serve':
+        from md_to_pdf_server import main as serve_main
+        serve_main(sys.argv[2:])
+        return
+    if len(sys.argv) > 1 and sys.argv[1] == 'build':
+        from md_to_pdf_build import main as build_main
+        build_main(sys.argv[2:])
+        return
+    if len(sys.argv) > 1 and sys.argv[1] == 'book':
+        from md_to_pdf_book import main as book_main
+        book_main(sys.argv[2:])
+        return
+    
+    parser = argparse.ArgumentParser(
+        description='Markdown dosyalarını PDF\'e çevirir',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Örnekler:
+  %(prog)s dosya.md
+  %(prog)s dosya.md -o cikti.pdf
+  %(prog)s dosya.md -c custom.css
+  %(prog)s *.md
+  %(prog)s *.md -j 8
+  %(prog)s dosya.md -c custom.css --watch
+  cat dosya.md | %(prog)s - > cikti.pdf
+  %(prog)s dosya.md -o - | gzip > cikti.pdf.gz
+  %(prog)s kitap.md --split -j 16
+  %(prog)s docs/*.md --profile profil.jsonl --profile-dump prof/
+  %(prog)s docs/*.md --extensions fast
+  %(prog)s rapor.md --optimize-pdf --jpeg-quality 75 --size-report
+  %(prog)s dosya.md --extensions extra,toc --time-extensions
+  %(prog)s serve --port 8000 --workers 4
+  %(prog)s build docs/ pdf/ -j 8
+  %(prog)s book --summary SUMMARY.md -o kitap.pdf
+        """
+    )
+    
+    parser.add_argument(
+        'input',
+        nargs='+',
+        help='Markdown dosyası(ları) (wildcard desteklenir, "-" stdin\'den okur)'
+    )
+    
+    parser.add_argument(
+        '-o', '--output',
+        help='Çıktı PDF dosyasının yolu (tek dosya için, "-" stdout\'a yazar)'
+    )
+    
+    parser.add_argument(
+        '-c', '--css',
+        help='Custom CSS dosyasının yolu'
+    )
+    
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=1,
+        help='Paralel dönüştürme process sayısı (0: CPU sayısı kadar, varsayılan: 1)'
+    )
+    
+    parser.add_argument(
+        '-w', '--watch',
+        action='store_true',
+        help='Dosyaları izle ve değiştikçe PDF\'leri yeniden oluştur'
+    )
+    
+    parser.add_argument(
+        '--extensions',
+        type=parse_extensions,
+        metavar='PROFİL|LİSTE',
+        help=f'Markdown extension profili ({", ".join(EXTENSION_PROFILES)}) veya virgülle '
+             f'ayrılmış extension listesi (varsayılan: {DEFAULT_EXTENSION_PROFILE})'
+    )
+    
+    parser.add_argument(
+        '--time-extensions',
+        action='store_true',
+        help='PDF oluşturmadan her extension\'ın işlemcilerinin belgedeki maliyetini ölç'
+    )
+    
+    parser.add_argument(
+        '--image-dpi',
+        type=int,
+        metavar='DPI',
+        help='Görselleri sayfaya sığacakları en büyük boyuta bu çözünürlükte küçült '
+             've yeniden kodla (ör. 150)'
+    )
+    
+    parser.add_argument(
+        '--image-max-size',
+        type=parse_size_cm,
+        metavar='GxY',
+        help='--image-dpi ile görsellerin basılabileceği en büyük alan, cm olarak '
+             '(ör. 25.7x17; varsayılan: CSS\'in @page boyutu ve kenar boşluklarından hesaplanır)'
+    )
+    
+    parser.add_argument(
+        '--jpeg-quality',
+        type=int,
+        default=85,
+        help='--image-dpi veya --optimize-pdf ile yeniden kodlanan JPEG\'lerin kalitesi (varsayılan: 85)'
+    )
+    
+    parser.add_argument(
+        '--optimize-pdf',
+        action='store_true',
+        help='Görselleri PDF\'e yazarken yeniden sıkıştır ve aynı içerikli görselleri bir kez göm'
+    )
+    
+    parser.add_argument(
+        '--size-report',
+        action='store_true',
+        help='Her PDF\'in boyutunu yaz; --optimize-pdf ile optimizasyon öncesi boyutu da ölçer'
+    )
+    
+    parser.add_argument(
+        '--preload-fonts',
+        nargs='+',
+        metavar='FONT',
+        help='Başlangıçta önceden yüklenecek font aileleri (ör. "DejaVu Sans")'
+    )
+    
+    parser.add_argument(
+        '--split',
+        action='store_true',
+        help='Büyük belgeleri en üst seviye başlıklardan bölüp -j kadar process ile '
+             'paralel render et (pypdf gerekir)'
+    )
+    
+    parser.add_argument(
+        '--profile',
+        nargs='?',
+        const='-',
+        metavar='FILE',
+        help='Her belge için aşama süreleri, bellek, sayfa sayısı ve çıktı boyutunu '
+             'JSON Lines olarak FILE\'a yazar (FILE verilmezse stderr)'
+    )
+    
+    parser.add_argument(
+        '--profile-dump',
+        metavar='DIR',
+        help='Her belge için cProfile istatistiklerini DIR/<ad>-<hash>.prof dosyasına yazar'
+    )
+    
+    parser.add_argument(
+        '--profile-memory',
+        action='store_true',
+        help='--profile kayıtlarına Python heap tepe değerini ekle (her belge tracemalloc '
+             'açıkken ikinci kez dönüştürülür; süreler etkilenmez)'
+    )
+    
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='PDF önbelleğini kullanma, tüm dosyaları yeniden oluştur'
+    )
+    
+    parser.add_argument(
+        '--cache-dir',
+        help=f'Önbellek dizini (varsayılan: {default_cache_dir()})'
+    )
+    
+    parser.add_argument(
+        '--cache-size',
+        type=int,
+        default=DEFAULT_CACHE_SIZE_MB,
+        help=f'Önbelleğin en fazla boyutu, MB (varsayılan: {DEFAULT_CACHE_SIZE_MB})'
+    )
+    
+    args = parser.parse_args()
+    
+    # stdin/stdout ile pipeline kullanımı
+    if '-' in args.input or args.output == '-':
+        sys.exit(_convert_stream(args, parser))
+    
+    # Dosya listesini oluştur
+    md_files = []
+    for pattern in args.input:
+        path = Path(pattern)
+        if path.is_file():
+            md_files.append(path)
+        elif '*' in pattern:
+            # Wildcard desteği
+            import glob
+            md_files.extend([Path(f) for f in glob.glob(pattern) if f.endswith('.md')])
+        else:
+            print(f"Uyarı: Dosya bulunamadı: {pattern}")
+    
+    if not md_files:
+        print("Hata: İşlenecek markdown dosyası bulunamadı!")
+        sys.exit(1)
+    
+    if args.time_extensions:
+        for md_file in md_files:
+            md_content = md_file.read_text(encoding='utf-8')
+            timings, total = time_extensions(md_content, args.extensions, EXTENSION_TIMING_REPEAT)
+            print_extension_timings(str(md_file), timings, total, EXTENSION_TIMING_REPEAT)
+        return
+    
+    # Her dosyayı işle
+    jobs = [
+        (md_file, args.output if len(md_files) == 1 else None)
+        for md_file in md_files
+    ]
+    cache = None
+    if not args.no_cache:
+        cache = OutputCache(args.cache_dir, args.cache_size * 1024 * 1024)
+    converter_options = _converter_options(args, cache)
+    workers = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    failures = []
+    profile = None
+    profile_stream = None
+    if args.split and (args.profile or args.profile_dump):
+        parser.error('--profile ve --profile-dump --split ile kullanılamaz')
+    if args.profile or args.profile_dump:
+        profile = {'dump_dir': args.profile_dump, 'trace_memory': args.profile_memory}
+        if args.profile_dump:
+            Path(args.profile_dump).mkdir(parents=True, exist_ok=True)
+        if args.profile and args.profile != '-':
+            profile_stream = open(args.profile, 'w', encoding='utf-8')
+    
+    if args.split:
+        results = _run_split_jobs(jobs, converter_options, workers)
+    else:
+        results = run_jobs(jobs, converter_options, workers, profile)
+    
+    try:
+        for md_file, result, error, record in results:
+            if error is None:
+                print(f"✓ PDF başarıyla oluşturuldu: {result}")
+                if args.size_report and record is not None and record.get('output_report'):
+                    print(f"  {format_output_report(record['output_report'])}")
+            else:
+                print(f"✗ Hata ({md_file}): {error}")
+                failures.append((md_file, error))
+            if record is not None and args.profile:
+                write_profile_record(record, profile_stream)
+    finally:
+        if profile_stream is not None:
+            profile_stream.close()
+    
+    if cache is not None:
+        cache.evict()
+    
+    # Özet
+    print(f"\nÖzet: {len(jobs) - len(failures)} başarılı, {len(failures)} başarısız")
+    for md_file, error in failures:
+        print(f"  ✗ {md_file}: {error}")
+    
+    if args.watch:
+        watch(jobs, converter_options)
+        return
+    
+    if failures:
+        sys.exit(1)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Markdown to PDF Converter - Asyncio API
+Dönüştürmeleri olay döngüsünü bloklamadan, sınırlı sayıda worker
+process'te çalıştıran asyncio arayüzü
+"""
+
+import os
+import atexit
+import asyncio
+import threading
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+from md_to_pdf import CancellationToken, Converter, ResourceFetcher
+
+
+# Her worker'da tutulacak en fazla Converter sayısı (farklı CSS'ler için)
+MAX_WORKER_CONVERTERS = 8
+
+# Worker process'e ait durum
+_converter_options = {}
+_converters = OrderedDict()
+
+
+def _init_worker(converter_options):
+    """Worker process'in Converter ayarlarını hazırlar"""
+    global _converter_options
+    _converter_options = dict(converter_options)
+    # Aynı worker'daki tüm Converter'lar kaynakları ortak önbellekten alır
+    _converter_options.setdefault('resource_fetcher', ResourceFetcher())
+
+
+def _get_converter(css_key):
+    """CSS'e ait Converter'ı döndürür, gerekirse oluşturur (LRU)"""
+    converter = _converters.get(css_key)
+    if converter is None:
+        css_file_path, _css_mtime, css_string = css_key
+        converter = Converter(css_file_path, css_string, **_converter_options)
+        _converters[css_key] = converter
+        if len(_converters) > MAX_WORKER_CONVERTERS:
+            _converters.popitem(last=False)
+    else:
+        _converters.move_to_end(css_key)
+    return converter
+
+
+def _render_job(source, css_key, title, base_url, cancel_event):
+    """Worker process'te tek bir render işini çalıştırır"""
+    converter = _get_converter(css_key)
+    return converter.render(source, title=title, base_url=base_url, cancel=CancellationToken(cancel_event))
+
+
+def _css_key(css_file_path, css_string):
+    """Worker'daki Converter önbelleğinin anahtarı; CSS dosyası değişince yeni Converter oluşturulur"""
+    css_mtime = None
+    if css_string is None and css_file_path and os.path.exists(css_file_path):
+        css_mtime = os.path.getmtime(css_file_path)
+    return css_file_path, css_mtime, css_string
+
+
+class AsyncConverter:
+    """
+    Render işlerini worker process havuzunda çalıştıran asyncio dönüştürücü
+    
+    Aynı anda en fazla workers kadar belge render edilir; fazlası havuzun
+    kuyruğunda bekler. Bekleyen bir render görevi iptal edildiğinde
+    (task.cancel(), asyncio.wait_for zaman aşımı vb.) iş kuyruktaysa
+    kuyruktan çıkarılır, çalışıyorsa worker'da bir sonraki aşamada veya
+    sayfada durdurulur. Havuz ve iptal için kullanılan Manager ilk render'da
+    başlatılır.
+    """
+    
+    def __init__(self, css_file_path=None, css_string=None, workers=None, converter_options=None):
+        """
+        Args:
+            css_file_path: Varsayılan custom CSS dosyasının yolu (opsiyonel)
+            css_string: Varsayılan CSS kodu (opsiyonel, css_file_path'ten önceliklidir)
+            workers: Aynı anda çalışacak en fazla render sayısı (None ise CPU sayısı)
+            converter_options: Worker'lardaki Converter'lara verilecek ek
+                keyword argümanları (ör. image_optimizer, extensions)
+        """
+        self.css_file_path = css_file_path
+        self.css_string = css_string
+        self.workers = workers or os.cpu_count() or 1
+        self.converter_options = dict(converter_options or {})
+        self._executor = None
+        self._manager = None
+        self._lock = threading.Lock()
+        # Bitmemiş işler ve iptal işaretleri
+        self._pending = {}
+    
+    def _start(self):
+        """Worker havuzunu ve Manager'ı döndürür (ilk kullanımda başlatılır)"""
+        with self._lock:
+            if self._executor is None:
+                self._manager = multiprocessing.Manager()
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    initializer=_init_worker,
+                    initargs=(self.converter_options,)
+                )
+            return self._executor, self._manager
+    
+    def _submit(self, source, css_file_path, css_string, title, base_url):
+        """
+        İşi havuza verir; (future, iptal_işareti) döndürür
+        
+        İptal işareti Manager process'ine gidip gelen bloklayan bir çağrıyla
+        oluşturulur; bu yüzden olay döngüsünden değil, executor'dan çağrılır.
+        """
+        executor, manager = self._executor, self._manager
+        if executor is None:
+            executor, manager = self._start()
+        cancel_event = manager.Event()
+        css_key = _css_key(css_file_path, css_string)
+        future = executor.submit(_render_job, source, css_key, title, base_url, cancel_event)
+        with self._lock:
+            self._pending[future] = cancel_event
+        future.add_done_callback(self._discard)
+        return future, cancel_event
+    
+    def _discard(self, future):
+        with self._lock:
+            self._pending.pop(future, None)
+    
+    async def render(self, source, title='document', base_url=None, css_file_path=None, css_string=None):
+        """
+        Markdown metnini bir worker'da PDF'e çevirir
+        
+        Args:
+            source: Markdown metni (str/bytes) veya read() metodu olan dosya nesnesi
+            title: Belge başlığı (PDF metadata'sında görünür)
+            base_url: Göreli görsel ve bağlantıların çözümleneceği dizin veya URL
+            css_file_path, css_string: Verilirse bu belge için varsayılan CSS yerine kullanılır
+        
+        Returns:
+            PDF içeriği (bytes)
+        """
+        if hasattr(source, 'read'):
+            source = source.read()
+        if css_file_path is None and css_string is None:
+            css_file_path, css_string = self.css_file_path, self.css_string
+        
+        loop = asyncio.get_running_loop()
+        # Havuzun ve Manager'ın başlatılması ve iptal işaretinin oluşturulması
+        # olay döngüsünü bloklamasın
+        submission = loop.run_in_executor(
+            None, self._submit, source, css_file_path, css_string, title, base_url
+        )
+        try:
+            future, cancel_event = await asyncio.shield(submission)
+        except asyncio.CancelledError:
+            # İş yine de havuza verilir; verildiği anda iptal edilir
+            submission.add_done_callback(_cancel_submission)
+            raise
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            # Kuyruktaki iş wrap_future tarafından iptal edilir; çalışan işi worker durdurur
+            future.cancel()
+            loop.run_in_executor(None, cancel_event.set)
+            raise
+    
+    async def render_many(self, sources, base_url=None, css_file_path=None, css_string=None,
+                          return_exceptions=False):
+        """
+        Birden fazla markdown metnini paralel olarak PDF'e çevirir
+        
+        Args:
+            sources: Markdown metinleri veya (metin, başlık) demetleri
+            return_exceptions: True ise hatalar sonuç listesinde döndürülür;
+                False ise ilk hatada kalan işler iptal edilip hata fırlatılır
+        
+        Returns:
+            sources ile aynı sırada PDF içerikleri (bytes)
+        """
+        tasks = []
+        for source in sources:
+            source, title = source if isinstance(source, tuple) else (source, 'document')
+            tasks.append(asyncio.ensure_future(
+                self.render(source, title, base_url, css_file_path, css_string)
+            ))
+        try:
+            return await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+    
+    def close(self):
+        """Bekleyen ve çalışan işleri iptal eder, worker'ları ve Manager'ı kapatır"""
+        with self._lock:
+            executor, manager = self._executor, self._manager
+            self._executor = self._manager = None
+            pending = list(self._pending.items())
+        if executor is None:
+            return
+        for future, cancel_event in pending:
+            future.cancel()
+            cancel_event.set()
+        # Çalışan işler bir sonraki sayfada durur, beklemek uzun sürmez
+        executor.shutdown(wait=True)
+        manager.shutdown()
+    
+    async def aclose(self):
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+
+def _cancel_submission(submission):
+    """Beklenmesi iptal edilen render'ın havuza verilmiş işini iptal eder"""
+    if submission.cancelled() or submission.exception() is not None:
+        return
+    future, cancel_event = submission.result()
+    future.cancel()
+    # Done callback'i olay döngüsünde çalışır; IPC çağrısı executor'da yapılır
+    asyncio.get_running_loop().run_in_executor(None, cancel_event.set)
+
+
+# convert_async ve convert_many_async'in paylaştığı dönüştürücü
+_default_converter = None
+_default_converter_lock = threading.Lock()
+
+
+def default_converter():
+    """
+    Process genelinde paylaşılan AsyncConverter'ı döndürür (varsayılan ayarlarla)
+    
+    Worker'ları ve Manager'ı process kapanırken kapatılır; daha önce
+    bırakmak için close_default_converter() çağrılabilir.
+    """
+    global _default_converter
+    with _default_converter_lock:
+        if _default_converter is None:
+            _default_converter = AsyncConverter()
+        return _default_converter
+
+
+def close_default_converter():
+    """Paylaşılan AsyncConverter'ı kapatır; sonraki convert_async yenisini başlatır"""
+    global _default_converter
+    with _default_converter_lock:
+        converter, _default_converter = _default_converter, None
+    if converter is not None:
+        converter.close()
+
+
+atexit.register(close_default_converter)
+
+
+async def convert_async(source, css_file_path=None, css_string=None, title='document', base_url=None,
+                        converter=None):
+    """
+    Markdown metnini olay döngüsünü bloklamadan PDF'e çevirir
+    
+    Args:
+        source: Markdown metni (str/bytes) veya okunabilir dosya nesnesi
+        css_file_path: Custom CSS dosyasının yolu (opsiyonel)
+        css_string: CSS kodunu string olarak (opsiyonel, css_file_path'ten önceliklidir)
+        title: Belge başlığı
+        base_url: Göreli görsel ve bağlantıların çözümleneceği dizin veya URL
+        converter: Kullanılacak AsyncConverter (None ise paylaşılan dönüştürücü)
+    
+    Returns:
+        PDF içeriği (bytes)
+    """
+    converter = converter or default_converter()
+    return await converter.render(source, title, base_url, css_file_path, css_string)
+
+
+async def convert_many_async(sources, css_file_path=None, css_string=None, base_url=None,
+                             converter=None, return_exceptions=False):
+    """
+    Birden fazla markdown metnini paralel olarak PDF'e çevirir
+    
+    Args:
+        sources: Markdown metinleri veya (metin, başlık) demetleri
+        converter: Kullanılacak AsyncConverter (None ise paylaşılan dönüştürücü)
+        return_exceptions: True ise hatalar sonuç listesinde döndürülür
+    
+    Returns:
+        sources ile aynı sırada PDF içerikleri (bytes)
+    """
+    converter = converter or default_converter()
+    return await converter.render_many(sources, base_url, css_file_path, css_string, return_exceptions)
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Markdown to PDF Converter - Benchmark
+Tekrarlanabilir sentetik markdown belgeleriyle dönüştürme aşamalarını ölçer
+"""
+
+import sys
+import json
+import random
+import struct
+import zlib
+import argparse
+import platform
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import md_to_pdf
+from md_to_pdf import STAGES, Converter, StageTimer, font_registry, stylesheet_registry
+
+
+# Belge türleri ve her boyut için üretilecek birim sayısı
+KINDS = ('prose', 'tables', 'code', 'lists', 'images')
+SIZES = {
+    'small': 1,
+    'medium': 10,
+    'huge': 80,
+}
+
+WORDS = (
+    'markdown pdf belge sayfa başlık paragraf tablo liste kod görsel stil '
+    'dönüştürme yazı içerik örnek metin satır sütun öğe bölüm font renk '
+    'lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod'
+).split()
+
+CODE_SNIPPETS = {
+    'python': 'def topla(a, b):\n    """İki sayıyı toplar"""\n    return a + b\n\nprint(topla({n}, 2))',
+    'javascript': 'function kare(x) {{\n  return x * x;\n}}\nconsole.log(kare({n}));',
+    'bash': 'for i in $(seq 1 {n}); do\n  echo "satır $i"\ndone',
+    'json': '{{\n  "id": {n},\n  "ad": "örnek",\n  "etiketler": ["a", "b"]\n}}',
+}
+
+
+def _sentence(rng, min_words=6, max_words=18):
+    words = [rng.choice(WORDS) for _ in range(rng.randint(min_words, max_words))]
+    return ' '.join(words).capitalize() + '.'
+
+
+def _paragraph(rng):
+    return ' '.join(_sentence(rng) for _ in range(rng.randint(3, 7)))
+
+
+def _png(width, height, seed):
+    """Sıkıştırılması zor (gürültülü) bir RGB PNG üretir"""
+    rng = random.Random(seed)
+    row_size = width * 3
+    # Her satır: filtre türü (0) + rastgele RGB baytları
+    rows = [b'\x00' + rng.getrandbits(8 * row_size).to_bytes(row_size, 'big') for _ in range(height)]
+    
+    def chunk(tag, data):
+        body = tag + data
+        return struct.pack('>I', len(data)) + body + struct.pack('>I', zlib.crc32(body))
+    
+    header = struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0)
+    return (
+        b'\x89PNG\r\n\x1a\n'
+        + chunk(b'IHDR', header)
+        + chunk(b'IDAT', zlib.compress(b''.join(rows), 6))
+        + chunk(b'IEND', b'')
+    )
+
+
+def generate_document(kind, units, seed=0, asset_dir=None):
+    """
+    Sentetik bir markdown belgesi üretir
+    
+    Args:
+        kind: Belge türü (KINDS'tan biri)
+        units: Belgenin büyüklüğünü belirleyen çarpan
+        seed: Rastgele sayı üreteci tohumu (aynı tohum aynı belgeyi üretir)
+        asset_dir: 'images' türü için PNG dosyalarının yazılacağı dizin
+    
+    Returns:
+        Markdown metni
+    """
+    rng = random.Random(f'{kind}-{units}-{seed}')
+    parts = [f'# Benchmark: {kind}\n']
+    
+    if kind == 'prose':
+        for i in range(units * 5):
+            parts.append(f'## Bölüm {i + 1}\n')
+            for _ in range(4):
+                parts.append(_paragraph(rng) + '\n')
+            parts.append(f'> {_sentence(rng)}\n')
+    
+    elif kind == 'tables':
+        for i in range(units * 2):
+            columns = rng.randint(4, 7)
+            parts.append(f'## Tablo {i + 1}\n')
+            parts.append('| ' + ' | '.join(f'Sütun {c + 1}' for c in range(columns)) + ' |')
+            parts.append('|' + '---|' * columns)
+            for _ in range(40):
+                cells = [
+                    str(rng.randint(0, 10 ** 6)) if rng.random() < 0.5 else rng.choice(WORDS)
+                    for _ in range(columns)
+                ]
+                parts.append('| ' + ' | '.join(cells) + ' |')
+            parts.append('')
+    
+    elif kind == 'code':
+        languages = sorted(CODE_SNIPPETS)
+        for i in range(units * 25):
+            language = rng.choice(languages)
+            snippet = CODE_SNIPPETS[language].format(n=i)
+            parts.append(f'Örnek {i + 1}: {_sentence(rng, 4, 8)}\n')
+            parts.append(f'```{language}\n{snippet}\n```\n')
+    
+    elif kind == 'lists':
+        for i in range(units * 5):
+            parts.append(f'## Liste {i + 1}\n')
+            for depth in range(6):
+                indent = '    ' * depth
+                for item in range(3):
+                    marker = f'{item + 1}.' if depth % 2 else '-'
+                    parts.append(f'{indent}{marker} {_sentence(rng, 3, 8)}')
+            parts.append('')
+    
+    elif kind == 'images':
+        if asset_dir is None:
+            raise ValueError("'images' türü için asset_dir gerekli")
+        asset_dir = Path(asset_dir)
+        asset_dir.mkdir(parents=True, exist_ok=True)
+        for i in range(units * 3):
+            # Belgeler arasında tekrar kullanılan görseller de olsun
+            image_id = rng.randint(0, min(units * 2, 40))
+            image_path = asset_dir / f'image-{image_id}.png'
+            if not image_path.exists():
+                image_path.write_bytes(_png(1200, 800, image_id))
+            parts.append(f'## Görsel {i + 1}\n')
+            parts.append(_paragraph(rng) + '\n')
+            parts.append(f'![Görsel {i + 1}]({image_path.resolve().as_uri()})\n')
+    
+    else:
+        raise ValueError(f'Bilinmeyen belge türü: {kind}')
+    
+    return '\n'.join(parts) + '\n'
+
+
+def run_benchmark(kinds=KINDS, sizes=tuple(SIZES), repeat=3, seed=0, css_file_path=None):
+    """
+    Her (tür, boyut) belgesini repeat kez dönüştürür ve aşama sürelerini ölçer
+    
+    Her tekrarda yeni bir Converter kullanılır, kod renklendirme önbelleği
+    kapatılır, paylaşılan FontRegistry ve StylesheetRegistry boşaltılır;
+    böylece renklendirme, font yükleme ve CSS ayrıştırma her seferinde
+    baştan ölçülür. Fontconfig'in process genelindeki kendi önbelleği
+    boşaltılamaz, bu yüzden ilk tekrar diskteki font dosyalarını okumayı
+    da içerebilir. Sonuç olarak ortanca süreler raporlanır.
+    """
+    results = []
+    with tempfile.TemporaryDirectory() as asset_dir:
+        for kind in kinds:
+            for size in sizes:
+                md_content = generate_document(kind, SIZES[size], seed, asset_dir)
+                runs = []
+                for _ in range(repeat):
+                    # Önceki tekrarın yüklediği fontlar ve ayrıştırdığı CSS
+                    # 'css' ve 'layout' aşamalarını kısaltmasın
+                    font_registry().clear()
+                    stylesheet_registry().clear()
+                    timer = StageTimer()
+                    # Paylaşılan renklendirme önbelleği ikinci tekrardan itibaren isabet ölçtürür
+                    converter = Converter(css_file_path, highlight_cache=False)
+                    pdf = converter.render(md_content, title=f'{kind}-{size}', timer=timer)
+                    runs.append((timer, len(pdf)))
+                
+                stages = {
+                    stage: statistics.median(timer.stages.get(stage, 0.0) for timer, _ in runs)
+                    for stage in STAGES
+                }
+                result = {
+                    'kind': kind,
+                    'size': size,
+                    'markdown_bytes': len(md_content.encode('utf-8')),
+                    'pdf_bytes': runs[-1][1],
+                    'pages': runs[-1][0].info.get('pages'),
+                    'stages': stages,
+                    'total': statistics.median(timer.total for timer, _ in runs),
+                }
+                results.append(result)
+                print(
+                    f"{kind:>7} {size:>6}: {result['total']:.3f} sn "
+                    f"({result['pages']} sayfa)",
+                    file=sys.stderr
+                )
+    return results
+
+
+def environment_info():
+    """Sonuçları karşılaştırırken gereken sürüm bilgilerini döndürür"""
+    import markdown
+    import pygments
+    import weasyprint
+    
+    return {
+        'md_to_pdf': md_to_pdf.__version__,
+        'weasyprint': weasyprint.__version__,
+        'markdown': markdown.__version__,
+        'pygments': pygments.__version__,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+
+
+def compare(baseline, current):
+    """İki benchmark sonucunu karşılaştırıp tablo olarak yazdırır"""
+    old = {(r['kind'], r['size']): r for r in baseline['results']}
+    print(f"{'belge':<15} {'aşama':<8} {'önce':>9} {'sonra':>9} {'oran':>7}")
+    for result in current['results']:
+        key = (result['kind'], result['size'])
+        if key not in old:
+            continue
+        rows = [(stage, old[key]['stages'].get(stage, 0.0), result['stages'][stage]) for stage in STAGES]
+        rows.append(('toplam', old[key]['total'], result['total']))
+        for stage, before, after in rows:
+            ratio = after / before if before else float('nan')
+            print(f"{key[0] + '/' + key[1]:<15} {stage:<8} {before:>9.4f} {after:>9.4f} {ratio:>6.2f}x")
+
+
+def main(argv=None):
+    """Komut satırı arayüzü"""
+    parser = argparse.ArgumentParser(
+        description='Dönüştürme aşamalarını sentetik belgelerle ölçer',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Örnekler:
+  %(prog)s -o bench.json
+  %(prog)s --kinds code tables --sizes small medium --repeat 5
+  %(prog)s -o yeni.json --compare eski.json
+        """
+    )
+    parser.add_argument('-o', '--output', default='bench_results.json', help='Sonuç JSON dosyası')
+    parser.add_argument('--kinds', nargs='+', choices=KINDS, default=list(KINDS), help='Belge türleri')
+    parser.add_argument('--sizes', nargs='+', choices=list(SIZES), default=list(SIZES), help='Belge boyutları')
+    parser.add_argument('--repeat', type=int, default=3, help='Her belge için tekrar sayısı (varsayılan: 3)')
+    parser.add_argument('--seed', type=int, default=0, help='Corpus tohumu (varsayılan: 0)')
+    parser.add_argument('-c', '--css', help='Custom CSS dosyasının yolu')
+    parser.add_argument('--compare', help='Karşılaştırılacak önceki sonuç JSON dosyası')
+    
+    args = parser.parse_args(argv)
+    
+    data = {
+        'environment': environment_info(),
+        'settings': {'repeat': args.repeat, 'seed': args.seed, 'css': args.css},
+        'results': run_benchmark(args.kinds, args.sizes, args.repeat, args.seed, args.css),
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    print(f"✓ Sonuçlar yazıldı: {args.output}", file=sys.stderr)
+    
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            compare(json.load(f), data)
+
+
+if __name__ == '__main__':
+    main()
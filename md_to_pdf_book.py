@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Markdown to PDF Converter - Kitap Modu
+Sıralı markdown dosyalarını (veya SUMMARY.md benzeri bir dizin dosyasını)
+içindekiler tablosu, yer imleri ve sürekli sayfa numaralarıyla tek bir
+PDF'te birleştirir
+"""
+
+import os
+import re
+import sys
+import html
+import shutil
+import argparse
+import tempfile
+from pathlib import Path
+from urllib.parse import urljoin, urlsplit
+
+from md_to_pdf import Converter, OutputOptimizer, ResourceFetcher, path_to_base_url
+
+
+# SUMMARY.md içindeki bölüm bağlantıları: [Başlık](bolum.md)
+SUMMARY_LINK_RE = re.compile(r'\[[^\]]*\]\(\s*<?([^)\s>]+\.md)>?\s*\)')
+SUMMARY_TITLE_RE = re.compile(r'^#\s+(.+?)\s*#*\s*$', re.MULTILINE)
+
+ID_RE = re.compile(r'(?<![\w-])id="([^"]*)"')
+URL_ATTRIBUTE_RE = re.compile(r'(?<![\w-])(src|href)="([^"]*)"')
+HEADING_RE = re.compile(r'<h([1-6])\b[^>]*\bid="([^"]*)"[^>]*>(.*?)</h\1>', re.DOTALL)
+TAG_RE = re.compile(r'<[^>]+>')
+
+# Kitap düzeni: içindekiler ayrı sayfada, her bölüm yeni sayfada başlar
+BOOK_CSS = """
+nav.book-toc {
+    break-after: page;
+}
+
+nav.book-toc ol {
+    list-style: none;
+    padding-left: 0;
+}
+
+nav.book-toc ol ol {
+    padding-left: 1.5em;
+}
+
+nav.book-toc li {
+    margin: 0.3em 0;
+}
+
+nav.book-toc a {
+    color: inherit;
+    text-decoration: none;
+}
+
+nav.book-toc a::after {
+    content: leader('.') target-counter(attr(href), page);
+}
+
+section.book-chapter {
+    break-before: page;
+}
+"""
+
+
+def read_summary(summary_path):
+    """
+    SUMMARY.md benzeri bir dizin dosyasından bölüm listesini ve başlığı okur
+    
+    Bağlantılar dosyadaki sırayla alınır; yollar dizin dosyasına göre çözülür.
+    
+    Returns:
+        (bölüm_yolları, başlık) demeti; başlık yoksa None
+    """
+    summary_path = Path(summary_path)
+    text = summary_path.read_text(encoding='utf-8')
+    chapters = []
+    for link in SUMMARY_LINK_RE.findall(text):
+        if urlsplit(link).scheme:
+            continue
+        path = (summary_path.parent / link).resolve()
+        if path not in chapters:
+            chapters.append(path)
+    match = SUMMARY_TITLE_RE.search(text)
+    return chapters, match.group(1) if match else None
+
+
+def _strip_tags(value):
+    return html.unescape(TAG_RE.sub('', value)).strip()
+
+
+class Book:
+    """
+    Bölümleri sırayla HTML'e çevirip geçici bir dosyada biriktiren kitap derleyici
+    
+    Her bölümün HTML'i üretildikçe diske yazılır; bütün kitabın metni hiçbir
+    zaman tek bir string olarak bellekte tutulmaz. Bölümlerdeki id'ler
+    bölüm numarasıyla öneklenir, böylece farklı dosyalardaki aynı başlıklar
+    (ve dipnotlar) çakışmaz. Diğer bölümlere verilen bağlantılar (bolum.md
+    veya bolum.md#baslik) kitap içi bağlantılara çevrilir; göreli görsel
+    yolları bölüm dosyasının dizinine göre çözülür.
+    """
+    
+    def __init__(self, chapters, title='book', converter=None, toc_depth=2):
+        """
+        Args:
+            chapters: Sıralı markdown dosyası yolları
+            title: Kitap başlığı (PDF metadata'sında ve içindekiler sayfasında)
+            converter: Kullanılacak Converter (None ise varsayılan ayarlarla oluşturulur)
+            toc_depth: İçindekilere alınacak en derin başlık seviyesi (0 ise içindekiler yok)
+        """
+        self.chapters = [Path(chapter).resolve() for chapter in chapters]
+        self.title = title
+        self.converter = converter or Converter()
+        self.toc_depth = toc_depth
+        self._anchors = {path: f'c{index + 1}' for index, path in enumerate(self.chapters)}
+    
+    def _rewrite(self, html_content, chapter):
+        """Bölüm HTML'indeki id'leri öneklendirir ve bağlantıları kitaba göre çözer"""
+        prefix = self._anchors[chapter]
+        base_url = path_to_base_url(chapter.parent)
+        
+        html_content = ID_RE.sub(lambda m: f'id="{prefix}-{m.group(1)}"', html_content)
+        
+        def rewrite_url(match):
+            attribute, url = match.group(1), html.unescape(match.group(2))
+            if url.startswith('#'):
+                url = f'#{prefix}-{url[1:]}'
+            elif not urlsplit(url).scheme and url:
+                path, _, fragment = url.partition('#')
+                target = (chapter.parent / path).resolve() if path else chapter
+                anchor = self._anchors.get(target)
+                if anchor is not None and attribute == 'href':
+                    url = f'#{anchor}-{fragment}' if fragment else f'#{anchor}'
+                else:
+                    url = urljoin(base_url, url)
+            return f'{attribute}="{html.escape(url)}"'
+        
+        return URL_ATTRIBUTE_RE.sub(rewrite_url, html_content)
+    
+    def _write_chapters(self, body, deduplicator=None):
+        """
+        Bölümleri HTML'e çevirip body dosyasına yazar
+        
+        deduplicator verilirse bölümlerin ortak kullandığı aynı içerikli
+        görseller (ör. her bölüm dizinindeki logo kopyası) tek URL'ye indirgenir.
+        
+        Returns:
+            İçindekiler için (seviye, id, başlık) listesi
+        """
+        headings = []
+        for chapter in self.chapters:
+            with open(chapter, 'r', encoding='utf-8') as f:
+                html_content = self.converter.to_html_body(f.read())
+            html_content = self._rewrite(html_content, chapter)
+            self.converter.prefetch(html_content)
+            if deduplicator is not None:
+                html_content = deduplicator.rewrite(html_content)
+            
+            anchor = self._anchors[chapter]
+            body.write(f'<section class="book-chapter" id="{anchor}">\n')
+            body.write(html_content)
+            body.write('\n</section>\n')
+            
+            for level, heading_id, content in HEADING_RE.findall(html_content):
+                if int(level) <= self.toc_depth:
+                    headings.append((int(level), heading_id, _strip_tags(content)))
+        return headings
+    
+    @staticmethod
+    def _toc_html(headings):
+        """Başlık listesinden iç içe içindekiler listesi oluşturur"""
+        if not headings:
+            return ''
+        parts = ['<nav class="book-toc">\n<h1>İçindekiler</h1>\n']
+        # Açık listelerin seviyeleri; en derin listenin son öğesi her zaman açıktır
+        levels = []
+        for level, heading_id, text in headings:
+            if levels and level <= levels[-1]:
+                parts.append('</li>\n')
+            while levels and level < levels[-1]:
+                parts.append('</ol>\n')
+                levels.pop()
+                # Üst listedeki öğe sadece yeni başlık onun kardeşi veya üstüyse kapanır
+                if levels and level <= levels[-1]:
+                    parts.append('</li>\n')
+            if not levels or level > levels[-1]:
+                parts.append('<ol>\n')
+                levels.append(level)
+            parts.append(f'<li><a href="#{html.escape(heading_id)}">{html.escape(text)}</a>')
+        while levels:
+            parts.append('</li>\n</ol>\n')
+            levels.pop()
+        parts.append('</nav>\n')
+        return ''.join(parts)
+    
+    def write_pdf(self, output_path):
+        """Kitabı PDF olarak output_path'e yazar"""
+        from weasyprint import HTML
+        
+        converter = self.converter
+        head, tail = converter.wrap_html('\0', self.title).split('\0')
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            body_path = os.path.join(tmp_dir, 'body.html')
+            book_path = os.path.join(tmp_dir, 'book.html')
+            deduplicator = converter.image_deduplicator()
+            with open(body_path, 'w', encoding='utf-8') as body:
+                headings = self._write_chapters(body, deduplicator)
+            
+            # İçindekiler bütün başlıklar bilindikten sonra en başa eklenir
+            with open(book_path, 'w', encoding='utf-8') as book:
+                book.write(head)
+                if self.toc_depth:
+                    book.write(self._toc_html(headings))
+                with open(body_path, 'r', encoding='utf-8') as body:
+                    shutil.copyfileobj(body, book)
+                book.write(tail)
+            os.remove(body_path)
+            
+            try:
+                stylesheets = converter.stylesheets(BOOK_CSS)
+                converter.fit_images_to(stylesheets, key=BOOK_CSS)
+                document = HTML(
+                    filename=book_path,
+                    encoding='utf-8',
+                    base_url=path_to_base_url(self.chapters[0].parent),
+                    url_fetcher=converter.url_fetcher
+                ).render(
+                    stylesheets=stylesheets,
+                    font_config=converter.font_config
+                )
+                document.write_pdf(output_path, **converter.write_options)
+            except Exception as e:
+                raise RuntimeError(f"PDF oluşturulurken hata oluştu: {e}")
+        return output_path
+
+
+def convert_book(chapters, output_path, title=None, converter_options=None, toc_depth=2):
+    """
+    Sıralı markdown dosyalarını tek bir PDF kitapta birleştirir
+    
+    Args:
+        chapters: Sıralı markdown dosyası yolları
+        output_path: Çıktı PDF dosyasının yolu
+        title: Kitap başlığı (None ise çıktı dosyasının adı)
+        converter_options: Converter'a verilecek keyword argümanları; resource_fetcher
+            verilmezse bölümlerin görselleri için bir ResourceFetcher oluşturulur
+        toc_depth: İçindekilere alınacak en derin başlık seviyesi (0 ise içindekiler yok)
+    
+    Returns:
+        Oluşturulan PDF dosyasının yolu (Path)
+    """
+    output_path = Path(output_path)
+    if not chapters:
+        raise ValueError("Kitap için en az bir bölüm gerekli")
+    for chapter in chapters:
+        if not Path(chapter).exists():
+            raise FileNotFoundError(f"Markdown dosyası bulunamadı: {chapter}")
+    
+    converter_options = dict(converter_options or {})
+    # Bölümlerin kaynakları yerleşimden önce paralel indirilir, ortak görseller bir kez okunur
+    converter_options.setdefault('resource_fetcher', ResourceFetcher())
+    converter = Converter(**converter_options)
+    book = Book(chapters, title or output_path.stem, converter, toc_depth)
+    return book.write_pdf(output_path)
+
+
+def main(argv=None):
+    """Komut satırı arayüzü: md_to_pdf.py book [dosyalar] -o kitap.pdf"""
+    parser = argparse.ArgumentParser(
+        prog='md_to_pdf.py book',
+        description='Markdown dosyalarını içindekiler ve sürekli sayfa numaralarıyla tek PDF\'te birleştirir',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Örnekler:
+  %(prog)s giris.md bolum1.md bolum2.md -o kitap.pdf
+  %(prog)s --summary SUMMARY.md -o kitap.pdf -c kitap.css
+        """
+    )
+    parser.add_argument('chapters', nargs='*', help='Sıralı bölüm dosyaları')
+    parser.add_argument('--summary', help='Bölüm sırasını belirleyen dizin dosyası (ör. SUMMARY.md)')
+    parser.add_argument('-o', '--output', required=True, help='Çıktı PDF dosyasının yolu')
+    parser.add_argument('-c', '--css', help='Custom CSS dosyasının yolu')
+    parser.add_argument('--title', help='Kitap başlığı (varsayılan: dizin dosyasındaki başlık veya çıktı adı)')
+    parser.add_argument(
+        '--toc-depth',
+        type=int,
+        default=2,
+        help='İçindekilere alınacak en derin başlık seviyesi, 0 = içindekiler yok (varsayılan: 2)'
+    )
+    parser.add_argument(
+        '--optimize-pdf',
+        action='store_true',
+        help='Görselleri yeniden sıkıştır ve bölümlerde tekrarlanan görselleri bir kez göm'
+    )
+    
+    args = parser.parse_args(argv)
+    
+    chapters = list(args.chapters)
+    title = args.title
+    if args.summary:
+        try:
+            summary_chapters, summary_title = read_summary(args.summary)
+        except OSError as e:
+            print(f"Hata: Dizin dosyası okunamadı: {e}", file=sys.stderr)
+            sys.exit(1)
+        chapters += summary_chapters
+        title = title or summary_title
+    if not chapters:
+        parser.error('bölüm dosyaları veya --summary gerekli')
+    
+    converter_options = {'css_file_path': args.css}
+    if args.optimize_pdf:
+        converter_options['output_optimizer'] = OutputOptimizer()
+    try:
+        output_path = convert_book(chapters, args.output, title, converter_options, args.toc_depth)
+    except Exception as e:
+        print(f"✗ Hata: {e}", file=sys.stderr)
+        sys.exit(1)
+    print(f"✓ PDF başarıyla oluşturuldu: {output_path} ({len(chapters)} bölüm)")
+
+
+if __name__ == '__main__':
+    main()
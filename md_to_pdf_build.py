@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Markdown to PDF Converter - Dizin Derleme
+Bir kaynak dizindeki tüm markdown dosyalarını çıktı dizinine aynı yapıda
+PDF olarak derler; sadece bağımlılıkları değişen belgeler yeniden oluşturulur
+"""
+
+import os
+import sys
+import json
+import hashlib
+import argparse
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+import md_to_pdf
+from md_to_pdf import (
+    EXTENSION_PROFILES, Converter, ResourceFetcher, load_css, parse_extensions, resolve_extensions
+)
+
+
+# Çıktı dizininde tutulan bağımlılık kaydı
+MANIFEST_NAME = '.md_to_pdf-manifest.json'
+MANIFEST_VERSION = 1
+
+# Worker process'e ait Converter
+_converter = None
+
+
+def _init_worker(converter_options):
+    """Process'e ait Converter örneğini hazırlar"""
+    global _converter
+    _converter = Converter(**converter_options)
+
+
+def _file_hash(path):
+    """Dosyanın sha256 hash'ini döndürür"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _dependency_record(path):
+    """Bağımlılığın değişip değişmediğini anlamak için gereken bilgileri döndürür"""
+    stat = os.stat(path)
+    return {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'sha256': _file_hash(path)}
+
+
+def _local_paths(urls):
+    """
+    file:// URL'lerini dosya yollarına çevirir; uzak kaynaklar atlanır
+    
+    Henüz olmayan dosyalar da döndürülür; sonradan eklendiklerinde belge
+    yeniden derlenir.
+    """
+    paths = []
+    for url in urls:
+        parts = urlsplit(url)
+        if parts.scheme == 'file':
+            paths.append(unquote(parts.path))
+    return paths
+
+
+def _build_job(job):
+    """
+    Tek bir belgeyi derler ve bağımlılıklarını kaydeder
+    
+    Returns:
+        (çıktı_anahtarı, manifest_kaydı, hata_mesajı) demeti
+    """
+    source, output, output_key, css_file_path = job
+    try:
+        output = Path(output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        _converter.convert(source, output)
+        dependencies = [str(Path(source).resolve())]
+        if css_file_path:
+            dependencies.append(str(Path(css_file_path).resolve()))
+        dependencies += _local_paths(_converter.resources)
+        entry = {
+            'source': str(source),
+            # Olmayan bağımlılıklar None olarak kaydedilir
+            'dependencies': {
+                path: _dependency_record(path) if os.path.isfile(path) else None
+                for path in dict.fromkeys(dependencies)
+            },
+        }
+        return output_key, entry, None
+    except Exception as e:
+        return output_key, None, str(e)
+
+
+class Builder:
+    """
+    Kaynak dizini çıktı dizinine derleyen, bağımlılık takipli derleyici
+    
+    Her çıktının bağımlılıkları (markdown dosyası, CSS dosyası ve başvurulan
+    yerel görseller/stylesheet'ler) çıktı dizinindeki manifest dosyasına
+    yazılır. Sonraki derlemelerde sadece bağımlılıklarından biri değişen
+    belgeler yeniden oluşturulur; kaynağı silinen belgelerin çıktıları
+    silinir. Derlenemeyen belgenin önceki çıktısı diskte kalır ve manifest'te
+    başarısız olarak işaretlenir; sonraki derlemede yeniden denenir ve kaynağı
+    silinirse çıktısı da silinir. Bir bağımlılığın mtime veya boyutu değiştiğinde içerik hash'i
+    karşılaştırılır, böylece sadece dokunulan dosyalar yeniden derlenmez.
+    """
+    
+    def __init__(self, src_dir, out_dir, css_file_path=None, workers=1, force=False, extensions=None):
+        self.src_dir = Path(src_dir)
+        self.out_dir = Path(out_dir)
+        self.css_file_path = css_file_path
+        self.extensions = resolve_extensions(extensions)
+        self.workers = workers
+        self.force = force
+        self.manifest_path = self.out_dir / MANIFEST_NAME
+        # Son derlemede güncel olduğu için atlanan belge sayısı
+        self.skipped = 0
+        # Ayarlar değişirse tüm belgeler yeniden derlenir
+        self.settings = hashlib.sha256(
+            '\0'.join([
+                md_to_pdf.__version__,
+                str(Path(css_file_path).resolve()) if css_file_path else '',
+                load_css(css_file_path),
+                ','.join(self.extensions),
+            ]).encode('utf-8')
+        ).hexdigest()
+    
+    def sources(self):
+        """Kaynak dizindeki markdown dosyalarını (gizli dizinler hariç) döndürür"""
+        sources = []
+        for root, dirs, files in os.walk(self.src_dir):
+            dirs[:] = sorted(d for d in dirs if not d.startswith('.'))
+            root = Path(root)
+            if root.resolve() == self.out_dir.resolve():
+                dirs[:] = []
+                continue
+            sources.extend(root / name for name in sorted(files) if name.endswith('.md'))
+        return sources
+    
+    def output_key(self, source):
+        """Kaynağın çıktı dizinine göre göreli PDF yolu"""
+        return source.relative_to(self.src_dir).with_suffix('.pdf').as_posix()
+    
+    def load_manifest(self):
+        """
+        Önceki derlemenin manifest'ini okur
+        
+        Returns:
+            (çıktılar, ayarlar_aynı_mı) demeti
+        """
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}, False
+        if manifest.get('version') != MANIFEST_VERSION:
+            return {}, False
+        return manifest.get('outputs', {}), manifest.get('settings') == self.settings
+    
+    def save_manifest(self, outputs):
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        data = {'version': MANIFEST_VERSION, 'settings': self.settings, 'outputs': outputs}
+        fd, tmp_path = tempfile.mkstemp(dir=self.out_dir, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=1, ensure_ascii=False, sort_keys=True)
+        os.replace(tmp_path, self.manifest_path)
+    
+    @staticmethod
+    def is_up_to_date(entry, output):
+        """
+        Çıktı var ve hiçbir bağımlılığı değişmemişse True döndürür
+        
+        mtime'ı değişen ama içeriği aynı kalan bağımlılıkların kaydı yerinde
+        güncellenir. Derlemede olmayan bir bağımlılığın (ör. henüz eklenmemiş
+        bir görsel) ortaya çıkması da değişiklik sayılır. Başarısız olarak
+        işaretlenmiş kayıtlar hiçbir zaman güncel değildir.
+        """
+        if entry is None or entry.get('failed') or not output.exists():
+            return False
+        for path, record in entry['dependencies'].items():
+            if record is None:
+                if os.path.exists(path):
+                    return False
+                continue
+            try:
+                stat = os.stat(path)
+            except OSError:
+                return False
+            if stat.st_mtime_ns == record['mtime_ns'] and stat.st_size == record['size']:
+                continue
+            if stat.st_size != record['size'] or _file_hash(path) != record['sha256']:
+                return False
+            record['mtime_ns'] = stat.st_mtime_ns
+        return True
+    
+    def build(self):
+        """
+        Derlemeyi çalıştırır
+        
+        Yields:
+            (durum, yol, hata_mesajı) demetleri; durum 'built', 'failed' veya 'removed'
+        """
+        if not self.src_dir.is_dir():
+            raise FileNotFoundError(f"Kaynak dizin bulunamadı: {self.src_dir}")
+        
+        previous, same_settings = self.load_manifest()
+        rebuild_all = self.force or not same_settings
+        outputs = {}
+        jobs = []
+        self.skipped = 0
+        sources = self.sources()
+        for source in sources:
+            key = self.output_key(source)
+            output = self.out_dir / key
+            entry = previous.get(key)
+            if not rebuild_all and self.is_up_to_date(entry, output):
+                outputs[key] = entry
+                self.skipped += 1
+            else:
+                jobs.append((str(source), str(output), key, self.css_file_path))
+        
+        try:
+            # Kaynağı silinen belgelerin çıktılarını temizle
+            out_dir = self.out_dir.resolve()
+            for key in sorted(set(previous) - {self.output_key(source) for source in sources}):
+                output = self.out_dir / key
+                # Bozuk veya elle düzenlenmiş manifest çıktı dizini dışındaki dosyaları sildirmesin
+                if out_dir not in output.resolve().parents:
+                    continue
+                try:
+                    output.unlink()
+                except FileNotFoundError:
+                    pass
+                self._remove_empty_dirs(output.parent)
+                yield 'removed', output, None
+            
+            sources_by_key = {key: source for source, _output, key, _css in jobs}
+            for key, entry, error in self._run(jobs):
+                output = self.out_dir / key
+                if entry is not None:
+                    outputs[key] = entry
+                    yield 'built', output, None
+                else:
+                    if output.exists():
+                        # Önceki çıktı kaldığı sürece takip edilir; kaynağı silinirse temizlenir
+                        outputs[key] = {'source': sources_by_key[key], 'failed': True, 'dependencies': {}}
+                    yield 'failed', output, error
+        finally:
+            # Yarıda kesilen derlemeler de tamamlanan belgeleri kaydeder
+            self.save_manifest(outputs)
+    
+    def _run(self, jobs):
+        converter_options = {
+            'css_file_path': self.css_file_path,
+            'extensions': self.extensions,
+            # Belgelerin ortak kullandığı logo, diyagram vb. kaynaklar bir kez indirilir
+            'resource_fetcher': ResourceFetcher(),
+        }
+        if self.workers <= 1 or len(jobs) <= 1:
+            _init_worker(converter_options)
+            for job in jobs:
+                yield _build_job(job)
+            return
+        
+        with ProcessPoolExecutor(
+            max_workers=min(self.workers, len(jobs)),
+            initializer=_init_worker,
+            initargs=(converter_options,)
+        ) as executor:
+            futures = {executor.submit(_build_job, job): job for job in jobs}
+            for future in as_completed(futures):
+                try:
+                    yield future.result()
+                except Exception as e:
+                    # Worker process'in kendisi çökerse (ör. BrokenProcessPool)
+                    yield futures[future][2], None, str(e)
+    
+    def _remove_empty_dirs(self, directory):
+        """Çıktı dizinine kadar boş kalan üst dizinleri siler"""
+        out_dir = self.out_dir.resolve()
+        directory = directory.resolve()
+        while directory != out_dir and out_dir in directory.parents:
+            try:
+                directory.rmdir()
+            except OSError:
+                return
+            directory = directory.parent
+
+
+def main(argv=None):
+    """Komut satırı arayüzü: md_to_pdf.py build SRC_DIR OUT_DIR [seçenekler]"""
+    parser = argparse.ArgumentParser(
+        prog='md_to_pdf.py build',
+        description='Bir dizindeki markdown dosyalarını aynı yapıda PDF olarak derler',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Örnekler:
+  %(prog)s docs/ pdf/
+  %(prog)s docs/ pdf/ -c custom.css -j 8
+  %(prog)s docs/ pdf/ --force
+  %(prog)s docs/ pdf/ --extensions fast
+        """
+    )
+    parser.add_argument('src_dir', help='Markdown dosyalarının bulunduğu dizin')
+    parser.add_argument('out_dir', help='PDF dosyalarının yazılacağı dizin')
+    parser.add_argument('-c', '--css', help='Custom CSS dosyasının yolu')
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=1,
+        help='Paralel çalışacak process sayısı (varsayılan: 1, 0 = CPU sayısı)'
+    )
+    parser.add_argument(
+        '--extensions',
+        type=parse_extensions,
+        metavar='PROFİL|LİSTE',
+        help=f'Markdown extension profili ({", ".join(EXTENSION_PROFILES)}) veya virgülle ayrılmış extension listesi'
+    )
+    parser.add_argument('--force', action='store_true', help='Güncel olanlar dahil tüm belgeleri yeniden derle')
+    
+    args = parser.parse_args(argv)
+    workers = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    builder = Builder(args.src_dir, args.out_dir, args.css, workers, args.force, args.extensions)
+    
+    built = failed = removed = 0
+    try:
+        for status, path, error in builder.build():
+            if status == 'built':
+                built += 1
+                print(f"✓ {path}")
+            elif status == 'removed':
+                removed += 1
+                print(f"- {path}")
+            else:
+                failed += 1
+                print(f"✗ Hata ({path}): {error}", file=sys.stderr)
+    except FileNotFoundError as e:
+        print(f"Hata: {e}", file=sys.stderr)
+        sys.exit(1)
+    
+    print(f"\nÖzet: {built} derlendi, {builder.skipped} güncel, {removed} silindi, {failed} başarısız")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
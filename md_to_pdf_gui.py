@@ -10,30 +10,148 @@ from tkinter import ttk, filedialog, messagebox, scrolledtext
 from pathlib import Path
 import threading
 import os
+import base64
+import shutil
 import subprocess
 import platform
+import queue
 import tempfile
-from md_to_pdf import convert_md_to_pdf, get_default_css
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from md_to_pdf import (
+    CancellationToken, ConversionCancelled, Converter, get_default_css, warm_fonts, warm_up
+)
+
+
+# Önizleme sayfalarının çözünürlüğü (DPI)
+PREVIEW_DPI = 50
+
+# Son tuşa basıldıktan sonra önizleme başlamadan önce beklenecek süre (ms)
+PREVIEW_DEBOUNCE_MS = 500
+
+# Önizlemede sayfalar arası boşluk (piksel)
+PREVIEW_PAGE_GAP = 10
+
+# Önizleme sayfaları pdftoppm ile çizilir; bulunamazsa panelde gösterilecek mesaj
+PDFTOPPM_MISSING_MESSAGE = "Önizleme için pdftoppm (poppler-utils) gerekli"
+
+# İş kuyruğunun durum güncelleme aralığı (ms)
+QUEUE_POLL_MS = 250
+
+# Olay kanalının boşaltılma aralığı (ms) ve bir seferde işlenecek en fazla olay
+EVENT_POLL_MS = 50
+MAX_EVENTS_PER_TICK = 500
+
+# Log alanında tutulacak en fazla satır
+LOG_MAX_LINES = 2000
+
+# Worker process'e ait Converter
+_worker_converter = None
+
+
+def _init_worker(converter_options):
+    """Worker process'e ait Converter örneğini hazırlar"""
+    global _worker_converter
+    _worker_converter = Converter(**converter_options)
+
+
+def _job_control(item, cancel_event, progress_queue):
+    """
+    İşin ilerlemesini arayüze ileten on_progress ve iptal token'ını oluşturur
+    
+    cancel_event ve progress_queue ana process'teki Manager'a ait
+    nesnelerdir; ilerleme (item, aşama, bilgi) olarak kuyruğa yazılır.
+    """
+    def on_progress(stage, info):
+        progress_queue.put((item, stage, info))
+    return {'on_progress': on_progress, 'cancel': CancellationToken(cancel_event)}
+
+
+def _convert_file_job(md_file, output_file, item, cancel_event, progress_queue):
+    """Worker process'te bir markdown dosyasını dönüştürür"""
+    control = _job_control(item, cancel_event, progress_queue)
+    return str(_worker_converter.convert(md_file, output_file, **control))
+
+
+def _render_text_job(md_content, output_file, base_url, item, cancel_event, progress_queue):
+    """Worker process'te yapıştırılan markdown içeriğini dönüştürür"""
+    control = _job_control(item, cancel_event, progress_queue)
+    return str(_worker_converter.render(md_content, output_file, Path(output_file).stem, base_url=base_url, **control))
+
+
+def rasterize_pdf(pdf_path, dpi=PREVIEW_DPI, pdftoppm=None):
+    """
+    PDF sayfalarını pdftoppm (poppler-utils) ile PNG'ye çevirir
+    
+    Args:
+        pdftoppm: pdftoppm programının yolu (None ise PATH'te aranır)
+    
+    Returns:
+        Sayfa sırasıyla PNG içeriklerinin (bytes) listesi
+    """
+    pdftoppm = pdftoppm or shutil.which('pdftoppm')
+    if pdftoppm is None:
+        raise RuntimeError(PDFTOPPM_MISSING_MESSAGE)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        subprocess.run(
+            [pdftoppm, '-png', '-r', str(dpi), str(pdf_path), os.path.join(tmp_dir, 'page')],
+            check=True,
+            capture_output=True
+        )
+        # pdftoppm sayfa numaralarını aynı genişlikte sıfırla doldurur
+        return [path.read_bytes() for path in sorted(Path(tmp_dir).glob('page*.png'))]
 
 
 class MarkdownToPDFGUI:
     def __init__(self, root):
         self.root = root
         self.root.title("Markdown to PDF Converter 📄")
-        self.root.geometry("900x900")
+        self.root.geometry("1400x900")
         self.root.resizable(True, True)
         
         # Değişkenler
         self.md_file_path = tk.StringVar()
+        # Dosya seçme penceresinde seçilen dosyalar ve alanda gösterilen metinleri;
+        # yollar ';' içerebileceğinden alan metni tekrar bölünmez
+        self._md_files = []
+        self._md_files_label = None
         self.md_mode = tk.StringVar(value="file")  # "file" veya "paste"
         self.css_file_path = tk.StringVar()
         self.css_code = tk.StringVar()
         self.css_mode = tk.StringVar(value="file")  # "file" veya "code"
         self.output_file_path = tk.StringVar()
-        self.is_processing = False
         self.css_text_widget = None
         self.md_text_widget = None
         
+        # İş kuyruğu: dönüştürmeler worker process havuzunda paralel çalışır
+        self.worker_count = tk.IntVar(value=min(4, os.cpu_count() or 1))
+        self._executor = None
+        self._executor_key = None
+        # Çalışan işlerin iptali ve ilerlemesi için process'ler arası nesneler
+        self._manager = None
+        self._progress_queue = None
+        self._jobs = {}
+        self._batch = []
+        self._poll_after_id = None
+        
+        # Worker thread'lerin arayüze gönderdiği olaylar; sadece ana thread widget'lara dokunur
+        self._events = queue.Queue()
+        # Canlı önizleme durumu; pdftoppm yoksa önizleme başlangıçta kapatılır,
+        # böylece her tuş vuruşunda boşuna yerleşim ve PDF yazımı yapılmaz
+        self._pdftoppm = shutil.which('pdftoppm')
+        self.preview_enabled = tk.BooleanVar(value=self._pdftoppm is not None)
+        self._preview_after_id = None
+        self._preview_generation = 0
+        self._preview_request = None
+        self._preview_token = None
+        self._preview_condition = threading.Condition()
+        self._preview_worker = None
+        self._preview_converter = None
+        self._preview_converter_key = None
+        self._preview_images = {}
+        self._preview_page_count = 0
+        
         # Stil ayarları
         self.setup_styles()
         
@@ -42,6 +160,23 @@ class MarkdownToPDFGUI:
         
         # Pencereyi ortala
         self.center_window()
+        
+        self.root.after(EVENT_POLL_MS, self._process_events)
+        
+        # Ağır modülleri (WeasyPrint vb.) pencere açıldıktan sonra arka planda yükle
+        self._warm_thread = threading.Thread(target=self._warm_up, daemon=True)
+        self._warm_thread.start()
+        
+        self.schedule_preview()
+    
+    def _warm_up(self):
+        """İlk dönüştürmenin beklemesini azaltmak için modülleri ve fontları önceden yükle"""
+        try:
+            warm_up()
+            warm_fonts()
+        except Exception:
+            # Hata, gerçek dönüştürme sırasında kullanıcıya gösterilecek
+            pass
     
     def setup_styles(self):
         """Modern görünüm için stil ayarları"""
@@ -71,6 +206,7 @@ class MarkdownToPDFGUI:
         self.root.columnconfigure(0, weight=1)
         self.root.rowconfigure(0, weight=1)
         main_frame.columnconfigure(1, weight=1)
+        main_frame.columnconfigure(3, weight=1)
         
         # Başlık
         title_label = ttk.Label(
@@ -161,6 +297,8 @@ class MarkdownToPDFGUI:
         self.md_text_widget.config(foreground='gray')
         self.md_text_widget.bind('<FocusIn>', self._on_md_text_focus_in)
         self.md_text_widget.bind('<FocusOut>', self._on_md_text_focus_out)
+        self.md_text_widget.bind('<KeyRelease>', self.schedule_preview)
+        self.md_text_widget.bind('<<Paste>>', self.schedule_preview, add='+')
         
         # Başlangıçta dosya modunu göster
         self.toggle_md_mode()
@@ -249,6 +387,7 @@ class MarkdownToPDFGUI:
         
         # Varsayılan CSS'i yükle
         self.css_text_widget.insert('1.0', get_default_css())
+        self.css_text_widget.bind('<KeyRelease>', self.schedule_preview)
         
         ttk.Button(
             self.css_code_frame,
@@ -302,10 +441,10 @@ class MarkdownToPDFGUI:
         )
         self.convert_button.grid(row=6, column=0, columnspan=3, pady=20)
         
-        # İlerleme çubuğu
+        # İlerleme çubuğu (kuyruktaki işlerin tamamlanan oranı)
         self.progress = ttk.Progressbar(
             main_frame,
-            mode='indeterminate',
+            mode='determinate',
             length=400
         )
         self.progress.grid(row=7, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=10)
@@ -341,6 +480,46 @@ class MarkdownToPDFGUI:
         # Grid ağırlıkları
         css_label_frame.rowconfigure(1, weight=1)
         main_frame.rowconfigure(10, weight=1)
+        
+        self.create_preview_panel(main_frame)
+        self.create_queue_panel(main_frame)
+        
+        # Kaynak dosyalar değişince önizlemeyi yenile
+        for variable in (self.md_file_path, self.css_file_path, self.md_mode, self.css_mode):
+            variable.trace_add('write', self.schedule_preview)
+    
+    def create_preview_panel(self, parent):
+        """Sayfa önizlemelerinin gösterildiği paneli oluştur"""
+        preview_frame = ttk.LabelFrame(parent, text="Önizleme", padding="10")
+        preview_frame.grid(row=1, column=3, rowspan=5, sticky=(tk.W, tk.E, tk.N, tk.S), padx=(20, 0))
+        preview_frame.columnconfigure(0, weight=1)
+        preview_frame.rowconfigure(1, weight=1)
+        
+        preview_toggle = ttk.Checkbutton(
+            preview_frame,
+            text="Canlı önizleme",
+            variable=self.preview_enabled,
+            command=self.schedule_preview
+        )
+        preview_toggle.grid(row=0, column=0, sticky=tk.W, pady=(0, 5))
+        
+        self.preview_status = tk.StringVar(value="")
+        if self._pdftoppm is None:
+            preview_toggle.state(['disabled'])
+            self.preview_status.set(PDFTOPPM_MISSING_MESSAGE)
+        ttk.Label(
+            preview_frame,
+            textvariable=self.preview_status,
+            font=('Helvetica', 8),
+            foreground='gray'
+        ).grid(row=0, column=1, sticky=tk.E, pady=(0, 5))
+        
+        self.preview_canvas = tk.Canvas(preview_frame, background='#808080', highlightthickness=0)
+        self.preview_canvas.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S))
+        
+        scrollbar = ttk.Scrollbar(preview_frame, orient=tk.VERTICAL, command=self.preview_canvas.yview)
+        scrollbar.grid(row=1, column=2, sticky=(tk.N, tk.S))
+        self.preview_canvas.configure(yscrollcommand=scrollbar.set)
     
     def toggle_md_mode(self):
         """Markdown modu değiştiğinde görünümü güncelle"""
@@ -364,8 +543,8 @@ class MarkdownToPDFGUI:
             self.md_text_widget.config(foreground='gray')
     
     def browse_md_file(self):
-        """Markdown dosyası seç"""
-        filename = filedialog.askopenfilename(
+        """Bir veya birden fazla Markdown dosyası seç"""
+        filenames = filedialog.askopenfilenames(
             title="Markdown Dosyası Seç",
             filetypes=[
                 ("Markdown files", "*.md"),
@@ -374,13 +553,33 @@ class MarkdownToPDFGUI:
                 ("All files", "*.*")
             ]
         )
-        if filename:
-            self.md_file_path.set(filename)
+        if not filenames:
+            return
+        self._md_files = list(filenames)
+        self._md_files_label = '; '.join(filenames)
+        self.md_file_path.set(self._md_files_label)
+        if len(filenames) == 1:
             # Otomatik olarak çıktı dosyası yolunu ayarla
             if not self.output_file_path.get():
-                output_path = Path(filename).with_suffix('.pdf')
+                output_path = Path(filenames[0]).with_suffix('.pdf')
                 self.output_file_path.set(str(output_path))
-            self.log_message(f"Markdown dosyası seçildi: {filename}")
+            self.log_message(f"Markdown dosyası seçildi: {filenames[0]}")
+        else:
+            # Birden fazla dosyada her PDF kendi markdown dosyasının yanına yazılır
+            self.output_file_path.set("")
+            self.log_message(f"{len(filenames)} Markdown dosyası seçildi")
+    
+    def selected_md_files(self):
+        """
+        Seçili markdown dosyalarının listesi
+        
+        Alan, seçme penceresinin yazdığı metni gösteriyorsa seçilen dosyalar;
+        kullanıcı alanı elle değiştirdiyse alandaki tek yol döndürülür.
+        """
+        text = self.md_file_path.get()
+        if self._md_files and text == self._md_files_label:
+            return list(self._md_files)
+        return [text.strip()] if text.strip() else []
     
     def browse_css_file(self):
         """CSS dosyası seç"""
@@ -430,30 +629,282 @@ class MarkdownToPDFGUI:
             self.output_file_path.set(filename)
             self.log_message(f"Çıktı dosyası belirlendi: {filename}")
     
+    def create_queue_panel(self, parent):
+        """Dönüştürme işlerinin durumlarını gösteren kuyruk panelini oluştur"""
+        queue_frame = ttk.LabelFrame(parent, text="İş Kuyruğu", padding="10")
+        queue_frame.grid(row=6, column=3, rowspan=5, sticky=(tk.W, tk.E, tk.N, tk.S), padx=(20, 0), pady=(10, 0))
+        queue_frame.columnconfigure(0, weight=1)
+        queue_frame.rowconfigure(0, weight=1)
+        
+        self.queue_tree = ttk.Treeview(
+            queue_frame,
+            columns=('status', 'time'),
+            height=6,
+            selectmode='extended'
+        )
+        self.queue_tree.heading('#0', text="Dosya")
+        self.queue_tree.heading('status', text="Durum")
+        self.queue_tree.heading('time', text="Süre")
+        self.queue_tree.column('#0', width=260)
+        self.queue_tree.column('status', width=130, stretch=False)
+        self.queue_tree.column('time', width=60, stretch=False, anchor=tk.E)
+        self.queue_tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        
+        scrollbar = ttk.Scrollbar(queue_frame, orient=tk.VERTICAL, command=self.queue_tree.yview)
+        scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        self.queue_tree.configure(yscrollcommand=scrollbar.set)
+        
+        buttons = ttk.Frame(queue_frame)
+        buttons.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(5, 0))
+        
+        ttk.Label(buttons, text="Paralel iş:", font=('Helvetica', 9)).pack(side=tk.LEFT)
+        ttk.Spinbox(
+            buttons,
+            from_=1,
+            to=os.cpu_count() or 1,
+            textvariable=self.worker_count,
+            width=4
+        ).pack(side=tk.LEFT, padx=(5, 20))
+        
+        ttk.Button(
+            buttons,
+            text="Seçilenleri İptal Et",
+            command=self.cancel_selected_jobs,
+            style='Browse.TButton'
+        ).pack(side=tk.LEFT, padx=(0, 5))
+        
+        ttk.Button(
+            buttons,
+            text="Bitenleri Temizle",
+            command=self.clear_finished_jobs,
+            style='Browse.TButton'
+        ).pack(side=tk.LEFT)
+    
+    def schedule_preview(self, *args):
+        """Önizlemeyi son değişiklikten PREVIEW_DEBOUNCE_MS sonra yeniden oluştur"""
+        if self._pdftoppm is None:
+            return
+        if self._preview_after_id is not None:
+            self.root.after_cancel(self._preview_after_id)
+        self._preview_after_id = self.root.after(PREVIEW_DEBOUNCE_MS, self._start_preview)
+    
+    def _preview_source(self):
+        """Önizlenecek (markdown, base_url, css_file, css_string) demeti; içerik yoksa None"""
+        if self.md_mode.get() == "file":
+            md_files = self.selected_md_files()
+            if not md_files:
+                return None
+            # Birden fazla dosya seçiliyse ilki önizlenir
+            md_file = md_files[0]
+            try:
+                md_content = Path(md_file).read_text(encoding='utf-8')
+            except (OSError, ValueError):
+                return None
+            base_url = str(Path(md_file).parent)
+        else:
+            md_content = self.md_text_widget.get('1.0', tk.END).strip()
+            if not md_content or md_content.startswith('# Markdown içeriğinizi'):
+                return None
+            base_url = os.getcwd()
+        
+        css_file = None
+        css_string = None
+        if self.css_mode.get() == "code":
+            css_string = self.css_text_widget.get('1.0', tk.END).strip() or None
+        elif self.css_file_path.get() and os.path.isfile(self.css_file_path.get()):
+            css_file = self.css_file_path.get()
+        return md_content, base_url, css_file, css_string
+    
+    def _visible_pages(self):
+        """Önizlemede şu an görünen sayfaların aralığı (ilk, son hariç)"""
+        if not self._preview_page_count:
+            return 0, 2
+        top, bottom = self.preview_canvas.yview()
+        count = self._preview_page_count
+        return int(top * count), min(count, int(bottom * count) + 1)
+    
+    def _start_preview(self):
+        """Güncel içerik için önizleme isteğini arka plan thread'ine ver"""
+        self._preview_after_id = None
+        # Yeni nesil, devam eden eski önizlemeyi geçersiz kılar ve yerleşimini keser
+        self._preview_generation += 1
+        if self._preview_token is not None:
+            self._preview_token.cancel()
+            self._preview_token = None
+        if not self.preview_enabled.get():
+            return
+        source = self._preview_source()
+        if source is None:
+            self._clear_preview()
+            return
+        
+        self._preview_token = CancellationToken()
+        with self._preview_condition:
+            # Henüz başlamamış eski istek varsa yenisiyle değiştirilir
+            self._preview_request = (
+                self._preview_generation, self._preview_token, *source, *self._visible_pages()
+            )
+            self._preview_condition.notify()
+        if self._preview_worker is None:
+            self._preview_worker = threading.Thread(target=self._preview_loop, daemon=True)
+            self._preview_worker.start()
+        self.preview_status.set("Önizleme hazırlanıyor...")
+    
+    def _preview_loop(self):
+        """Önizleme isteklerini sırayla işleyen arka plan thread'i"""
+        while True:
+            with self._preview_condition:
+                while self._preview_request is None:
+                    self._preview_condition.wait()
+                request = self._preview_request
+                self._preview_request = None
+            try:
+                self._render_preview(*request)
+            except ConversionCancelled:
+                pass
+            except Exception as e:
+                self.post_event('preview_error', generation=request[0], error_message=str(e))
+    
+    def _get_preview_converter(self, css_file, css_string):
+        """Önizleme thread'ine ait Converter (dönüştürmeler worker process'lerde kendi Converter'larını kullanır)"""
+        css_mtime = os.path.getmtime(css_file) if css_file else None
+        key = (css_file, css_mtime, css_string)
+        if self._preview_converter is None or self._preview_converter_key != key:
+            self._preview_converter = Converter(css_file, css_string)
+            self._preview_converter_key = key
+        return self._preview_converter
+    
+    def _render_preview(self, generation, token, md_content, base_url, css_file, css_string, first, last):
+        """
+        Belgeyi yerleştirip sayfaları PNG'ye çevirir
+        
+        Önce görünen sayfalar, sonra diğerleri gönderilir. Daha yeni bir
+        istek geldiğinde token iptal edilir; yerleşim bir sonraki sayfada
+        kesilir ve kalan sayfalar çizilmez.
+        """
+        # Paylaşılan font kaydı thread-safe değil. Bu process'te WeasyPrint'i
+        # sadece ısınma thread'i ve bu tek önizleme thread'i kullanır
+        # (dönüştürmeler worker process'lerde çalışır); bu yüzden kilit
+        # gerekmez, ısınmanın bitmesini beklemek yeterlidir.
+        self._warm_thread.join()
+        if token.cancelled:
+            return
+        converter = self._get_preview_converter(css_file, css_string)
+        document = converter.layout(md_content, 'preview', base_url=base_url, cancel=token)
+        
+        count = len(document.pages)
+        visible = list(range(first, min(last, count))) or list(range(min(2, count)))
+        rest = [index for index in range(count) if index not in visible]
+        for pages in (visible, rest):
+            if not pages or token.cancelled:
+                continue
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                pdf_path = os.path.join(tmp_dir, 'preview.pdf')
+                document.copy([document.pages[index] for index in pages]).write_pdf(pdf_path)
+                images = rasterize_pdf(pdf_path, pdftoppm=self._pdftoppm)
+            for index, png in zip(pages, images):
+                self.post_event('preview_page', generation=generation, index=index, count=count, png=png)
+    
+    def _on_preview_page(self, generation, index, count, png):
+        """Bir sayfanın PNG görüntüsünü önizleme paneline yerleştir"""
+        if generation != self._preview_generation:
+            return
+        canvas = self.preview_canvas
+        # Sayfa sayısı azaldıysa fazla sayfaları kaldır
+        for old_index in range(count, self._preview_page_count):
+            canvas.delete(f'page{old_index}')
+            self._preview_images.pop(old_index, None)
+        self._preview_page_count = count
+        
+        image = tk.PhotoImage(data=base64.b64encode(png))
+        self._preview_images[index] = image
+        page_height = image.height() + PREVIEW_PAGE_GAP
+        canvas.delete(f'page{index}')
+        canvas.create_image(
+            max(canvas.winfo_width(), image.width()) // 2,
+            index * page_height + PREVIEW_PAGE_GAP,
+            image=image,
+            anchor=tk.N,
+            tags=(f'page{index}',)
+        )
+        canvas.configure(scrollregion=(0, 0, image.width(), count * page_height + PREVIEW_PAGE_GAP))
+        self.preview_status.set(f"{count} sayfa")
+    
+    def _on_preview_error(self, generation, error_message):
+        """Önizleme hatasını panelde göster"""
+        if generation == self._preview_generation:
+            first_line = (error_message.splitlines() or [""])[0]
+            self.preview_status.set(f"Önizleme hatası: {first_line[:80]}")
+    
+    def _clear_preview(self):
+        """Önizleme panelini boşalt"""
+        self.preview_canvas.delete('all')
+        self._preview_images.clear()
+        self._preview_page_count = 0
+        self.preview_status.set("")
+    
+    def post_event(self, kind, **data):
+        """
+        Arayüze olay gönder; herhangi bir thread'den çağrılabilir
+        
+        Olaylar ana thread'de _process_events tarafından sırayla _on_<kind>
+        metoduna verilir.
+        """
+        self._events.put((kind, data))
+    
     def log_message(self, message):
-        """Log mesajı ekle"""
+        """Log mesajı ekle; herhangi bir thread'den çağrılabilir"""
+        self.post_event('log', message=message)
+    
+    def _process_events(self):
+        """Olay kanalını ana thread'de boşalt; ardışık log satırlarını tek seferde yaz"""
+        log_lines = []
+        try:
+            for _ in range(MAX_EVENTS_PER_TICK):
+                try:
+                    kind, data = self._events.get_nowait()
+                except queue.Empty:
+                    break
+                if kind == 'log':
+                    log_lines.append(data['message'])
+                    continue
+                # Sıra korunsun diye bekleyen loglar önce yazılır
+                if log_lines:
+                    self._append_log(log_lines)
+                    log_lines = []
+                getattr(self, f'_on_{kind}')(**data)
+            if log_lines:
+                self._append_log(log_lines)
+        finally:
+            self.root.after(EVENT_POLL_MS, self._process_events)
+    
+    def _append_log(self, lines):
+        """Log satırlarını ekle, en eski satırları LOG_MAX_LINES sınırına göre sil"""
         self.log_text.config(state=tk.NORMAL)
-        self.log_text.insert(tk.END, f"{message}\n")
+        self.log_text.insert(tk.END, '\n'.join(lines) + '\n')
+        line_count = int(self.log_text.index('end-1c').split('.')[0])
+        if line_count > LOG_MAX_LINES:
+            self.log_text.delete('1.0', f'{line_count - LOG_MAX_LINES + 1}.0')
         self.log_text.see(tk.END)
         self.log_text.config(state=tk.DISABLED)
-        self.root.update_idletasks()
     
     def validate_inputs(self):
         """Girdileri doğrula"""
         # Markdown içeriği kontrolü
         if self.md_mode.get() == "file":
-            if not self.md_file_path.get():
+            if not self.selected_md_files():
                 messagebox.showerror("Hata", "Lütfen bir Markdown dosyası seçin!")
                 return False
             
-            md_path = Path(self.md_file_path.get())
-            if not md_path.exists():
-                messagebox.showerror("Hata", f"Markdown dosyası bulunamadı:\n{md_path}")
-                return False
-            
-            if not md_path.suffix.lower() in ['.md', '.markdown', '.txt']:
-                messagebox.showerror("Hata", "Lütfen geçerli bir Markdown dosyası seçin!")
-                return False
+            for md_file in self.selected_md_files():
+                md_path = Path(md_file)
+                if not md_path.exists():
+                    messagebox.showerror("Hata", f"Markdown dosyası bulunamadı:\n{md_path}")
+                    return False
+                
+                if not md_path.suffix.lower() in ['.md', '.markdown', '.txt']:
+                    messagebox.showerror("Hata", f"Lütfen geçerli bir Markdown dosyası seçin!\n{md_path}")
+                    return False
         else:  # paste mode
             if not self.md_text_widget:
                 messagebox.showerror("Hata", "Markdown içeriği girişi bulunamadı!")
@@ -475,137 +926,282 @@ class MarkdownToPDFGUI:
         return True
     
     def convert_to_pdf(self):
-        """PDF'e dönüştür"""
-        if self.is_processing:
-            messagebox.showwarning("Uyarı", "Dönüştürme işlemi devam ediyor...")
-            return
-        
+        """Seçilen dosyaları veya yapıştırılan içeriği dönüştürme kuyruğuna ekle"""
         if not self.validate_inputs():
             return
         
-        # UI'ı güncelle
-        self.is_processing = True
-        self.convert_button.config(state=tk.DISABLED)
-        self.progress.start()
+        # CSS moduna göre CSS'i belirle
+        css_file = None
+        css_string = None
+        if self.css_mode.get() == "code":
+            css_string = self.css_text_widget.get('1.0', tk.END).strip() or None
+        else:
+            css_file = self.css_file_path.get() or None
+        
+        jobs = []
+        if self.md_mode.get() == "file":
+            md_files = self.selected_md_files()
+            output_file = self.output_file_path.get() or None
+            if len(md_files) > 1 and output_file:
+                self.log_message("Birden fazla dosya seçildi, PDF'ler markdown dosyalarının yanına yazılacak")
+                output_file = None
+            for md_file in md_files:
+                output = output_file or str(Path(md_file).with_suffix('.pdf'))
+                jobs.append((Path(md_file).name, output, _convert_file_job, (md_file, output)))
+        else:
+            md_content = self.md_text_widget.get('1.0', tk.END).strip()
+            # Çıktı dosyası belirlenmemişse varsayılan isim kullan
+            output = self.output_file_path.get() or "output.pdf"
+            jobs.append(("Yapıştırılan içerik", output, _render_text_job, (md_content, output, os.getcwd())))
+        
+        executor = self._get_executor(css_file, css_string)
+        manager = self._get_manager()
+        if not any(self._is_active(job) for job in self._jobs.values()):
+            # Yeni bir toplu iş başlıyor
+            self._batch = []
+            self.log_message("\n" + "="*50)
+        
+        css_label = css_file or (f"Kod olarak girildi ({len(css_string)} karakter)" if css_string else "Varsayılan CSS")
+        self.log_message(f"{len(jobs)} iş kuyruğa eklendi (CSS: {css_label})")
+        for name, output, function, args in jobs:
+            item = self.queue_tree.insert('', tk.END, text=name, values=("Sırada", ""))
+            cancel_event = manager.Event()
+            future = executor.submit(function, *args, item, cancel_event, self._progress_queue)
+            self._jobs[item] = {
+                'name': name,
+                'output': output,
+                'future': future,
+                'cancel': cancel_event,
+                'cancelling': False,
+                'started': None,
+                'finished': False,
+            }
+            self._batch.append(item)
+            # Worker havuzunun thread'inden çağrılır, sonuç olay kanalıyla ana thread'e geçer
+            future.add_done_callback(lambda _future, item=item: self.post_event('job_done', item=item))
+        
         self.status_text.set("Dönüştürülüyor...")
         self.status_label.config(foreground='blue')
-        self.log_message("\n" + "="*50)
-        self.log_message("Dönüştürme işlemi başlatıldı...")
-        
-        # Thread'de çalıştır (UI donmasın diye)
-        thread = threading.Thread(target=self._convert_thread)
-        thread.daemon = True
-        thread.start()
+        self._update_progress()
+        if self._poll_after_id is None:
+            self._poll_after_id = self.root.after(QUEUE_POLL_MS, self._poll_jobs)
     
-    def _convert_thread(self):
-        """Dönüştürme işlemini thread'de çalıştır"""
-        try:
-            # Markdown içeriğini al
-            if self.md_mode.get() == "file":
-                md_file = self.md_file_path.get()
-                output_file = self.output_file_path.get() if self.output_file_path.get() else None
-                self.log_message(f"Kaynak: {md_file}")
-            else:  # paste mode
-                md_content = self.md_text_widget.get('1.0', tk.END).strip()
-                # Geçici dosya oluştur
-                with tempfile.NamedTemporaryFile(mode='w', suffix='.md', delete=False, encoding='utf-8') as tmp_file:
-                    tmp_file.write(md_content)
-                    md_file = tmp_file.name
-                self.log_message(f"Kaynak: Yapıştırılan içerik (geçici dosya: {md_file})")
-                
-                # Çıktı dosyası belirlenmemişse varsayılan isim kullan
-                if not self.output_file_path.get():
-                    output_file = "output.pdf"
-                else:
-                    output_file = self.output_file_path.get()
-            
-            # CSS moduna göre CSS'i belirle
-            css_file = None
-            css_string = None
-            
-            if self.css_mode.get() == "code":
-                # CSS kodunu text widget'tan al
-                if self.css_text_widget:
-                    css_string = self.css_text_widget.get('1.0', tk.END).strip()
-                    if css_string:
-                        self.log_message(f"CSS: Kod olarak girildi ({len(css_string)} karakter)")
-                    else:
-                        self.log_message("CSS: Varsayılan CSS kullanılıyor")
-            else:
-                # CSS dosyasından
-                css_file = self.css_file_path.get() if self.css_file_path.get() else None
-                if css_file:
-                    self.log_message(f"CSS: {css_file}")
-                else:
-                    self.log_message("CSS: Varsayılan CSS kullanılıyor")
-            
-            # Dönüştür
-            result_path = convert_md_to_pdf(md_file, output_file, css_file, css_string)
-            
-            # Geçici dosyayı sil (eğer paste modundaysa)
-            if self.md_mode.get() == "paste" and os.path.exists(md_file):
-                try:
-                    os.unlink(md_file)
-                except:
-                    pass
-            
-            # Başarılı
-            self.root.after(0, self._conversion_success, result_path)
-            
-        except Exception as e:
-            # Geçici dosyayı temizle (hata durumunda)
-            if self.md_mode.get() == "paste" and 'md_file' in locals() and os.path.exists(md_file):
-                try:
-                    os.unlink(md_file)
-                except:
-                    pass
-            # Hata
-            self.root.after(0, self._conversion_error, str(e))
-    
-    def _conversion_success(self, output_path):
-        """Dönüştürme başarılı"""
-        self.is_processing = False
-        self.progress.stop()
-        self.convert_button.config(state=tk.NORMAL)
-        self.status_text.set("✓ Başarılı!")
-        self.status_label.config(foreground='green')
-        self.log_message(f"✓ PDF başarıyla oluşturuldu: {output_path}")
-        self.log_message("="*50 + "\n")
+    def _get_executor(self, css_file, css_string):
+        """
+        Ayarlara ait worker havuzunu döndür
         
-        # Başarı mesajı göster
-        result = messagebox.askyesno(
-            "Başarılı!",
-            f"PDF başarıyla oluşturuldu!\n\n{output_path}\n\nDosyayı açmak ister misiniz?"
-        )
+        CSS veya worker sayısı değiştiyse yeni havuz oluşturulur; eski
+        havuzdaki işler kendi ayarlarıyla bitmeye devam eder.
+        """
+        css_mtime = None
+        if css_file and os.path.exists(css_file):
+            css_mtime = os.path.getmtime(css_file)
+        workers = max(1, self.worker_count.get())
+        key = (css_file, css_mtime, css_string, workers)
+        if self._executor is None or self._executor_key != key:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+            self._executor = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=({'css_file_path': css_file, 'css_string': css_string},)
+            )
+            self._executor_key = key
+        return self._executor
+    
+    def _get_manager(self):
+        """
+        İş iptali ve ilerlemesi için Manager'ı döndür (ilk kullanımda başlatılır)
         
-        if result:
+        Worker'ların yazdığı ilerleme kayıtları bir thread tarafından olay
+        kanalına aktarılır.
+        """
+        if self._manager is None:
+            self._manager = multiprocessing.Manager()
+            self._progress_queue = self._manager.Queue()
+            threading.Thread(target=self._forward_progress, args=(self._progress_queue,), daemon=True).start()
+        return self._manager
+    
+    def _forward_progress(self, progress_queue):
+        """Worker'lardan gelen ilerleme kayıtlarını olay kanalına aktar"""
+        while True:
             try:
-                if platform.system() == 'Darwin':  # macOS
-                    subprocess.call(['open', output_path])
-                elif platform.system() == 'Windows':
-                    os.startfile(output_path)
-                else:  # Linux
-                    subprocess.call(['xdg-open', output_path])
-            except Exception as e:
-                self.log_message(f"Dosya açılırken hata: {e}")
-    
-    def _conversion_error(self, error_message):
-        """Dönüştürme hatası"""
-        self.is_processing = False
-        self.progress.stop()
-        self.convert_button.config(state=tk.NORMAL)
-        self.status_text.set("✗ Hata!")
-        self.status_label.config(foreground='red')
-        self.log_message(f"✗ Hata: {error_message}")
+                record = progress_queue.get()
+            except (EOFError, OSError):
+                # Manager kapatıldı
+                return
+            if record is None:
+                return
+            item, stage, info = record
+            self.post_event('job_progress', item=item, stage=stage, info=info)
+    
+    def _on_job_progress(self, item, stage, info):
+        """Çalışan bir işin aşamasını kuyruk panelinde göster"""
+        job = self._jobs.get(item)
+        if job is None or job['finished'] or job['cancelling']:
+            return
+        if job['started'] is None:
+            job['started'] = time.monotonic()
+        if stage == 'layout' and 'page' in info:
+            status = f"Yerleşim: sayfa {info['page']}"
+        elif stage == 'layout':
+            status = f"{info['pages']} sayfa yerleşti"
+        elif stage == 'write':
+            status = f"Yazılıyor: {info['page']}/{info['pages']}"
+        elif stage == 'done':
+            return
+        else:
+            status = "Dönüştürülüyor..."
+        self.queue_tree.set(item, 'status', status)
+    
+    @staticmethod
+    def _is_active(job):
+        return not job['finished']
+    
+    def _poll_jobs(self):
+        """Çalışan işlerin durumunu ve süresini kuyruk paneline yansıt"""
+        self._poll_after_id = None
+        now = time.monotonic()
+        for item, job in self._jobs.items():
+            if job['finished']:
+                continue
+            if job['future'].running() and job['started'] is None and not job['cancelling']:
+                job['started'] = now
+                self.queue_tree.set(item, 'status', "Dönüştürülüyor...")
+            if job['started'] is not None:
+                self.queue_tree.set(item, 'time', f"{now - job['started']:.1f} sn")
+        
+        if any(self._is_active(job) for job in self._jobs.values()):
+            self._poll_after_id = self.root.after(QUEUE_POLL_MS, self._poll_jobs)
+    
+    def _on_job_done(self, item):
+        """Biten iş olayını işle; kuyruk boşaldıysa toplu işi bitir"""
+        job = self._jobs.get(item)
+        if job is None or job['finished']:
+            return
+        self._job_finished(item, job)
+        self._update_progress()
+        if not any(self._is_active(job) for job in self._jobs.values()):
+            self._batch_finished()
+    
+    def _job_finished(self, item, job):
+        """Biten bir işin sonucunu kuyruğa ve loglara yaz"""
+        job['finished'] = True
+        if job['started'] is not None:
+            self.queue_tree.set(item, 'time', f"{time.monotonic() - job['started']:.1f} sn")
+        future = job['future']
+        if future.cancelled() or isinstance(future.exception(), ConversionCancelled):
+            self.queue_tree.set(item, 'status', "İptal edildi")
+            self.log_message(f"- İptal edildi: {job['name']}")
+            return
+        error = future.exception()
+        if error is not None:
+            job['error'] = str(error)
+            self.queue_tree.set(item, 'status', "✗ Hata")
+            self.log_message(f"✗ Hata ({job['name']}): {error}")
+        else:
+            job['result'] = future.result()
+            self.queue_tree.set(item, 'status', "✓ Tamamlandı")
+            self.log_message(f"✓ PDF başarıyla oluşturuldu: {job['result']}")
+    
+    def _update_progress(self):
+        """İlerleme çubuğunu bu toplu işin tamamlanan oranına göre güncelle"""
+        total = len(self._batch)
+        done = sum(1 for item in self._batch if item in self._jobs and self._jobs[item]['finished'])
+        self.progress.config(maximum=max(total, 1), value=done)
+        if total and done < total:
+            self.status_text.set(f"Dönüştürülüyor... ({done}/{total})")
+    
+    def _batch_finished(self):
+        """Kuyruktaki tüm işler bittiğinde özet göster"""
+        jobs = [self._jobs[item] for item in self._batch if item in self._jobs]
+        self._batch = []
+        succeeded = [job for job in jobs if 'result' in job]
+        failed = [job for job in jobs if 'error' in job]
+        self.log_message(f"Özet: {len(succeeded)} başarılı, {len(failed)} başarısız")
         self.log_message("="*50 + "\n")
         
-        messagebox.showerror("Hata", f"PDF oluşturulurken hata oluştu:\n\n{error_message}")
+        if failed:
+            self.status_text.set("✗ Hata!")
+            self.status_label.config(foreground='red')
+        else:
+            self.status_text.set("✓ Başarılı!")
+            self.status_label.config(foreground='green')
+        
+        if len(jobs) == 1 and succeeded:
+            output_path = succeeded[0]['result']
+            result = messagebox.askyesno(
+                "Başarılı!",
+                f"PDF başarıyla oluşturuldu!\n\n{output_path}\n\nDosyayı açmak ister misiniz?"
+            )
+            if result:
+                self.open_file(output_path)
+        elif len(jobs) == 1 and failed:
+            messagebox.showerror("Hata", f"PDF oluşturulurken hata oluştu:\n\n{failed[0]['error']}")
+        elif failed:
+            messagebox.showwarning(
+                "Tamamlandı",
+                f"{len(succeeded)} PDF oluşturuldu, {len(failed)} dosyada hata oluştu.\n"
+                "Ayrıntılar için işlem loglarına bakın."
+            )
+        elif succeeded:
+            messagebox.showinfo("Başarılı!", f"{len(succeeded)} PDF başarıyla oluşturuldu!")
+    
+    def cancel_selected_jobs(self):
+        """
+        Kuyrukta seçili işleri iptal et
+        
+        Başlamamış işler kuyruktan çıkarılır; çalışan işler bir sonraki
+        aşamada veya sayfada durur.
+        """
+        for item in self.queue_tree.selection():
+            job = self._jobs.get(item)
+            if job is None or job['finished']:
+                continue
+            if not job['future'].cancel():
+                job['cancel'].set()
+                job['cancelling'] = True
+            self.queue_tree.set(item, 'status', "İptal ediliyor...")
+    
+    def clear_finished_jobs(self):
+        """Biten işleri kuyruk panelinden kaldır"""
+        for item, job in list(self._jobs.items()):
+            if job['finished']:
+                self.queue_tree.delete(item)
+                del self._jobs[item]
+    
+    def open_file(self, path):
+        """Dosyayı sistemin varsayılan uygulamasıyla aç"""
+        try:
+            if platform.system() == 'Darwin':  # macOS
+                subprocess.call(['open', path])
+            elif platform.system() == 'Windows':
+                os.startfile(path)
+            else:  # Linux
+                subprocess.call(['xdg-open', path])
+        except Exception as e:
+            self.log_message(f"Dosya açılırken hata: {e}")
+    
+    def on_close(self):
+        """Pencere kapanırken bekleyen işleri iptal et ve worker'ları kapat"""
+        # shutdown(cancel_futures=True) Python 3.9 gerektirir; kuyruktaki işler
+        # tek tek iptal edilir, çalışanlar iptal işaretiyle bir sonraki sayfada durur
+        for job in self._jobs.values():
+            if not job['finished']:
+                job['future'].cancel()
+                job['cancel'].set()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+        if self._manager is not None:
+            self._progress_queue.put(None)
+        self.root.destroy()
 
 
 def main():
     """Ana fonksiyon"""
     root = tk.Tk()
     app = MarkdownToPDFGUI(root)
+    root.protocol('WM_DELETE_WINDOW', app.on_close)
     root.mainloop()
 
 
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Markdown to PDF Converter - HTTP Servisi
+Markdown içeriğini HTTP üzerinden PDF'e çeviren, önceden ısıtılmış
+worker process'lerle çalışan servis
+"""
+
+import sys
+import json
+import argparse
+import threading
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from md_to_pdf import CancellationToken, Converter, ResourceFetcher, load_css, warm_fonts
+
+
+# İstek gövdesinin en fazla boyutu (bayt)
+MAX_BODY_SIZE = 10 * 1024 * 1024
+
+# İsteklerdeki markdown ve CSS'in varsayılan olarak kullanabileceği URL şemaları;
+# yerel dosyalar ve ağ adresleri --allow-url-schemes ile açıkça izin verilmedikçe okunmaz
+DEFAULT_URL_SCHEMES = ('data',)
+
+# Her worker'da tutulacak en fazla Converter sayısı (farklı CSS'ler için)
+MAX_WORKER_CONVERTERS = 8
+
+# Worker process'e ait durum
+_default_css = None
+_url_schemes = DEFAULT_URL_SCHEMES
+_converters = OrderedDict()
+# Aynı worker'daki tüm Converter'lar uzak kaynakları ortak önbellekten alır
+_resource_fetcher = ResourceFetcher()
+
+
+def _init_worker(default_css, preload_fonts=(), url_schemes=DEFAULT_URL_SCHEMES):
+    """
+    Worker process'i ısıtır
+    
+    markdown, weasyprint ve pygments import edilir, paylaşılan font kaydı
+    varsayılan CSS'in fontları ve preload_fonts ile ısıtılır; küçük bir
+    belge render edilerek stylesheet ve renklendirme de hazırlanır.
+    """
+    global _default_css, _url_schemes
+    _default_css = default_css
+    _url_schemes = tuple(url_schemes)
+    warm_fonts(default_css, preload_fonts)
+    _get_converter(None).render("# Hazır\n\n```python\nprint('ok')\n```\n")
+
+
+def _get_converter(css):
+    """CSS'e ait Converter'ı döndürür, gerekirse oluşturur (LRU)"""
+    css = css or _default_css
+    converter = _converters.get(css)
+    if converter is None:
+        converter = Converter(css_string=css, resource_fetcher=_resource_fetcher, url_schemes=_url_schemes)
+        _converters[css] = converter
+        if len(_converters) > MAX_WORKER_CONVERTERS:
+            _converters.popitem(last=False)
+    else:
+        _converters.move_to_end(css)
+    return converter
+
+
+def _render_job(md_content, css, title, cancel_event=None):
+    """Worker process'te tek bir render işini çalıştırır"""
+    return _get_converter(css).render(md_content, title=title, cancel=CancellationToken(cancel_event))
+
+
+class QueueFullError(Exception):
+    """İş kuyruğu dolu olduğunda fırlatılır"""
+
+
+class RenderService:
+    """
+    Sınırlı kuyruklu render havuzu
+    
+    Aynı anda en fazla workers + queue_size iş kabul edilir; fazlası
+    QueueFullError ile reddedilir. Zaman aşımına uğrayan iş kuyruktaysa
+    kuyruktan çıkarılır, çalışıyorsa worker'da bir sonraki aşamada veya
+    sayfada iptal edilir; kuyruk yeri iş gerçekten bitince boşalır, böylece
+    kuyruk sınırı gerçek yükü yansıtır.
+    """
+    
+    def __init__(self, workers=2, queue_size=16, timeout=60, css_file_path=None, preload_fonts=(),
+                 url_schemes=DEFAULT_URL_SCHEMES):
+        self.workers = workers
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(workers + queue_size)
+        # Zaman aşımındaki işleri worker'da durdurmak için process'ler arası iptal işaretleri
+        self._manager = multiprocessing.Manager()
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(load_css(css_file_path), tuple(preload_fonts or ()), tuple(url_schemes))
+        )
+    
+    def warm_up(self):
+        """Tüm worker process'lerin başlamasını ve ısınmasını bekler"""
+        futures = [self._executor.submit(len, '') for _ in range(self.workers)]
+        for future in futures:
+            future.result()
+    
+    def render(self, md_content, css=None, title='document'):
+        """
+        Markdown içeriğini bir worker'da PDF'e çevirir
+        
+        Raises:
+            QueueFullError: Kuyrukta yer yoksa
+            concurrent.futures.TimeoutError: İş zamanında bitmezse
+        """
+        if not self._slots.acquire(blocking=False):
+            raise QueueFullError("Render kuyruğu dolu")
+        try:
+            cancel_event = self._manager.Event()
+            future = self._executor.submit(_render_job, md_content, css, title, cancel_event)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _future: self._slots.release())
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            cancel_event.set()
+            raise
+    
+    def shutdown(self):
+        self._executor.shutdown(wait=False)
+        self._manager.shutdown()
+
+
+class RenderRequestHandler(BaseHTTPRequestHandler):
+    """
+    POST /render  -> PDF
+        JSON gövde: {"markdown": "...", "css": "...", "title": "..."}
+        veya gövdenin tamamı markdown metni olarak gönderilebilir
+    GET /health   -> servis durumu
+    """
+    
+    server_version = 'md_to_pdf'
+    
+    def do_GET(self):
+        if self.path != '/health':
+            self._send_json(404, {'error': 'Bulunamadı'})
+            return
+        self._send_json(200, {'status': 'ok', 'workers': self.server.service.workers})
+    
+    def do_POST(self):
+        if self.path != '/render':
+            self._send_json(404, {'error': 'Bulunamadı'})
+            return
+        
+        if self.headers.get('Content-Length') is None:
+            # Gövdesiz istek boş bir PDF'e dönüşmesin (chunked gövde de desteklenmez)
+            self._send_json(411, {'error': 'Content-Length gerekli'})
+            return
+        try:
+            length = int(self.headers['Content-Length'])
+        except ValueError:
+            length = -1
+        if length < 0:
+            self._send_json(400, {'error': 'Geçersiz Content-Length'})
+            return
+        if length > MAX_BODY_SIZE:
+            self._send_json(413, {'error': 'İstek gövdesi çok büyük'})
+            return
+        body = self.rfile.read(length)
+        
+        css = None
+        title = 'document'
+        try:
+            if self.headers.get_content_type() == 'application/json':
+                payload = json.loads(body.decode('utf-8'))
+                md_content = payload['markdown']
+                css = payload.get('css')
+                title = payload.get('title') or title
+                # Hatalı tipler worker'da 500'e dönüşmeden burada reddedilir
+                if not isinstance(md_content, str):
+                    raise TypeError("'markdown' metin olmalı")
+                if not isinstance(css, (str, type(None))) or not isinstance(title, str):
+                    raise TypeError("'css' ve 'title' metin olmalı")
+            else:
+                md_content = body.decode('utf-8')
+        except (ValueError, KeyError, TypeError) as e:
+            self._send_json(400, {'error': f'Geçersiz istek: {e}'})
+            return
+        
+        try:
+            pdf = self.server.service.render(md_content, css, title)
+        except QueueFullError as e:
+            self._send_json(429, {'error': str(e)}, {'Retry-After': '1'})
+            return
+        except FutureTimeoutError:
+            self._send_json(504, {'error': 'Render zaman aşımına uğradı'})
+            return
+        except Exception as e:
+            self._send_json(500, {'error': str(e)})
+            return
+        
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/pdf')
+        self.send_header('Content-Length', str(len(pdf)))
+        self.end_headers()
+        self.wfile.write(pdf)
+    
+    def _send_json(self, status, data, headers=None):
+        body = json.dumps(data, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def serve(host='127.0.0.1', port=8000, workers=2, queue_size=16, timeout=60,
+          css_file_path=None, preload_fonts=(), url_schemes=DEFAULT_URL_SCHEMES):
+    """Render servisini başlatır ve Ctrl+C'ye kadar çalıştırır"""
+    service = RenderService(workers, queue_size, timeout, css_file_path, preload_fonts, url_schemes)
+    print(f"Worker'lar hazırlanıyor ({workers})...", file=sys.stderr)
+    service.warm_up()
+    
+    server = ThreadingHTTPServer((host, port), RenderRequestHandler)
+    server.service = service
+    print(f"✓ Servis çalışıyor: http://{host}:{port}/render", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nServis durduruldu", file=sys.stderr)
+    finally:
+        server.server_close()
+        service.shutdown()
+
+
+def main(argv=None):
+    """Komut satırı arayüzü: md_to_pdf.py serve [seçenekler]"""
+    parser = argparse.ArgumentParser(
+        prog='md_to_pdf.py serve',
+        description='Markdown\'ı HTTP üzerinden PDF\'e çeviren servisi başlatır',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Örnekler:
+  %(prog)s --port 8000 --workers 4
+  curl --data-binary @dosya.md http://127.0.0.1:8000/render -o cikti.pdf
+        """
+    )
+    parser.add_argument('--host', default='127.0.0.1', help='Dinlenecek adres (varsayılan: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8000, help='Dinlenecek port (varsayılan: 8000)')
+    parser.add_argument('--workers', type=int, default=2, help='Worker process sayısı (varsayılan: 2)')
+    parser.add_argument(
+        '--queue-size',
+        type=int,
+        default=16,
+        help='Worker\'lar meşgulken bekleyebilecek en fazla istek; fazlası 429 alır (varsayılan: 16)'
+    )
+    parser.add_argument(
+        '--timeout',
+        type=float,
+        default=60,
+        help='İstek başına render zaman aşımı, saniye (varsayılan: 60)'
+    )
+    parser.add_argument('-c', '--css', help='CSS verilmeyen istekler için kullanılacak CSS dosyası')
+    parser.add_argument(
+        '--preload-fonts',
+        nargs='+',
+        metavar='FONT',
+        help='Worker\'lar başlarken önceden yüklenecek font aileleri'
+    )
+    parser.add_argument(
+        '--allow-url-schemes',
+        type=lambda value: tuple(scheme.strip().lower() for scheme in value.split(',') if scheme.strip()),
+        default=DEFAULT_URL_SCHEMES,
+        metavar='ŞEMALAR',
+        help='İsteklerdeki görsel ve stylesheet\'lerin kullanabileceği URL şemaları, virgülle ayrılmış '
+             '(varsayılan: data; ör. data,https). file ve http(s) sunucunun dosyalarını ve '
+             'erişebildiği ağ adreslerini isteklere açar'
+    )
+    
+    args = parser.parse_args(argv)
+    serve(
+        args.host, args.port, args.workers, args.queue_size, args.timeout, args.css, args.preload_fonts,
+        args.allow_url_schemes
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""md_to_pdf_async (asyncio API) testleri"""
+
+import asyncio
+import threading
+
+import pytest
+
+import md_to_pdf_async
+from md_to_pdf_async import (
+    AsyncConverter, close_default_converter, convert_async, convert_many_async, default_converter
+)
+
+
+LONG_DOCUMENT = '\n\n'.join(f'## Bölüm {n}\n\n' + 'Uzun bir cümle. ' * 80 for n in range(400))
+
+
+def test_convert_async_uses_the_shared_converter():
+    async def main():
+        pdf = await convert_async('# Rapor\n', title='rapor')
+        pdfs = await convert_many_async(['# A\n', ('# B\n', 'b')])
+        return pdf, pdfs
+    
+    try:
+        pdf, pdfs = asyncio.run(main())
+        assert pdf.startswith(b'%PDF')
+        assert len(pdfs) == 2 and all(pdf.startswith(b'%PDF') for pdf in pdfs)
+        shared = default_converter()
+    finally:
+        close_default_converter()
+    # Kapatılan paylaşılan dönüştürücünün yerine yenisi oluşturulur
+    assert md_to_pdf_async._default_converter is None
+    assert shared._executor is None
+
+
+def test_submission_runs_off_the_event_loop(monkeypatch):
+    threads = []
+    submit = AsyncConverter._submit
+    
+    def recording_submit(self, *args):
+        threads.append(threading.current_thread())
+        return submit(self, *args)
+    
+    monkeypatch.setattr(AsyncConverter, '_submit', recording_submit)
+    
+    async def main():
+        async with AsyncConverter(workers=1) as converter:
+            return await converter.render('# Rapor\n', css_string='body { color: navy; }')
+    
+    assert asyncio.run(main()).startswith(b'%PDF')
+    # Manager'a giden iptal işareti çağrısı olay döngüsünün thread'inde yapılmaz
+    assert threads and threading.main_thread() not in threads
+
+
+def test_cancelled_render_releases_the_worker():
+    async def main():
+        async with AsyncConverter(workers=1) as converter:
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(converter.render(LONG_DOCUMENT), timeout=0.05)
+            # Tek worker uzun işi bırakmazsa bu render zaman aşımına uğrar
+            pdf = await asyncio.wait_for(converter.render('# Kısa\n'), timeout=60)
+            await asyncio.sleep(0.1)
+            return pdf, dict(converter._pending)
+    
+    pdf, pending = asyncio.run(main())
+    assert pdf.startswith(b'%PDF')
+    assert pending == {}
+
+
+def test_render_many_returns_exceptions_in_order():
+    async def main():
+        async with AsyncConverter(workers=2) as converter:
+            return await converter.render_many(
+                ['# A\n', b'\xff\xfe bozuk', '# C\n'], return_exceptions=True
+            )
+    
+    first, failed, last = asyncio.run(main())
+    assert first.startswith(b'%PDF') and last.startswith(b'%PDF')
+    assert isinstance(failed, UnicodeDecodeError)
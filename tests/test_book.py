@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""Kitap modunun içindekiler listesi testleri"""
+
+from html.parser import HTMLParser
+
+import pytest
+
+from md_to_pdf_book import Book
+
+
+class NestingChecker(HTMLParser):
+    """Etiketlerin doğru iç içe geçtiğini ve her <li>'nin bir <ol> içinde olduğunu kontrol eder"""
+    
+    def __init__(self):
+        super().__init__()
+        self.stack = []
+        self.items = []
+    
+    def handle_starttag(self, tag, attrs):
+        if tag == 'li':
+            assert self.stack and self.stack[-1] == 'ol', f"<li> bir <ol> içinde değil: {self.stack}"
+        if tag == 'ol':
+            assert self.stack[-1] in ('nav', 'li'), f"<ol> yanlış yerde: {self.stack}"
+        self.stack.append(tag)
+    
+    def handle_endtag(self, tag):
+        assert self.stack and self.stack[-1] == tag, f"</{tag}> beklenmiyordu: {self.stack}"
+        self.stack.pop()
+    
+    def handle_data(self, data):
+        if data.strip() and self.stack and self.stack[-1] == 'a':
+            self.items.append((data.strip(), self.stack.count('ol')))
+
+
+def _check(headings):
+    checker = NestingChecker()
+    checker.feed(Book._toc_html(headings))
+    checker.close()
+    assert checker.stack == []
+    return checker.items
+
+
+@pytest.mark.parametrize('levels', [
+    [1, 2, 2, 1],
+    [2, 1],
+    [2, 2, 1, 2],
+    [1, 3, 2],
+    [1, 2, 3, 1],
+    [3, 2, 1],
+])
+def test_toc_is_well_nested(levels):
+    headings = [(level, f'h{index}', f'Başlık {index}') for index, level in enumerate(levels)]
+    items = _check(headings)
+    assert [text for text, _depth in items] == [text for _level, _id, text in headings]
+
+
+def test_toc_nests_deeper_headings_under_previous_item():
+    headings = [(1, 'a', 'A'), (2, 'b', 'B'), (3, 'c', 'C'), (2, 'd', 'D'), (1, 'e', 'E')]
+    assert _check(headings) == [('A', 1), ('B', 2), ('C', 3), ('D', 2), ('E', 1)]
+
+
+def test_toc_with_shallower_heading_after_deeper_one():
+    headings = [(2, 'a', 'A'), (1, 'b', 'B'), (2, 'c', 'C')]
+    assert _check(headings) == [('A', 1), ('B', 1), ('C', 2)]
+
+
+def test_empty_toc():
+    assert Book._toc_html([]) == ''
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""'build SRC_DIR OUT_DIR' dizin derlemesinin (Builder) testleri"""
+
+import json
+import os
+
+import pytest
+
+from md_to_pdf_build import MANIFEST_NAME, Builder, _dependency_record
+
+
+@pytest.fixture
+def project(tmp_path):
+    src = tmp_path / 'docs'
+    (src / 'rehber').mkdir(parents=True)
+    (src / 'index.md').write_text('# Ana sayfa\n\n![Logo](logo.png)\n', encoding='utf-8')
+    (src / 'rehber' / 'kurulum.md').write_text('# Kurulum\n', encoding='utf-8')
+    (src / 'logo.png').write_bytes(b'\x89PNG\r\n\x1a\n')
+    return src, tmp_path / 'pdf'
+
+
+def _build(src, out, **options):
+    return sorted((status, path.relative_to(out).as_posix()) for status, path, _error in
+                  Builder(src, out, **options).build())
+
+
+def test_manifest_round_trip(project):
+    src, out = project
+    builder = Builder(src, out)
+    outputs = {'index.pdf': {'source': str(src / 'index.md'), 'dependencies': {}}}
+    builder.save_manifest(outputs)
+    assert builder.load_manifest() == (outputs, True)
+    
+    # Ayarlar değiştiyse kayıtlar okunur ama tümü yeniden derlenir
+    assert Builder(src, out, extensions='fast').load_manifest() == (outputs, False)
+    
+    (out / MANIFEST_NAME).write_text('{bozuk', encoding='utf-8')
+    assert builder.load_manifest() == ({}, False)
+
+
+def test_is_up_to_date(tmp_path):
+    dependency = tmp_path / 'rapor.md'
+    dependency.write_text('# Rapor\n', encoding='utf-8')
+    output = tmp_path / 'rapor.pdf'
+    output.write_bytes(b'%PDF')
+    entry = {'dependencies': {str(dependency): _dependency_record(dependency)}}
+    assert Builder.is_up_to_date(entry, output)
+    
+    # Sadece mtime'ı değişen bağımlılık yeniden derletmez, kaydı güncellenir
+    os.utime(dependency, ns=(1, 1))
+    assert Builder.is_up_to_date(entry, output)
+    assert entry['dependencies'][str(dependency)]['mtime_ns'] == 1
+    
+    dependency.write_text('# Rapor 2\n', encoding='utf-8')
+    assert not Builder.is_up_to_date(entry, output)
+    
+    assert not Builder.is_up_to_date(None, output)
+    assert not Builder.is_up_to_date(dict(entry, failed=True), output)
+
+
+def test_missing_dependency_that_appears_is_a_change(tmp_path):
+    output = tmp_path / 'rapor.pdf'
+    output.write_bytes(b'%PDF')
+    image = tmp_path / 'sonra.png'
+    entry = {'dependencies': {str(image): None}}
+    assert Builder.is_up_to_date(entry, output)
+    image.write_bytes(b'png')
+    assert not Builder.is_up_to_date(entry, output)
+
+
+def test_incremental_build(project):
+    src, out = project
+    assert _build(src, out) == [('built', 'index.pdf'), ('built', 'rehber/kurulum.pdf')]
+    manifest = json.loads((out / MANIFEST_NAME).read_text(encoding='utf-8'))
+    dependencies = manifest['outputs']['index.pdf']['dependencies']
+    assert str((src / 'logo.png').resolve()) in dependencies
+    
+    builder = Builder(src, out)
+    assert list(builder.build()) == []
+    assert builder.skipped == 2
+    
+    # Görsel değişince sadece onu kullanan belge yeniden derlenir
+    (src / 'logo.png').write_bytes(b'\x89PNG\r\n\x1a\nyeni')
+    assert _build(src, out) == [('built', 'index.pdf')]
+    
+    (src / 'rehber' / 'kurulum.md').unlink()
+    assert _build(src, out) == [('removed', 'rehber/kurulum.pdf')]
+    assert not (out / 'rehber').exists()
+
+
+def test_failed_build_keeps_tracking_previous_output(project):
+    src, out = project
+    _build(src, out)
+    (src / 'index.md').write_bytes(b'\xff\xfe bozuk')
+    assert _build(src, out) == [('failed', 'index.pdf')]
+    assert (out / 'index.pdf').exists()
+    # Başarısız belge bir sonraki derlemede yeniden denenir
+    assert _build(src, out) == [('failed', 'index.pdf')]
+    
+    (src / 'index.md').unlink()
+    assert _build(src, out) == [('removed', 'index.pdf')]
+    assert not (out / 'index.pdf').exists()
+
+
+def test_removal_stays_inside_out_dir(project, tmp_path):
+    src, out = project
+    outside = tmp_path / 'disarida.pdf'
+    outside.write_bytes(b'%PDF')
+    builder = Builder(src, out)
+    builder.save_manifest({'../disarida.pdf': {'source': 'yok.md', 'dependencies': {}}})
+    
+    statuses = [status for status, _path, _error in builder.build()]
+    assert 'removed' not in statuses
+    assert outside.exists()
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""Extension profilleri ve extension başına süre ölçümü testleri"""
+
+import pytest
+
+from md_to_pdf import EXTENSION_PROFILES, resolve_extensions, time_extensions
+
+
+CODE_DOCUMENT = '\n\n'.join(
+    f"## Örnek {n}\n\n```python\ndef kare_{n}(x):\n    return [x * i for i in range({n})]\n```"
+    for n in range(40)
+)
+
+
+def test_resolve_profiles():
+    assert resolve_extensions('fast') == list(EXTENSION_PROFILES['fast'])
+    assert resolve_extensions(['extra', 'toc']) == ['extra', 'toc']
+    with pytest.raises(ValueError):
+        resolve_extensions('yok-boyle-profil')
+
+
+def test_fenced_code_highlighting_is_credited_to_codehilite():
+    timings, total = time_extensions(CODE_DOCUMENT, 'full')
+    codehilite = sum(timings['codehilite'].values())
+    extra = sum(timings['extra'].values())
+    # Pygments fenced_code preprocessor'u içinde çalışır ama codehilite'ın maliyetidir
+    assert codehilite > extra
+    assert timings['codehilite']['preprocessors'] > 0
+    assert sum(sum(bucket.values()) for bucket in timings.values()) <= total
+
+
+def test_timing_restores_code_hilite():
+    from markdown.extensions.codehilite import CodeHilite
+    
+    hilite = CodeHilite.hilite
+    time_extensions(CODE_DOCUMENT, 'full')
+    assert CodeHilite.hilite is hilite
+
+
+def test_fast_profile_has_no_codehilite():
+    timings, _total = time_extensions(CODE_DOCUMENT, 'fast')
+    assert 'codehilite' not in timings
@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+"""Kod renklendirme önbelleği testleri"""
+
+import pygments
+
+from md_to_pdf import Converter, HighlightCache
+
+
+DOCUMENT = "```python\nprint('merhaba')\n```\n"
+
+
+def test_disk_cache_is_reused_across_instances(tmp_path):
+    first = HighlightCache(directory=tmp_path)
+    html = Converter(highlight_cache=first).to_html_body(DOCUMENT)
+    assert first.misses == 1
+    
+    second = HighlightCache(directory=tmp_path)
+    assert Converter(highlight_cache=second).to_html_body(DOCUMENT) == html
+    assert (second.hits, second.misses) == (1, 0)
+
+
+def test_key_depends_on_pygments_version(monkeypatch):
+    key = HighlightCache.key(DOCUMENT, 'python')
+    monkeypatch.setattr(pygments, '__version__', '0.0')
+    assert HighlightCache.key(DOCUMENT, 'python') != key
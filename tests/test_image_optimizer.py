@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""ImageOptimizer'ın görselleri basılacakları alana göre küçültme testleri"""
+
+import argparse
+import io
+
+import pytest
+from PIL import Image
+
+from md_to_pdf import ImageOptimizer, parse_size_cm
+
+
+def _jpeg(width, height):
+    output = io.BytesIO()
+    Image.new('RGB', (width, height), 'navy').save(output, 'JPEG')
+    return output.getvalue()
+
+
+def _size(data):
+    return Image.open(io.BytesIO(data)).size
+
+
+def test_page_area_limits_the_size():
+    optimizer = ImageOptimizer(dpi=100)
+    data = _jpeg(4000, 3000)
+    # A3 yatay sayfanın içerik alanı A4'ün varsayılan alanından büyüktür
+    a4, _ = optimizer.process(data, 'image/jpeg')
+    a3, _ = optimizer.process(data, 'image/jpeg', (38.0, 25.7))
+    assert max(_size(a4)) <= optimizer.max_pixels()[1]
+    assert _size(a3)[0] > _size(a4)[0]
+    assert _size(a3)[0] <= optimizer.max_pixels((38.0, 25.7))[0]
+
+
+def test_explicit_size_overrides_page_area():
+    optimizer = ImageOptimizer(dpi=100, max_size_cm=(5, 5))
+    result, _ = optimizer.process(_jpeg(4000, 3000), 'image/jpeg', (38.0, 25.7))
+    assert max(_size(result)) <= int(5 / 2.54 * 100)
+
+
+def test_small_images_are_kept():
+    data = _jpeg(200, 100)
+    assert ImageOptimizer(dpi=100).process(data, 'image/jpeg')[0] is data
+
+
+def test_cache_distinguishes_page_areas(tmp_path):
+    optimizer = ImageOptimizer(dpi=100, cache_dir=tmp_path)
+    data = _jpeg(4000, 3000)
+    small, _ = optimizer.process(data, 'image/jpeg', (10.0, 10.0))
+    large, _ = optimizer.process(data, 'image/jpeg', (30.0, 30.0))
+    assert _size(small) != _size(large)
+
+
+def test_parse_size_cm():
+    assert parse_size_cm('25.7x17') == (25.7, 17.0)
+    for value in ('25.7', 'axb', '0x10'):
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_size_cm(value)
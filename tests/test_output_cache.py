@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""Diskteki PDF önbelleğinin (OutputCache) anahtar ve geçerlilik testleri"""
+
+import os
+
+from md_to_pdf import Converter, OutputCache
+
+
+def _key(cache, **changes):
+    inputs = {
+        'md_bytes': b'# Rapor\n', 'css': 'body {}', 'extensions': ['extra'],
+        'title': 'rapor', 'settings': '', 'base_url': 'file:///belgeler/',
+    }
+    inputs.update(changes)
+    return cache.key(**inputs)
+
+
+def _pdf(path, data=b'%PDF-1.7 test'):
+    path.write_bytes(data)
+    return path
+
+
+def test_key_covers_every_input(tmp_path):
+    cache = OutputCache(tmp_path)
+    base = _key(cache)
+    assert _key(cache) == base
+    changes = [
+        {'md_bytes': b'# Rapor 2\n'},
+        {'css': 'body { color: red; }'},
+        {'extensions': ['extra', 'toc']},
+        {'title': 'diger'},
+        {'settings': 'dpi=150'},
+        # Aynı markdown başka dizinde farklı görsellere çözümlenir
+        {'base_url': 'file:///baska/'},
+    ]
+    assert len({_key(cache, **change) for change in changes} | {base}) == len(changes) + 1
+
+
+def test_store_and_fetch(tmp_path):
+    cache = OutputCache(tmp_path / 'cache')
+    key = _key(cache)
+    assert not cache.fetch(key, tmp_path / 'out.pdf')
+    
+    cache.store(key, _pdf(tmp_path / 'rapor.pdf'))
+    assert cache.fetch(key, tmp_path / 'out.pdf')
+    assert (tmp_path / 'out.pdf').read_bytes() == b'%PDF-1.7 test'
+
+
+def test_changed_local_resource_invalidates_entry(tmp_path):
+    cache = OutputCache(tmp_path / 'cache')
+    image = tmp_path / 'logo.png'
+    image.write_bytes(b'eski')
+    key = _key(cache)
+    cache.store(key, _pdf(tmp_path / 'rapor.pdf'), [image.as_uri(), 'https://example.com/a.png'])
+    assert cache.fetch(key, tmp_path / 'out.pdf')
+    
+    image.write_bytes(b'yeni logo')
+    assert not cache.fetch(key, tmp_path / 'out.pdf')
+
+
+def test_missing_resource_that_appears_invalidates_entry(tmp_path):
+    cache = OutputCache(tmp_path / 'cache')
+    image = tmp_path / 'sonra.png'
+    key = _key(cache)
+    cache.store(key, _pdf(tmp_path / 'rapor.pdf'), [image.as_uri()])
+    assert cache.fetch(key, tmp_path / 'out.pdf')
+    
+    image.write_bytes(b'png')
+    assert not cache.fetch(key, tmp_path / 'out.pdf')
+
+
+def test_evict_removes_oldest_entries_and_their_resource_lists(tmp_path):
+    cache = OutputCache(tmp_path / 'cache', max_bytes=150)
+    keys = [_key(cache, title=str(n)) for n in range(3)]
+    for age, key in enumerate(keys):
+        cache.store(key, _pdf(tmp_path / 'rapor.pdf', b'x' * 100))
+        entry = cache.directory / key[:2] / f"{key}.pdf"
+        os.utime(entry, (1000 + age, 1000 + age))
+    cache.evict()
+    
+    assert [cache.fetch(key, tmp_path / 'out.pdf') for key in keys] == [False, False, True]
+    assert len(list(cache.directory.glob('*/*.json'))) == 1
+
+
+def test_converter_reuses_cached_pdf(tmp_path, monkeypatch):
+    renders = []
+    
+    def write_pdf(self, html_wrapper, target, *args, **kwargs):
+        renders.append(target)
+        target.write_bytes(b'%PDF-1.7 ' + html_wrapper.encode('utf-8'))
+    
+    monkeypatch.setattr(Converter, '_write_pdf', write_pdf)
+    source = tmp_path / 'docs' / 'rapor.md'
+    source.parent.mkdir()
+    source.write_text('# Rapor\n', encoding='utf-8')
+    converter = Converter(cache=OutputCache(tmp_path / 'cache'))
+    
+    converter.convert(source, tmp_path / 'a.pdf')
+    converter.convert(source, tmp_path / 'b.pdf')
+    assert len(renders) == 1
+    assert (tmp_path / 'b.pdf').read_bytes() == (tmp_path / 'a.pdf').read_bytes()
+    
+    # Aynı içerik başka bir dizinde ayrı kayıt kullanır
+    other = tmp_path / 'other' / 'rapor.md'
+    other.parent.mkdir()
+    other.write_text('# Rapor\n', encoding='utf-8')
+    converter.convert(other, tmp_path / 'c.pdf')
+    assert len(renders) == 2
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""--profile ölçümlerinin (profile_conversion) testleri"""
+
+import io
+import json
+import pstats
+import tracemalloc
+
+from md_to_pdf import (
+    Converter, OutputCache, profile_conversion, profile_dump_path, write_profile_record
+)
+
+
+def _document(directory, name='rapor.md'):
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / name
+    path.write_text('# Rapor\n\nBir paragraf.\n\n```python\nprint(1)\n```\n', encoding='utf-8')
+    return path
+
+
+def test_dump_names_differ_for_same_name_in_other_directories(tmp_path):
+    first = profile_dump_path(tmp_path / 'dumps', tmp_path / 'a' / 'x.md')
+    second = profile_dump_path(tmp_path / 'dumps', tmp_path / 'b' / 'x.md')
+    assert first != second
+    assert first.name.startswith('x-') and first.suffix == '.prof'
+    assert profile_dump_path(tmp_path / 'dumps', tmp_path / 'a' / 'x.md') == first
+
+
+def test_record_has_stage_timings_and_dump(tmp_path):
+    source = _document(tmp_path)
+    dump = tmp_path / 'rapor.prof'
+    output, record = profile_conversion(Converter(), source, tmp_path / 'rapor.pdf', dump_path=dump)
+    
+    assert output == tmp_path / 'rapor.pdf'
+    assert not record['cached']
+    assert {'markdown', 'layout', 'write'} <= set(record['stages'])
+    assert record['output_size'] == output.stat().st_size
+    assert record['peak_python_memory'] is None
+    assert record['cprofile'] == str(dump)
+    pstats.Stats(str(dump))
+    
+    stream = io.StringIO()
+    write_profile_record(record, stream)
+    assert json.loads(stream.getvalue()) == record
+
+
+def test_memory_is_traced_in_a_separate_conversion(tmp_path):
+    source = _document(tmp_path)
+    converter = Converter(cache=OutputCache(tmp_path / 'cache'))
+    tracing = []
+    convert = converter.convert
+    
+    def traced_convert(*args, **kwargs):
+        tracing.append(tracemalloc.is_tracing())
+        return convert(*args, **kwargs)
+    
+    converter.convert = traced_convert
+    _output, record = profile_conversion(converter, source, tmp_path / 'rapor.pdf', trace_memory=True)
+    
+    # Süreleri ölçülen dönüştürme tracemalloc olmadan çalışır
+    assert tracing == [False, True]
+    assert record['peak_python_memory'] > 0
+    assert not tracemalloc.is_tracing()
+    assert converter.cache is not None
+
+
+def test_cached_documents_are_marked(tmp_path):
+    source = _document(tmp_path)
+    converter = Converter(cache=OutputCache(tmp_path / 'cache'))
+    profile_conversion(converter, source, tmp_path / 'rapor.pdf')
+    _output, record = profile_conversion(converter, source, tmp_path / 'rapor.pdf')
+    assert record['cached']
+    assert record['stages'] == {}
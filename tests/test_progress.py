@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""on_progress geri çağrıları ve CancellationToken ile iptal testleri"""
+
+import logging
+
+import pytest
+
+from md_to_pdf import (
+    CancellationToken, ConversionCancelled, Converter, convert_md_text_to_pdf
+)
+
+
+LONG_DOCUMENT = '\n\n'.join(f'# Bölüm {n}\n\n' + 'Uzun bir cümle. ' * 200 for n in range(8))
+
+
+def _stages(events):
+    """Ardışık tekrarları atlanmış aşama sırası"""
+    stages = []
+    for stage, _info in events:
+        if not stages or stages[-1] != stage:
+            stages.append(stage)
+    return stages
+
+
+def test_stages_are_reported_in_order():
+    events = []
+    pdf = convert_md_text_to_pdf(LONG_DOCUMENT, on_progress=lambda stage, info: events.append((stage, info)))
+    
+    assert _stages(events) == ['markdown', 'fetch', 'css', 'layout', 'write', 'done']
+    pages = events[-1][1]['pages']
+    assert pages > 1
+    assert events[-1][1]['bytes'] == len(pdf)
+    assert {'pages': pages} in [info for stage, info in events if stage == 'layout']
+    written = [info['page'] for stage, info in events if stage == 'write']
+    assert written == list(range(1, pages + 1))
+
+
+def test_cancelled_token_stops_before_rendering(tmp_path):
+    source = tmp_path / 'rapor.md'
+    source.write_text('# Rapor\n', encoding='utf-8')
+    token = CancellationToken()
+    token.cancel()
+    with pytest.raises(ConversionCancelled):
+        Converter().convert(source, tmp_path / 'rapor.pdf', cancel=token)
+    assert not (tmp_path / 'rapor.pdf').exists()
+
+
+@pytest.mark.parametrize('stage', ['fetch', 'layout', 'write'])
+def test_cancel_during_a_stage(stage):
+    token = CancellationToken()
+    events = []
+    
+    def on_progress(current, info):
+        events.append(current)
+        if current == stage:
+            token.cancel()
+    
+    with pytest.raises(ConversionCancelled):
+        Converter().render(LONG_DOCUMENT, on_progress=on_progress, cancel=token)
+    # İptal bir sonraki kontrolde fark edilir; yazım tamamlanmaz
+    assert 'done' not in events
+    assert events.count(stage) <= 2
+
+
+def test_layout_tracking_restores_the_progress_logger():
+    logger = logging.getLogger('weasyprint.progress')
+    level, propagate, handlers = logger.level, logger.propagate, list(logger.handlers)
+    convert_md_text_to_pdf('# Rapor\n', on_progress=lambda stage, info: None)
+    assert (logger.level, logger.propagate, logger.handlers) == (level, propagate, handlers)
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""ResourceFetcher'ın yerel bir HTTP sunucusuna karşı testleri"""
+
+import time
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from md_to_pdf import ResourceFetcher
+
+
+RESOURCES = {
+    '/logo.png': (b'\x89PNG\r\n\x1a\nlogo', 'image/png'),
+    '/style.css': (b'body { color: navy; }', 'text/css'),
+}
+
+
+@pytest.fixture
+def server():
+    """Kaynakları sunan ve her yolun kaç kez istendiğini sayan HTTP sunucusu"""
+    requests = Counter()
+    
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            requests[self.path] += 1
+            data, mime_type = RESOURCES[self.path]
+            self.send_response(200)
+            self.send_header('Content-Type', mime_type)
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+        
+        def log_message(self, *args):
+            pass
+    
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    base = f'http://127.0.0.1:{httpd.server_address[1]}'
+    try:
+        yield base, requests
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def test_prefetch_then_fetch_hits_memory(server):
+    base, requests = server
+    fetcher = ResourceFetcher(workers=2)
+    urls = [base + '/logo.png', base + '/style.css']
+    try:
+        fetcher.prefetch(urls)
+        assert requests == {'/logo.png': 1, '/style.css': 1}
+        
+        data, mime_type, _url = fetcher.fetch(base + '/logo.png')
+        assert data == RESOURCES['/logo.png'][0]
+        assert mime_type == 'image/png'
+        assert fetcher.hits == 1
+        
+        # Önbellekteki URL'ler tekrar indirilmez
+        fetcher.prefetch(urls)
+        assert requests == {'/logo.png': 1, '/style.css': 1}
+    finally:
+        fetcher.close()
+
+
+def test_memory_entries_expire_after_max_age(server):
+    base, requests = server
+    fetcher = ResourceFetcher(max_age=0.2)
+    url = base + '/logo.png'
+    
+    fetcher.fetch(url)
+    fetcher.fetch(url)
+    assert requests['/logo.png'] == 1
+    
+    time.sleep(0.3)
+    fetcher.prefetch([url])
+    assert requests['/logo.png'] == 2
+    fetcher.fetch(url)
+    assert requests['/logo.png'] == 2
+
+
+def test_disk_cache_shares_remote_resources(server, tmp_path):
+    base, requests = server
+    url = base + '/style.css'
+    
+    ResourceFetcher(cache_dir=tmp_path).fetch(url)
+    data, _mime_type, _url = ResourceFetcher(cache_dir=tmp_path).fetch(url)
+    assert data == RESOURCES['/style.css'][0]
+    assert requests['/style.css'] == 1
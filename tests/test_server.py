@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+"""HTTP render servisinin istek doğrulama ve kuyruk testleri"""
+
+import json
+import time
+import threading
+import http.client
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+from md_to_pdf import Converter
+from md_to_pdf_server import (
+    DEFAULT_URL_SCHEMES, MAX_BODY_SIZE, QueueFullError, RenderRequestHandler, RenderService
+)
+
+
+class FakeService:
+    """Render etmeden istekleri kaydeden veya verilen hatayı fırlatan servis"""
+    
+    workers = 1
+    
+    def __init__(self):
+        self.requests = []
+        self.error = None
+    
+    def render(self, md_content, css=None, title='document'):
+        if self.error is not None:
+            raise self.error
+        self.requests.append((md_content, css, title))
+        return b'%PDF-1.7 test'
+
+
+@pytest.fixture
+def server(monkeypatch):
+    monkeypatch.setattr(RenderRequestHandler, 'log_message', lambda *args: None)
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), RenderRequestHandler)
+    httpd.service = FakeService()
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _request(server, method, path, body=None, headers=None):
+    connection = http.client.HTTPConnection('127.0.0.1', server.server_port, timeout=10)
+    connection.putrequest(method, path)
+    for name, value in (headers or {}).items():
+        connection.putheader(name, value)
+    connection.endheaders()
+    if body:
+        connection.send(body)
+    response = connection.getresponse()
+    data = response.read()
+    connection.close()
+    return response, data
+
+
+def _post_json(server, payload):
+    body = json.dumps(payload).encode('utf-8')
+    return _request(server, 'POST', '/render', body, {
+        'Content-Type': 'application/json', 'Content-Length': str(len(body))
+    })
+
+
+def test_json_and_plain_bodies_are_rendered(server):
+    response, data = _post_json(server, {'markdown': '# A', 'css': 'body {}', 'title': 'a'})
+    assert response.status == 200
+    assert response.getheader('Content-Type') == 'application/pdf'
+    assert data == b'%PDF-1.7 test'
+    
+    body = '# Düz metin'.encode('utf-8')
+    response, _data = _request(server, 'POST', '/render', body, {'Content-Length': str(len(body))})
+    assert response.status == 200
+    assert server.service.requests == [('# A', 'body {}', 'a'), ('# Düz metin', None, 'document')]
+
+
+def test_missing_content_length_is_rejected(server):
+    response, _data = _request(server, 'POST', '/render')
+    assert response.status == 411
+    assert server.service.requests == []
+
+
+@pytest.mark.parametrize('length', ['abc', '-5'])
+def test_malformed_content_length_is_rejected(server, length):
+    response, _data = _request(server, 'POST', '/render', headers={'Content-Length': length})
+    assert response.status == 400
+
+
+def test_oversized_body_is_rejected(server):
+    response, _data = _request(
+        server, 'POST', '/render', headers={'Content-Length': str(MAX_BODY_SIZE + 1)}
+    )
+    assert response.status == 413
+
+
+@pytest.mark.parametrize('payload', [
+    {'css': 'body {}'},
+    {'markdown': 42},
+    {'markdown': '# A', 'css': ['body {}']},
+    {'markdown': '# A', 'title': {'ad': 'a'}},
+    ['# A'],
+])
+def test_invalid_json_payloads_are_rejected(server, payload):
+    response, data = _post_json(server, payload)
+    assert response.status == 400
+    assert 'error' in json.loads(data)
+    assert server.service.requests == []
+
+
+def test_invalid_json_is_rejected(server):
+    body = b'{"markdown": '
+    response, _data = _request(server, 'POST', '/render', body, {
+        'Content-Type': 'application/json', 'Content-Length': str(len(body))
+    })
+    assert response.status == 400
+
+
+@pytest.mark.parametrize('error, status', [
+    (QueueFullError('dolu'), 429),
+    (FutureTimeoutError(), 504),
+    (RuntimeError('render hatası'), 500),
+])
+def test_service_errors_map_to_status_codes(server, error, status):
+    server.service.error = error
+    response, _data = _post_json(server, {'markdown': '# A'})
+    assert response.status == status
+    if status == 429:
+        assert response.getheader('Retry-After') == '1'
+
+
+def test_health_and_unknown_paths(server):
+    response, data = _request(server, 'GET', '/health')
+    assert response.status == 200
+    assert json.loads(data) == {'status': 'ok', 'workers': 1}
+    assert _request(server, 'GET', '/yok')[0].status == 404
+    assert _post_json(server, {'markdown': '# A'})[0].status == 200
+    assert _request(server, 'POST', '/yok', b'x', {'Content-Length': '1'})[0].status == 404
+
+
+def test_default_url_schemes_block_local_files(tmp_path):
+    secret = tmp_path / 'gizli.txt'
+    secret.write_text('gizli', encoding='utf-8')
+    converter = Converter(url_schemes=DEFAULT_URL_SCHEMES)
+    assert converter.allows_url('data:text/plain,a')
+    with pytest.raises(ValueError):
+        converter.fetch_raw(secret.as_uri())
+
+
+def test_timed_out_render_frees_its_queue_slot():
+    service = RenderService(workers=1, queue_size=0, timeout=0.01)
+    try:
+        service.warm_up()
+        long_document = '\n\n'.join(f'## Bölüm {n}\n\n' + 'Uzun bir cümle. ' * 80 for n in range(400))
+        with pytest.raises(FutureTimeoutError):
+            service.render(long_document)
+        
+        # İptal edilen iş worker'da bir sonraki aşamada veya sayfada durur ve yerini bırakır
+        service.timeout = 60
+        deadline = time.monotonic() + 60
+        while True:
+            try:
+                pdf = service.render('# Kısa')
+                break
+            except QueueFullError:
+                assert time.monotonic() < deadline, "zaman aşımındaki iş kuyruk yerini bırakmadı"
+                time.sleep(0.05)
+        assert pdf.startswith(b'%PDF')
+    finally:
+        service.shutdown()
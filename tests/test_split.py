@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""--split (bölümlere ayırıp paralel render) testleri"""
+
+import pytest
+
+from md_to_pdf import OutputOptimizer, _section_css, convert_split, split_html_sections
+
+
+def test_sections_start_at_top_level_headings():
+    html_content = (
+        '<p>Giriş</p>\n<h2>A</h2>\n<p>a</p>\n<h3>A.1</h3>\n<p>a1</p>\n'
+        '<h2 id="b">B</h2>\n<p>b</p>\n'
+    )
+    sections = split_html_sections(html_content)
+    # h1 olmadığında en üst seviye h2'dir; girişteki içerik ilk bölüme eklenir
+    assert len(sections) == 2
+    assert sections[0].startswith('<p>Giriş</p>') and '<h3>A.1</h3>' in sections[0]
+    assert sections[1].startswith('<h2 id="b">B</h2>')
+    assert ''.join(sections) == html_content
+
+
+def test_document_without_headings_is_one_section():
+    assert split_html_sections('<p>Tek paragraf</p>\n') == ['<p>Tek paragraf</p>\n']
+
+
+def test_section_css_continues_page_numbers():
+    css = '@page { @bottom-center { content: counter(page) " / " counter(pages); } }'
+    section_css = _section_css(css, offset=4, total_pages=10)
+    assert 'counter(pages)' not in section_css
+    assert '"10"' in section_css
+    assert 'counter-reset: page 5' in section_css
+
+
+@pytest.fixture
+def manual(tmp_path):
+    path = tmp_path / 'kilavuz.md'
+    path.write_text(
+        '\n\n'.join(f'# Bölüm {n}\n\n' + 'Metin. ' * 50 for n in range(1, 4)),
+        encoding='utf-8'
+    )
+    return path
+
+
+def test_sections_are_merged_into_one_pdf(manual, tmp_path):
+    pypdf = pytest.importorskip('pypdf')
+    output = convert_split(manual, tmp_path / 'kilavuz.pdf', workers=2)
+    
+    reader = pypdf.PdfReader(str(output))
+    assert len(reader.pages) >= 3
+    assert reader.metadata.title == 'kilavuz'
+
+
+def test_optimized_split_output_is_deduplicated(manual, tmp_path):
+    pypdf = pytest.importorskip('pypdf')
+    plain = convert_split(manual, tmp_path / 'plain.pdf', workers=2)
+    optimized = convert_split(
+        manual, tmp_path / 'optimized.pdf', {'output_optimizer': OutputOptimizer()}, workers=2
+    )
+    assert len(pypdf.PdfReader(str(optimized)).pages) == len(pypdf.PdfReader(str(plain)).pages)
+    # Her bölümün ayrı gömdüğü fontlar birleştirilir
+    assert optimized.stat().st_size <= plain.stat().st_size